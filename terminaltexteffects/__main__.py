@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import terminaltexteffects.effects
+from terminaltexteffects.engine.scheduler import BackgroundPrinter, FrameScheduler
 from terminaltexteffects.engine.terminal import Terminal, TerminalConfig
 from terminaltexteffects.utils.exceptions import UnsupportedAnsiSequenceError
 from terminaltexteffects.utils.shell_completion import SUPPORTED_SHELLS, get_completion_script
@@ -214,8 +215,14 @@ def main() -> None:
     effect = effect_class(input_data, effect_config, terminal_config)
     try:
         with effect.terminal_output() as terminal:
-            for frame in effect:
-                terminal.print(frame)
+            frames = FrameScheduler(iter(effect)) if terminal_config.frame_skip else effect
+            if terminal_config.threaded_output:
+                with BackgroundPrinter(terminal) as printer:
+                    for frame in frames:
+                        printer.print(frame)
+            else:
+                for frame in frames:
+                    terminal.print(frame)
     except UnsupportedAnsiSequenceError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -12,7 +12,15 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 
-from terminaltexteffects import Color, EffectCharacter, EventHandler, Gradient, ParticlePool, ParticleReset
+from terminaltexteffects import (
+    Color,
+    EffectCharacter,
+    EventHandler,
+    Gradient,
+    ParticlePool,
+    ParticleReset,
+    SceneTemplate,
+)
 from terminaltexteffects.engine.base_config import (
     BaseConfig,
     FinalGradientDirectionArg,
@@ -141,14 +149,20 @@ class BurnIterator(BaseEffectIterator[BurnConfig]):
         )
 
     def _make_smoke_pool(self) -> ParticlePool:
+        smoke_gradient = Gradient(Color("#504F4F"), Color("#C7C7C7"), steps=9)
+        smoke_templates: dict[str, SceneTemplate] = {}
+
         def initialize_smoke(new_char: EffectCharacter) -> None:
-            smoke_scn = new_char.animation.new_scene(scene_id="smoke")
-            for color in Gradient(Color("#504F4F"), Color("#C7C7C7"), steps=9):
-                smoke_scn.add_frame(
-                    new_char.input_symbol,
-                    10,
-                    colors=ColorPair(fg=color),
-                )
+            smoke_template = smoke_templates.get(new_char.input_symbol)
+            if smoke_template is None:
+                smoke_template = smoke_templates[new_char.input_symbol] = SceneTemplate("smoke")
+                for color in smoke_gradient:
+                    smoke_template.add_frame(
+                        new_char.input_symbol,
+                        10,
+                        colors=ColorPair(fg=color),
+                    )
+            new_char.animation.new_scene_from_template(smoke_template)
             new_char.layer = 2
 
         smoke_pool = ParticlePool(
@@ -220,6 +234,9 @@ class BurnIterator(BaseEffectIterator[BurnConfig]):
         for character in self.terminal.get_characters():
             self.character_final_color_map[character] = final_gradient_mapping[character.input_coord]
         fire_gradient = Gradient(*self.config.burn_colors, steps=10)
+        burn_template = SceneTemplate("burn")
+        burn_template.apply_gradient_to_symbols(burn_char_order, 4, fg_gradient=fire_gradient)
+        final_color_templates: dict[tuple[str, Color], SceneTemplate] = {}
 
         while not self.algo.complete:
             self.algo.step()
@@ -230,10 +247,9 @@ class BurnIterator(BaseEffectIterator[BurnConfig]):
                 char.input_symbol,
                 colors=ColorPair(fg=self.config.starting_color),
             )
-            burn_scn = char.animation.new_scene(scene_id="burn")
-            burn_scn.apply_gradient_to_symbols(burn_char_order, 4, fg_gradient=fire_gradient)
-            final_color_scn = char.animation.new_scene()
+            burn_scn = char.animation.new_scene_from_template(burn_template)
             if self.terminal.config.existing_color_handling == "dynamic":
+                final_color_scn = char.animation.new_scene()
                 fg_gradient = (
                     Gradient(fire_gradient.spectrum[-1], char.animation.input_fg_color, steps=8)
                     if char.animation.input_fg_color
@@ -254,8 +270,13 @@ class BurnIterator(BaseEffectIterator[BurnConfig]):
                 else:
                     final_color_scn.add_frame(char.input_symbol, 4, colors=ColorPair())
             else:
-                for color in Gradient(fire_gradient.spectrum[-1], self.character_final_color_map[char], steps=8):
-                    final_color_scn.add_frame(char.input_symbol, 4, colors=ColorPair(fg=color))
+                final_color_key = (char.input_symbol, self.character_final_color_map[char])
+                final_color_template = final_color_templates.get(final_color_key)
+                if final_color_template is None:
+                    final_color_template = final_color_templates[final_color_key] = SceneTemplate()
+                    for color in Gradient(fire_gradient.spectrum[-1], self.character_final_color_map[char], steps=8):
+                        final_color_template.add_frame(char.input_symbol, 4, colors=ColorPair(fg=color))
+                final_color_scn = char.animation.new_scene_from_template(final_color_template)
             char.event_handler.register_event(
                 EventHandler.Event.SCENE_COMPLETE,
                 burn_scn,
@@ -153,6 +153,9 @@ class SmokeIterator(BaseEffectIterator[SmokeConfig]):
             *self.config.final_gradient_stops[::-1],
             steps=(3, 4),
         )
+        smoke_template = tte.SceneTemplate("smoke")
+        smoke_template.apply_gradient_to_symbols(self.config.smoke_symbols, 3, fg_gradient=smoke_gradient)
+        paint_templates: dict[tuple[str, tte.Color], tte.SceneTemplate] = {}
         for character in self.terminal.get_characters(inner_fill_chars=True, outer_fill_chars=True):
             self.terminal.set_character_visibility(character=character, is_visible=True)
             if self.terminal.config.existing_color_handling == "dynamic":
@@ -170,25 +173,30 @@ class SmokeIterator(BaseEffectIterator[SmokeConfig]):
                 )
                 base_colors = tte.ColorPair(fg=self.config.starting_color)
             paint_chars = (character.input_symbol,)
-            paint_scn = character.animation.new_scene(scene_id="paint")
             if self.terminal.config.existing_color_handling == "dynamic":
+                paint_scn = character.animation.new_scene(scene_id="paint")
                 paint_scn.add_frame(character.input_symbol, 5, colors=self.character_final_color_map[character])
             else:
                 final_fg_color = self.character_final_color_map[character].fg_color
                 assert final_fg_color is not None
-                paint_gradient = tte.Gradient(
-                    *self.config.final_gradient_stops,
-                    final_fg_color,
-                    steps=5,
-                )
-                paint_scn.apply_gradient_to_symbols(paint_chars, duration=5, fg_gradient=paint_gradient)
+                paint_template = paint_templates.get((character.input_symbol, final_fg_color))
+                if paint_template is None:
+                    paint_gradient = tte.Gradient(
+                        *self.config.final_gradient_stops,
+                        final_fg_color,
+                        steps=5,
+                    )
+                    paint_template = tte.SceneTemplate("paint")
+                    paint_template.apply_gradient_to_symbols(paint_chars, duration=5, fg_gradient=paint_gradient)
+                    paint_templates[(character.input_symbol, final_fg_color)] = paint_template
+                paint_scn = character.animation.new_scene_from_template(paint_template)
 
-            smoke_scn = character.animation.new_scene(scene_id="smoke")
             if self.terminal.config.existing_color_handling == "dynamic":
+                smoke_scn = character.animation.new_scene(scene_id="smoke")
                 for smoke_symbol in self.config.smoke_symbols:
                     smoke_scn.add_frame(smoke_symbol, 10, colors=self.character_final_color_map[character])
             else:
-                smoke_scn.apply_gradient_to_symbols(self.config.smoke_symbols, 3, fg_gradient=smoke_gradient)
+                smoke_scn = character.animation.new_scene_from_template(smoke_template)
             character.event_handler.register_event(
                 event=tte.Event.SCENE_COMPLETE,
                 caller=smoke_scn,
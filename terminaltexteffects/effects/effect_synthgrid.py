@@ -422,9 +422,9 @@ class SynthGridIterator(BaseEffectIterator[SynthGridConfig]):
                     for column in range(prev_column_index, column_index):
                         coords_in_block.append(Coord(column, row))  # noqa: PERF401
                 characters_in_block: list[EffectCharacter] = [
-                    self.terminal.character_by_input_coord[coord]
-                    for coord in coords_in_block
-                    if coord in self.terminal.character_by_input_coord
+                    character
+                    for character in map(self.terminal.get_character_by_input_coord, coords_in_block)
+                    if character is not None
                 ]
                 if characters_in_block:
                     self.pending_groups.append((len(self.pending_groups), characters_in_block))
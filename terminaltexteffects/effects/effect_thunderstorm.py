@@ -265,6 +265,96 @@ class ThunderstormIterator(BaseEffectIterator[ThunderstormConfig]):
         """Return a raindrop character to the available pool."""
         self.rain_drops.append(character)
 
+    def _build_text_scene_templates(
+        self,
+        symbol: str,
+        visible_colors: tte.ColorPair,
+        storm_colors: tte.ColorPair,
+        restore_colors: tte.ColorPair,
+    ) -> tuple[tte.SceneTemplate, ...]:
+        """Build the glow, fade, unfade, and flash scene templates for text characters with the given colors."""
+        # post-strike glow and cool scene
+        glow_template = tte.SceneTemplate("glow")
+        glow_fg_gradient = tte.Gradient(
+            self.config.glowing_text_color,
+            typing.cast("tte.Color", storm_colors.fg_color),
+            steps=7,
+        )
+        for color in glow_fg_gradient:
+            glow_template.add_frame(
+                symbol=symbol,
+                colors=tte.ColorPair(fg=color, bg=storm_colors.bg_color),
+                duration=6,
+            )
+        if self.terminal.config.existing_color_handling == "dynamic":
+            glow_template.add_frame(symbol=symbol, colors=storm_colors, duration=6)
+
+        # fade before storm scene
+        fade_template = tte.SceneTemplate("fade")
+        if self.terminal.config.existing_color_handling == "dynamic":
+            self._add_color_pair_gradient_frames(
+                fade_template,
+                symbol,
+                visible_colors,
+                storm_colors,
+                steps=7,
+                duration=12,
+            )
+            fade_template.add_frame(symbol=symbol, colors=storm_colors, duration=12)
+        else:
+            fade_gradient = tte.Gradient(
+                typing.cast("tte.Color", visible_colors.fg_color),
+                typing.cast("tte.Color", storm_colors.fg_color),
+                steps=7,
+            )
+            for color in fade_gradient:
+                fade_template.add_frame(symbol=symbol, colors=tte.ColorPair(fg=color), duration=12)
+
+        unfade_template = tte.SceneTemplate("unfade")
+        if self.terminal.config.existing_color_handling == "dynamic":
+            self._add_color_pair_gradient_frames(
+                unfade_template,
+                symbol,
+                storm_colors,
+                visible_colors,
+                steps=7,
+                duration=12,
+            )
+            unfade_template.add_frame(symbol=symbol, colors=visible_colors, duration=12)
+            if restore_colors != visible_colors:
+                unfade_template.add_frame(symbol=symbol, colors=restore_colors, duration=12)
+        else:
+            unfade_gradient = list(
+                tte.Gradient(
+                    typing.cast("tte.Color", visible_colors.fg_color),
+                    typing.cast("tte.Color", storm_colors.fg_color),
+                    steps=7,
+                ),
+            )[::-1]
+            for color in unfade_gradient:
+                unfade_template.add_frame(symbol=symbol, colors=tte.ColorPair(fg=color), duration=12)
+
+        # lightning flash scene
+        lightning_flash_color = tte.Animation.adjust_color_brightness(
+            typing.cast("tte.Color", visible_colors.fg_color),
+            brightness=1.7,
+        )
+        strike_template = tte.SceneTemplate("flash")
+        flash_gradient = tte.Gradient(
+            typing.cast("tte.Color", storm_colors.fg_color),
+            lightning_flash_color,
+            steps=7,
+            loop=True,
+        )
+        for color in flash_gradient:
+            strike_template.add_frame(
+                symbol=symbol,
+                colors=tte.ColorPair(fg=color, bg=storm_colors.bg_color),
+                duration=6,
+            )
+
+        return glow_template, fade_template, unfade_template, strike_template
+
     def build(self) -> None:
         """Build the effect."""
         final_gradient = tte.Gradient(*self.config.final_gradient_stops, steps=self.config.final_gradient_steps)
@@ -279,7 +369,8 @@ class ThunderstormIterator(BaseEffectIterator[ThunderstormConfig]):
         self.build_spark_characters()
         self.build_strike_characters()
 
-        # setup scenes on text characters
+        # setup scenes on text characters, sharing scene templates between characters with the same symbol and colors
+        text_scene_templates: dict[tuple, tuple[tte.SceneTemplate, ...]] = {}
         all_chars = self.terminal.get_characters()
         for text_char in all_chars:
             if self.terminal.config.existing_color_handling == "dynamic":
@@ -305,85 +396,22 @@ class ThunderstormIterator(BaseEffectIterator[ThunderstormConfig]):
             self.character_storm_color_map[text_char] = storm_colors
             self.character_final_color_map[text_char] = restore_colors
 
-            # post-strike glow and cool scene
-            glow_scn = text_char.animation.new_scene(scene_id="glow")
-            glow_fg_gradient = tte.Gradient(
-                self.config.glowing_text_color,
-                typing.cast("tte.Color", storm_colors.fg_color),
-                steps=7,
+            templates_key = (
+                text_char.input_symbol,
+                visible_colors.fg_color,
+                visible_colors.bg_color,
+                restore_colors.fg_color,
+                restore_colors.bg_color,
             )
-            for color in glow_fg_gradient:
-                glow_scn.add_frame(
-                    symbol=text_char.input_symbol,
-                    colors=tte.ColorPair(fg=color, bg=storm_colors.bg_color),
-                    duration=6,
-                )
-            if self.terminal.config.existing_color_handling == "dynamic":
-                glow_scn.add_frame(symbol=text_char.input_symbol, colors=storm_colors, duration=6)
-
-            # fade before storm scene
-            fade_scn = text_char.animation.new_scene(scene_id="fade")
-            if self.terminal.config.existing_color_handling == "dynamic":
-                self._add_color_pair_gradient_frames(
-                    fade_scn,
+            if templates_key not in text_scene_templates:
+                text_scene_templates[templates_key] = self._build_text_scene_templates(
                     text_char.input_symbol,
                     visible_colors,
                     storm_colors,
-                    steps=7,
-                    duration=12,
-                )
-                fade_scn.add_frame(symbol=text_char.input_symbol, colors=storm_colors, duration=12)
-            else:
-                fade_gradient = tte.Gradient(
-                    typing.cast("tte.Color", visible_colors.fg_color),
-                    typing.cast("tte.Color", storm_colors.fg_color),
-                    steps=7,
-                )
-                for color in fade_gradient:
-                    fade_scn.add_frame(symbol=text_char.input_symbol, colors=tte.ColorPair(fg=color), duration=12)
-
-            unfade_scn = text_char.animation.new_scene(scene_id="unfade")
-            if self.terminal.config.existing_color_handling == "dynamic":
-                self._add_color_pair_gradient_frames(
-                    unfade_scn,
-                    text_char.input_symbol,
-                    storm_colors,
-                    visible_colors,
-                    steps=7,
-                    duration=12,
-                )
-                unfade_scn.add_frame(symbol=text_char.input_symbol, colors=visible_colors, duration=12)
-                if restore_colors != visible_colors:
-                    unfade_scn.add_frame(symbol=text_char.input_symbol, colors=restore_colors, duration=12)
-            else:
-                unfade_gradient = list(
-                    tte.Gradient(
-                        typing.cast("tte.Color", visible_colors.fg_color),
-                        typing.cast("tte.Color", storm_colors.fg_color),
-                        steps=7,
-                    ),
-                )[::-1]
-                for color in unfade_gradient:
-                    unfade_scn.add_frame(symbol=text_char.input_symbol, colors=tte.ColorPair(fg=color), duration=12)
-
-            # lightning flash scene
-            lightning_flash_color = tte.Animation.adjust_color_brightness(
-                typing.cast("tte.Color", visible_colors.fg_color),
-                brightness=1.7,
-            )
-            strike_scn = text_char.animation.new_scene(scene_id="flash")
-            flash_gradient = tte.Gradient(
-                typing.cast("tte.Color", storm_colors.fg_color),
-                lightning_flash_color,
-                steps=7,
-                loop=True,
-            )
-            for color in flash_gradient:
-                strike_scn.add_frame(
-                    symbol=text_char.input_symbol,
-                    colors=tte.ColorPair(fg=color, bg=storm_colors.bg_color),
-                    duration=6,
+                    restore_colors,
                 )
+            for template in text_scene_templates[templates_key]:
+                text_char.animation.new_scene_from_template(template)
 
             self.terminal.set_character_visibility(text_char, is_visible=True)
 
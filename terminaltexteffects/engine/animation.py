@@ -4,16 +4,20 @@ Classes:
     CharacterVisual: A class for storing symbol, color, and terminal graphical modes for the character.
     Frame: A class representing a frame in an animation.
     Scene: A class representing a sequence of frames that can be played in an animation.
+    SceneTemplate: A Scene definition whose frames are shared by the Scenes created from it.
     Animation: A class for handling animations for an EffectCharacter.
 
 """
 
 from __future__ import annotations
 
+import itertools
+import sys
 import typing
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 
+from terminaltexteffects.engine.scheduler import CharacterScheduler
 from terminaltexteffects.utils import ansitools, colorterm, easing, graphics, hexterm
 from terminaltexteffects.utils.exceptions import (
     ActivateEmptySceneError,
@@ -24,12 +28,16 @@ from terminaltexteffects.utils.exceptions import (
 
 if typing.TYPE_CHECKING:
     from terminaltexteffects.engine import base_character, motion  # pragma: no cover
+    from terminaltexteffects.engine.renderer import SgrState  # pragma: no cover
 
 
-@dataclass
+@dataclass(frozen=True)
 class CharacterVisual:
     """A class for storing symbol, color, and terminal graphical modes for the character.
 
+    CharacterVisuals are immutable. Visuals created by the engine are obtained from `CharacterVisual.interned()`,
+    which returns one shared instance for each distinct combination of symbol, modes, colors, and color codes.
+
     Args:
         symbol (str): The unformatted symbol.
         bold (bool): Bold mode.
@@ -45,9 +53,15 @@ class CharacterVisual:
         _bg_color_code (str | int | None): The symbol's background color code.
 
     Attributes:
+        style_id (int): Process-wide unique ID of the visual. Interned visuals are shared, so every use of an
+            interned style has the same ID.
         formatted_symbol (str): The current symbol with all ANSI sequences applied.
+        sgr_state (SgrState): The SGR parameters applied by `formatted_symbol` as (sorted mode parameters,
+            foreground color parameters, background color parameters). Used by the frame encoder to share SGR
+            sequences between adjacent cells with the same formatting. Both are built on first use.
 
     Methods:
+        interned: Returns the shared visual for the given symbol, modes, colors, and color codes.
         format_symbol: Formats the symbol for printing by applying ANSI sequences for supported active modes and color.
 
     """
@@ -66,44 +80,156 @@ class CharacterVisual:
     # config args these are used by colorterm to produce the ansi sequences
     _fg_color_code: str | int | None = None
     _bg_color_code: str | int | None = None
+    style_id: int = field(init=False, repr=False, compare=False)
+    _sgr_state: SgrState | None = field(init=False, repr=False, compare=False)
+    _formatted_symbol: str | None = field(init=False, repr=False, compare=False)
+
+    _interned: typing.ClassVar[dict[tuple, CharacterVisual]] = {}
+    _interned_max_size: typing.ClassVar[int] = 65536
+    _style_ids: typing.ClassVar[typing.Iterator[int]] = itertools.count()
 
     def __post_init__(self) -> None:
-        """Create the formatted symbol by applying ANSI sequences for any active modes and color."""
-        self.formatted_symbol = self.format_symbol()
+        """Assign the style ID and initialize the caches for the SGR state and formatted symbol."""
+        object.__setattr__(self, "style_id", next(CharacterVisual._style_ids))
+        object.__setattr__(self, "_sgr_state", None)
+        object.__setattr__(self, "_formatted_symbol", None)
+
+    @classmethod
+    def interned(
+        cls,
+        symbol: str,
+        *,
+        bold: bool = False,
+        dim: bool = False,
+        italic: bool = False,
+        underline: bool = False,
+        blink: bool = False,
+        reverse: bool = False,
+        hidden: bool = False,
+        strike: bool = False,
+        colors: graphics.ColorPair | None = None,
+        fg_color_code: str | int | None = None,
+        bg_color_code: str | int | None = None,
+    ) -> CharacterVisual:
+        """Return the shared visual for the given symbol, modes, colors, and color codes.
 
-    def format_symbol(self) -> str:
-        """Format the symbol for printing by applying ANSI sequences for supported active modes and color.
+        Visuals are interned in a process-wide table, so scenes and characters using the same style share a single
+        instance and its formatted output. Once the table holds `_interned_max_size` styles, further styles are
+        created without being interned.
+
+        Args:
+            symbol (str): The unformatted symbol.
+            bold (bool, optional): Bold mode. Defaults to False.
+            dim (bool, optional): Dim mode. Defaults to False.
+            italic (bool, optional): Italic mode. Defaults to False.
+            underline (bool, optional): Underline mode. Defaults to False.
+            blink (bool, optional): Blink mode. Defaults to False.
+            reverse (bool, optional): Reverse mode. Defaults to False.
+            hidden (bool, optional): Hidden mode. Defaults to False.
+            strike (bool, optional): Strike mode. Defaults to False.
+            colors (graphics.ColorPair | None, optional): The symbol's colors. Defaults to None.
+            fg_color_code (str | int | None, optional): The symbol's foreground color code. Defaults to None.
+            bg_color_code (str | int | None, optional): The symbol's background color code. Defaults to None.
+
+        Returns:
+            CharacterVisual: The shared visual.
 
-        The `dim` attribute is stored on the visual but is not currently emitted as an ANSI sequence.
         """
-        formatting_string = ""
+        key = (
+            symbol,
+            bold,
+            dim,
+            italic,
+            underline,
+            blink,
+            reverse,
+            hidden,
+            strike,
+            colors is None,
+            colors.fg_color if colors else None,
+            colors.bg_color if colors else None,
+            fg_color_code,
+            bg_color_code,
+        )
+        visual = cls._interned.get(key)
+        if visual is None:
+            visual = cls(
+                symbol,
+                bold=bold,
+                dim=dim,
+                italic=italic,
+                underline=underline,
+                blink=blink,
+                reverse=reverse,
+                hidden=hidden,
+                strike=strike,
+                colors=colors,
+                _fg_color_code=fg_color_code,
+                _bg_color_code=bg_color_code,
+            )
+            if len(cls._interned) < cls._interned_max_size:
+                cls._interned[key] = visual
+        return visual
+
+    @property
+    def sgr_state(self) -> SgrState:
+        """The SGR parameters applied to the symbol as (sorted modes, foreground color, background color)."""
+        if self._sgr_state is None:
+            object.__setattr__(self, "_sgr_state", self._build_sgr_state())
+        return self._sgr_state  # pyright: ignore[reportReturnType]
+
+    @property
+    def formatted_symbol(self) -> str:
+        """The current symbol with all ANSI sequences applied."""
+        if self._formatted_symbol is None:
+            object.__setattr__(self, "_formatted_symbol", self.format_symbol())
+        return self._formatted_symbol  # pyright: ignore[reportReturnType]
+
+    def _build_sgr_state(self) -> SgrState:
+        """Build the SGR parameters for the supported active modes and colors.
+
+        The `dim` attribute is stored on the visual but is not currently emitted as an SGR parameter.
+
+        Returns:
+            SgrState: (sorted mode parameters, foreground color parameters, background color parameters).
+
+        """
+        modes: list[str] = []
         if self.bold:
-            formatting_string += ansitools.apply_bold()
+            modes.append("1")
         # Future: review the dim ANSI sequence and decide whether CharacterVisual should emit it.
         if self.italic:
-            formatting_string += ansitools.apply_italic()
+            modes.append("3")
         if self.underline:
-            formatting_string += ansitools.apply_underline()
+            modes.append("4")
         if self.blink:
-            formatting_string += ansitools.apply_blink()
+            modes.append("5")
         if self.reverse:
-            formatting_string += ansitools.apply_reverse()
+            modes.append("7")
         if self.hidden:
-            formatting_string += ansitools.apply_hidden()
+            modes.append("8")
         if self.strike:
-            formatting_string += ansitools.apply_strikethrough()
-        if self._fg_color_code is not None:
-            formatting_string += colorterm.fg(self._fg_color_code)
-        if self._bg_color_code is not None:
-            formatting_string += colorterm.bg(self._bg_color_code)
+            modes.append("9")
+        fg = colorterm.fg_parameters(self._fg_color_code) if self._fg_color_code is not None else None
+        bg = colorterm.bg_parameters(self._bg_color_code) if self._bg_color_code is not None else None
+        return tuple(modes), fg, bg
 
+    def format_symbol(self) -> str:
+        """Format the symbol for printing by applying ANSI sequences for supported active modes and color.
+
+        Each parameter in `sgr_state` is applied as its own SGR sequence, followed by the symbol and a reset.
+        """
+        modes, fg, bg = self.sgr_state
+        formatting_string = "".join(f"\x1b[{parameter}m" for parameter in (*modes, fg, bg) if parameter is not None)
         return f"{formatting_string}{self.symbol}{ansitools.reset_all() if formatting_string else ''}"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Frame:
     """A Frame is a CharacterVisual with a duration.
 
+    Frames are immutable. Playback progress is tracked by the Scene.
+
     Args:
         character_visual (CharacterVisual): a CharacterVisual object
         duration (int): the number of ticks to display the Frame
@@ -111,17 +237,12 @@ class Frame:
     Attributes:
         character_visual (CharacterVisual): the CharacterVisual object for the Frame
         duration (int): the number of ticks to display the Frame
-        ticks_elapsed (int): the number of ticks that have elapsed displaying this frame
 
     """
 
     character_visual: CharacterVisual
     duration: int
 
-    def __post_init__(self) -> None:
-        """Initialize the ticks_elapsed attribute to 0."""
-        self.ticks_elapsed = 0
-
 
 class Scene:
     """A Scene is a collection of Frames that can be played in sequence. Scenes can be looped and synced to movement.
@@ -140,8 +261,9 @@ class Scene:
         ease (easing.EasingFunction | None): The easing function to use for the Scene
         no_color (bool): Whether to ignore colors
         use_xterm_colors (bool): Whether to convert all colors to XTerm-256 colors
-        frames (list[Frame]): The list of Frames in the Scene
-        played_frames (list[Frame]): The list of Frames that have been played
+        frames (list[Frame]): The Frames that have not been played, starting with the current Frame
+        played_frames (list[Frame]): The Frames that have been played
+        ticks_elapsed (int): The number of ticks the current Frame has been displayed
         frame_index_map (dict[int, Frame]): A mapping of frame index to Frame
         easing_total_steps (int): The total number of steps in the easing function
         easing_current_step (int): The current step in the easing function
@@ -150,8 +272,6 @@ class Scene:
 
     """
 
-    xterm_color_map: typing.ClassVar[dict[str, int]] = {}
-
     class SyncMetric(Enum):
         """Enum for specifying how a Scene synchronizes to motion progress.
 
@@ -191,13 +311,29 @@ class Scene:
         self.ease: easing.EasingFunction | None = ease
         self.no_color = no_color
         self.use_xterm_colors = use_xterm_colors
-        self.frames: list[Frame] = []
-        self.played_frames: list[Frame] = []
+        # frames are only appended while building the scene, playback moves the cursor
+        self._frames: list[Frame] = []
+        self._frame_index = 0
+        self.ticks_elapsed = 0
+        # set while the frames are shared with a SceneTemplate, they are copied before being modified
+        self._shares_frames = False
         self.frame_index_map: dict[int, Frame] = {}
         self.easing_total_steps: int = 0
         self.easing_current_step: int = 0
         self.preexisting_colors: graphics.ColorPair | None = None
         self.preexisting_bold: bool = False
+        # set when a frame is shown for long enough that a character may be parked by the CharacterScheduler
+        self._has_idle_frames = False
+
+    @property
+    def frames(self) -> list[Frame]:
+        """list[Frame]: The Frames that have not been played, starting with the current Frame."""
+        return self._frames[self._frame_index :]
+
+    @property
+    def played_frames(self) -> list[Frame]:
+        """list[Frame]: The Frames that have been played."""
+        return self._frames[: self._frame_index]
 
     def _get_color_code(self, color: graphics.Color | None) -> str | int | None:
         """Get the color code for the given color.
@@ -218,11 +354,7 @@ class Scene:
             if self.use_xterm_colors:
                 if color.xterm_color is not None:
                     return color.xterm_color
-                if color.rgb_color in self.xterm_color_map:
-                    return self.xterm_color_map[color.rgb_color]
-                xterm_color = hexterm.hex_to_xterm(color.rgb_color)
-                self.xterm_color_map[color.rgb_color] = xterm_color
-                return xterm_color
+                return hexterm.hex_to_xterm(color.rgb_color)
             return color.rgb_color
         return None
 
@@ -279,7 +411,7 @@ class Scene:
 
         if duration < 1:
             raise FrameDurationError(duration)
-        char_vis = CharacterVisual(
+        char_vis = CharacterVisual.interned(
             symbol,
             bold=bold,
             dim=dim,
@@ -290,11 +422,17 @@ class Scene:
             hidden=hidden,
             strike=strike,
             colors=colors,
-            _fg_color_code=char_vis_fg_color,
-            _bg_color_code=char_vis_bg_color,
+            fg_color_code=char_vis_fg_color,
+            bg_color_code=char_vis_bg_color,
         )
         frame = Frame(char_vis, duration)
-        self.frames.append(frame)
+        if self._shares_frames:
+            self._frames = self._frames.copy()
+            self.frame_index_map = self.frame_index_map.copy()
+            self._shares_frames = False
+        self._frames.append(frame)
+        if duration > CharacterScheduler.min_idle_ticks + 1:
+            self._has_idle_frames = True
         for _ in range(frame.duration):
             self.frame_index_map[self.easing_total_steps] = frame
             self.easing_total_steps += 1
@@ -311,33 +449,30 @@ class Scene:
             CharacterVisual: the first frame's visual.
 
         """
-        if self.frames:
-            return self.frames[0].character_visual
+        if self._frame_index < len(self._frames):
+            return self._frames[self._frame_index].character_visual
         raise ActivateEmptySceneError(self)
 
     def get_next_visual(self) -> CharacterVisual:
         """Get the next CharacterVisual in the Scene.
 
-        Retrieve the current frame from `frames`, then increment the frame's `ticks_elapsed`.
-        If `ticks_elapsed` reaches the frame duration, reset that frame's `ticks_elapsed` to `0`
-        and move it from `frames` to `played_frames`. If the Scene is looping and all frames
-        have been played, restore `frames` from `played_frames` so the next loop begins from
-        the start of each frame again. Return the current frame's `CharacterVisual`.
+        Retrieve the current frame, then increment `ticks_elapsed`. If `ticks_elapsed` reaches
+        the frame duration, reset `ticks_elapsed` to `0` and advance to the next frame. If the
+        Scene is looping and all frames have been played, playback restarts from the first
+        frame. Return the current frame's `CharacterVisual`.
 
         Returns:
             CharacterVisual: The visual of the current frame in the Scene.
 
         """
-        current_frame = self.frames[0]
-        next_visual = current_frame.character_visual
-        current_frame.ticks_elapsed += 1
-        if current_frame.ticks_elapsed == current_frame.duration:
-            current_frame.ticks_elapsed = 0
-            self.played_frames.append(self.frames.pop(0))
-            if self.is_looping and not self.frames:
-                self.frames.extend(self.played_frames)
-                self.played_frames.clear()
-        return next_visual
+        current_frame = self._frames[self._frame_index]
+        self.ticks_elapsed += 1
+        if self.ticks_elapsed == current_frame.duration:
+            self.ticks_elapsed = 0
+            self._frame_index += 1
+            if self.is_looping and self._frame_index == len(self._frames):
+                self._frame_index = 0
+        return current_frame.character_visual
 
     def apply_gradient_to_symbols(
         self,
@@ -446,16 +581,11 @@ class Scene:
     def reset_scene(self) -> None:
         """Reset the Scene to its initial playback state.
 
-        All remaining frames are moved back into the full frame sequence, each frame's
-        `ticks_elapsed` is reset to `0`, `played_frames` is cleared, and
-        `easing_current_step` is reset to `0`.
+        Playback returns to the first frame, `ticks_elapsed` is reset to `0`, `played_frames`
+        is cleared, and `easing_current_step` is reset to `0`.
         """
-        for sequence in self.frames:
-            sequence.ticks_elapsed = 0
-            self.played_frames.append(sequence)
-        self.frames.clear()
-        self.frames.extend(self.played_frames)
-        self.played_frames.clear()
+        self._frame_index = 0
+        self.ticks_elapsed = 0
         self.easing_current_step = 0
 
     def __eq__(self, other: object) -> bool:
@@ -468,6 +598,113 @@ class Scene:
         """Return the hash value of the Scene based on its scene_id."""
         return hash(self.scene_id)
 
+    def _share_frames(self, source: Scene) -> None:
+        """Play the frames of the source Scene without copying them.
+
+        The frames are copied by whichever Scene is the first to add a frame afterwards.
+
+        Args:
+            source (Scene): The Scene whose frames are shared.
+
+        """
+        self._frames = source._frames
+        self.frame_index_map = source.frame_index_map
+        self.easing_total_steps = source.easing_total_steps
+        self._has_idle_frames = source._has_idle_frames
+        self._shares_frames = source._shares_frames = True
+
+
+class SceneTemplate(Scene):
+    """A Scene definition whose frames are shared by the Scenes created from it.
+
+    Frames are added to a SceneTemplate with the Scene methods, once per effect rather than once per character.
+    `Animation.new_scene_from_template()` creates a Scene for a character that plays the template's frames and only
+    holds its own playback state. Frame colors depend on the color settings of each character's Animation, so a
+    variant of the frames is built, and shared, for each distinct combination of color settings and preexisting
+    input colors. The template itself is not meant to be activated.
+
+    Methods:
+        variant: Returns a Scene holding the template's frames built with the given color settings.
+
+    """
+
+    def __init__(
+        self,
+        scene_id: str = "",
+        *,
+        is_looping: bool = False,
+        sync: Scene.SyncMetric | None = None,
+        ease: easing.EasingFunction | None = None,
+    ) -> None:
+        """Initialize a SceneTemplate.
+
+        Args:
+            scene_id (str, optional): The default ID of Scenes created from the template. If empty, the Animation
+                generates a unique ID. Defaults to "".
+            is_looping (bool, optional): Whether the Scene should loop. Defaults to False.
+            sync (Scene.SyncMetric | None, optional): The type of sync to use for the Scene. Defaults to None.
+            ease (easing.EasingFunction | None, optional): The easing function to use for the Scene. Defaults to None.
+
+        """
+        super().__init__(scene_id, is_looping=is_looping, sync=sync, ease=ease)
+        self._variants: dict[tuple, Scene] = {}
+
+    def variant(
+        self,
+        *,
+        no_color: bool = False,
+        use_xterm_colors: bool = False,
+        preexisting_colors: graphics.ColorPair | None = None,
+        preexisting_bold: bool = False,
+    ) -> Scene:
+        """Return a Scene holding the template's frames built with the given color settings.
+
+        Variants are cached and rebuilt when frames have been added to the template since they were built.
+
+        Args:
+            no_color (bool, optional): Whether colors should be ignored. Defaults to False.
+            use_xterm_colors (bool, optional): Whether to convert all colors to XTerm-256 colors. Defaults to False.
+            preexisting_colors (graphics.ColorPair | None, optional): Colors overriding the colors of every frame.
+                Defaults to None.
+            preexisting_bold (bool, optional): Whether every frame is bold. Defaults to False.
+
+        Returns:
+            Scene: The Scene holding the frames of the variant.
+
+        """
+        if not no_color and not use_xterm_colors and preexisting_colors is None and not preexisting_bold:
+            return self
+        key = (
+            no_color,
+            use_xterm_colors,
+            preexisting_colors is None,
+            preexisting_colors.fg_color if preexisting_colors else None,
+            preexisting_colors.bg_color if preexisting_colors else None,
+            preexisting_bold,
+        )
+        variant = self._variants.get(key)
+        if variant is None or len(variant._frames) != len(self._frames):
+            variant = Scene(self.scene_id, no_color=no_color, use_xterm_colors=use_xterm_colors)
+            variant.preexisting_colors = preexisting_colors
+            variant.preexisting_bold = preexisting_bold
+            for frame in self._frames:
+                visual = frame.character_visual
+                variant.add_frame(
+                    visual.symbol,
+                    frame.duration,
+                    colors=visual.colors,
+                    bold=visual.bold,
+                    dim=visual.dim,
+                    italic=visual.italic,
+                    underline=visual.underline,
+                    blink=visual.blink,
+                    reverse=visual.reverse,
+                    hidden=visual.hidden,
+                    strike=visual.strike,
+                )
+            self._variants[key] = variant
+        return variant
+
 
 class Animation:
     """Animation handler for an EffectCharacter.
@@ -486,13 +723,13 @@ class Animation:
         input_fg_color (graphics.Color | None): the input foreground Color
         input_bg_color (graphics.Color | None): the input background Color
         input_bold (bool): whether the input character was parsed with active bold SGR styling
-        xterm_color_map (dict[str, int]): a mapping of RGB color codes to XTerm-256 color codes
         active_scene_current_step (int): Reserved for scene-step tracking; currently reset on activation but
             otherwise unused.
         current_character_visual (CharacterVisual): the current visual of the character
 
     Methods:
         new_scene: Creates a new Scene and adds it to the Animation.
+        new_scene_from_template: Creates a new Scene playing the frames of a SceneTemplate.
         query_scene: Returns a Scene from the Animation.
         active_scene_is_complete: Returns whether the active scene is complete.
         set_appearance: Applies a symbol and color to the character.
@@ -516,13 +753,36 @@ class Animation:
         self.use_xterm_colors: bool = False
         self.no_color: bool = False
         self.existing_color_handling: typing.Literal["always", "dynamic", "ignore"] = "ignore"
+        if character._terminal_config is not None:
+            self.use_xterm_colors = character._terminal_config.xterm_colors
+            self.no_color = character._terminal_config.no_color
+            self.existing_color_handling = character._terminal_config.existing_color_handling
         self.input_fg_color: graphics.Color | None = None
         self.input_bg_color: graphics.Color | None = None
         self.input_bold: bool = False
-        self.xterm_color_map: dict[str, int] = {}
         # Future: review whether `active_scene_current_step` should be removed or implemented for real scene tracking.
         self.active_scene_current_step: int = 0
-        self.current_character_visual: CharacterVisual = CharacterVisual(character.input_symbol)
+        self._current_character_visual: CharacterVisual = CharacterVisual.interned(character.input_symbol)
+
+    @property
+    def current_character_visual(self) -> CharacterVisual:
+        """The current visual of the character."""
+        return self._current_character_visual
+
+    @current_character_visual.setter
+    def current_character_visual(self, visual: CharacterVisual) -> None:
+        if visual is self._current_character_visual:
+            return
+        character = self.character
+        if character._scheduler is not None:
+            character._scheduler.wake(character)
+        # characters showing only short frames never idle for long enough to be parked, skip checking them
+        if self.active_scene is None or self.active_scene._has_idle_frames:
+            character._idle_checks = 2
+        self._current_character_visual = visual
+        frame_buffer = character._frame_buffer
+        if frame_buffer is not None:
+            frame_buffer.update_visual(self.character)
 
     def _get_color_code(self, color: graphics.Color | None) -> str | int | None:
         """Get the color code for the given color.
@@ -543,11 +803,7 @@ class Animation:
             if self.use_xterm_colors:
                 if color.xterm_color is not None:
                     return color.xterm_color
-                if color.rgb_color in self.xterm_color_map:
-                    return self.xterm_color_map[color.rgb_color]
-                xterm_color = hexterm.hex_to_xterm(color.rgb_color)
-                self.xterm_color_map[color.rgb_color] = xterm_color
-                return xterm_color
+                return hexterm.hex_to_xterm(color.rgb_color)
             return color.rgb_color
         return None
 
@@ -605,6 +861,37 @@ class Animation:
         self.scenes[scene_id] = new_scene
         return new_scene
 
+    def new_scene_from_template(self, template: SceneTemplate, *, scene_id: str = "") -> Scene:
+        """Create a new Scene that plays the frames of a SceneTemplate and add it to the Animation.
+
+        The Scene shares the frames of the template variant matching the animation's color settings and input colors,
+        and only holds its own playback state. Frames added to the Scene afterwards are not added to the template.
+
+        Args:
+            template (SceneTemplate): The template to play.
+            scene_id (str, optional): Name for the scene. Defaults to the template's `scene_id`. If both are empty, a
+                unique ID is generated.
+
+        Returns:
+            Scene: The new Scene.
+
+        """
+        new_scene = self.new_scene(
+            is_looping=template.is_looping,
+            sync=template.sync,
+            ease=template.ease,
+            scene_id=scene_id or template.scene_id,
+        )
+        new_scene._share_frames(
+            template.variant(
+                no_color=self.no_color,
+                use_xterm_colors=self.use_xterm_colors,
+                preexisting_colors=new_scene.preexisting_colors,
+                preexisting_bold=new_scene.preexisting_bold,
+            ),
+        )
+        return new_scene
+
     @typing.overload
     def query_scene(self, scene_id: str) -> Scene: ...
     @typing.overload
@@ -643,7 +930,8 @@ class Animation:
             bool: True if the active scene is complete, False otherwise.
 
         """
-        return bool(not self.active_scene or not self.active_scene.frames or self.active_scene.is_looping)
+        scene = self.active_scene
+        return bool(not scene or scene._frame_index == len(scene._frames) or scene.is_looping)
 
     def set_appearance(self, symbol: str | None = None, colors: graphics.ColorPair | None = None) -> None:
         """Update the current character visual with the symbol and colors provided.
@@ -675,12 +963,12 @@ class Animation:
         char_vis_fg_color: str | int | None = self._get_color_code(colors.fg_color)
         char_vis_bg_color: str | int | None = self._get_color_code(colors.bg_color)
 
-        self.current_character_visual = CharacterVisual(
+        self.current_character_visual = CharacterVisual.interned(
             symbol,
             bold=bold,
             colors=colors,
-            _fg_color_code=char_vis_fg_color,
-            _bg_color_code=char_vis_bg_color,
+            fg_color_code=char_vis_fg_color,
+            bg_color_code=char_vis_bg_color,
         )
 
     @staticmethod
@@ -789,6 +1077,47 @@ class Animation:
         elapsed_step_ratio = self.active_scene.easing_current_step / self.active_scene.easing_total_steps
         return easing_func(elapsed_step_ratio)
 
+    def _idle_ticks(self) -> int:
+        """Return the number of upcoming animation steps that will not change the character or trigger any events.
+
+        Steps are idle while the current frame of an unsynced, uneased scene is already displayed and its duration
+        has not run out, and indefinitely when there is no active scene. Looping scenes trigger SCENE_COMPLETE on
+        every step, so their steps are only idle when no actions are registered for that event.
+
+        Returns:
+            int: Number of idle steps.
+
+        """
+        scene = self.active_scene
+        if scene is None:
+            return sys.maxsize
+        if scene._frame_index == len(scene._frames) or scene.sync or scene.ease:
+            return 0
+        frame = scene._frames[scene._frame_index]
+        if frame.character_visual is not self._current_character_visual:
+            return 0
+        idle_ticks = frame.duration - scene.ticks_elapsed - 1
+        if idle_ticks <= 0:
+            return 0
+        event_handler = self.character._event_handler
+        if (
+            scene.is_looping
+            and event_handler is not None
+            and event_handler.registered_events.get((event_handler.Event.SCENE_COMPLETE, scene))
+        ):
+            return 0
+        return idle_ticks
+
+    def _skip_idle_ticks(self, ticks: int) -> None:
+        """Apply the effect of the given number of idle animation steps.
+
+        Args:
+            ticks (int): Number of idle steps, no more than the value returned by `_idle_ticks()`.
+
+        """
+        if self.active_scene is not None:
+            self.active_scene.ticks_elapsed += ticks
+
     def step_animation(self) -> None:
         """Progress the Scene and apply the next visual to the character.
 
@@ -802,7 +1131,7 @@ class Animation:
               event is triggered.
         """
         scene = self.active_scene
-        if scene is None or not scene.frames:
+        if scene is None or scene._frame_index == len(scene._frames):
             return
 
         if scene.sync:
@@ -818,17 +1147,16 @@ class Animation:
         """Apply the frame that matches the active motion path's progress."""
         active_path = self.character.motion.active_path
         if active_path is None:
-            self.current_character_visual = scene.frames[-1].character_visual
-            scene.played_frames.extend(scene.frames)
-            scene.frames.clear()
+            self.current_character_visual = scene._frames[-1].character_visual
+            scene._frame_index = len(scene._frames)
             return
 
         frame_index = self._synced_scene_frame_index(scene, active_path)
-        self.current_character_visual = scene.frames[frame_index].character_visual
+        self.current_character_visual = scene._frames[scene._frame_index + frame_index].character_visual
 
     def _synced_scene_frame_index(self, scene: Scene, active_path: motion.Path) -> int:
-        """Return the scene frame index for the active path's progress."""
-        final_frame_index = len(scene.frames) - 1
+        """Return the index of the frame, among the scene's remaining frames, for the active path's progress."""
+        final_frame_index = len(scene._frames) - scene._frame_index - 1
         if scene.sync == Scene.SyncMetric.STEP:
             progress_ratio = max(active_path.current_step, 1) / max(active_path.max_steps, 1)
         else:
@@ -854,8 +1182,7 @@ class Animation:
             if scene.is_looping:
                 scene.easing_current_step = 0
             else:
-                scene.played_frames.extend(scene.frames)
-                scene.frames.clear()
+                scene._frame_index = len(scene._frames)
 
     def _complete_scene_if_finished(self, scene: Scene) -> None:
         """Reset completed scenes and trigger completion events."""
@@ -865,6 +1192,7 @@ class Animation:
         if not scene.is_looping:
             scene.reset_scene()
             self.active_scene = None
+            self.character._idle_checks = 2
 
         self.character.event_handler._handle_event(
             self.character.event_handler.Event.SCENE_COMPLETE,
@@ -891,6 +1219,9 @@ class Animation:
                 a known scene.
 
         """
+        if self.character._scheduler is not None:
+            self.character._scheduler.wake(self.character)
+        self.character._idle_checks = 2
         if isinstance(scene, str):
             found_scene = self.query_scene(scene)
             if found_scene is None:
@@ -922,6 +1253,9 @@ class Animation:
             SceneNotFoundError: If `scene` is a string and no scene with that ID exists.
 
         """
+        if self.character._scheduler is not None:
+            self.character._scheduler.wake(self.character)
+        self.character._idle_checks = 2
         if scene is None:
             self.active_scene = None
             return
@@ -7,9 +7,11 @@ Classes:
 
 from __future__ import annotations
 
+import sys
 import typing
 from dataclasses import dataclass
 from enum import Enum, auto
+from types import MappingProxyType
 
 from terminaltexteffects.engine import animation, motion
 from terminaltexteffects.utils.exceptions import (
@@ -21,6 +23,14 @@ from terminaltexteffects.utils.exceptions import (
 )
 from terminaltexteffects.utils.geometry import Coord
 
+if typing.TYPE_CHECKING:
+    from terminaltexteffects.engine.renderer import FrameBuffer
+    from terminaltexteffects.engine.scheduler import CharacterScheduler
+    from terminaltexteffects.engine.terminal import TerminalConfig
+
+# shared by all characters without input ANSI sequences, replaced by the Terminal when a sequence is parsed
+_NO_INPUT_ANSI_SEQUENCES: typing.Mapping[str, str | None] = MappingProxyType({"fg_color": None, "bg_color": None})
+
 
 class EventHandler:
     """Register and handle events related to a character.
@@ -144,6 +154,38 @@ class EventHandler:
             self.callback = callback
             self.args = args
 
+    _event_caller_types: typing.ClassVar[dict[Event, type]] = {
+        Event.SEGMENT_ENTERED: motion.Waypoint,
+        Event.SEGMENT_EXITED: motion.Waypoint,
+        Event.PATH_ACTIVATED: motion.Path,
+        Event.PATH_COMPLETE: motion.Path,
+        Event.PATH_HOLDING: motion.Path,
+        Event.SCENE_ACTIVATED: animation.Scene,
+        Event.SCENE_COMPLETE: animation.Scene,
+    }
+    _action_target_types: typing.ClassVar[dict[Action, type]] = {
+        Action.ACTIVATE_PATH: motion.Path,
+        Action.ACTIVATE_SCENE: animation.Scene,
+        Action.DEACTIVATE_PATH: motion.Path,
+        Action.DEACTIVATE_SCENE: animation.Scene,
+        Action.RESET_APPEARANCE: type(None),
+        Action.SET_LAYER: int,
+        Action.SET_COORDINATE: Coord,
+        Action.CALLBACK: Callback,
+    }
+    _action_handlers: typing.ClassVar[dict[Action, typing.Callable[[EventHandler, typing.Any], None]]] = {
+        Action.ACTIVATE_PATH: lambda handler, path: handler.character.motion.activate_path(path),
+        Action.ACTIVATE_SCENE: lambda handler, scene: handler.character.animation.activate_scene(scene),
+        Action.DEACTIVATE_PATH: lambda handler, path: handler.character.motion.deactivate_path(path),
+        Action.DEACTIVATE_SCENE: lambda handler, scene: handler.character.animation.deactivate_scene(scene),
+        Action.RESET_APPEARANCE: lambda handler, _: handler.character.animation.set_appearance(
+            handler.character.input_symbol,
+        ),
+        Action.SET_LAYER: lambda handler, layer: setattr(handler.character, "layer", layer),
+        Action.SET_COORDINATE: lambda handler, coord: setattr(handler.character.motion, "current_coord", coord),
+        Action.CALLBACK: lambda handler, callback: callback.callback(handler.character, *callback.args),
+    }
+
     @typing.overload
     def register_event(
         self,
@@ -245,26 +287,10 @@ class EventHandler:
                 EventHandler.Action.ACTIVATE_SCENE, some_scene)`
 
         """
-        event_caller_map = {
-            EventHandler.Event.SEGMENT_ENTERED: motion.Waypoint,
-            EventHandler.Event.SEGMENT_EXITED: motion.Waypoint,
-            EventHandler.Event.PATH_ACTIVATED: motion.Path,
-            EventHandler.Event.PATH_COMPLETE: motion.Path,
-            EventHandler.Event.PATH_HOLDING: motion.Path,
-            EventHandler.Event.SCENE_ACTIVATED: animation.Scene,
-            EventHandler.Event.SCENE_COMPLETE: animation.Scene,
-        }
-
-        action_target_map = {
-            EventHandler.Action.ACTIVATE_PATH: motion.Path,
-            EventHandler.Action.ACTIVATE_SCENE: animation.Scene,
-            EventHandler.Action.DEACTIVATE_PATH: motion.Path,
-            EventHandler.Action.DEACTIVATE_SCENE: animation.Scene,
-            EventHandler.Action.RESET_APPEARANCE: type(None),
-            EventHandler.Action.SET_LAYER: int,
-            EventHandler.Action.SET_COORDINATE: Coord,
-            EventHandler.Action.CALLBACK: EventHandler.Callback,
-        }
+        if self.character._scheduler is not None:
+            self.character._scheduler.wake(self.character)
+        event_caller_map = EventHandler._event_caller_types
+        action_target_map = EventHandler._action_target_types
         # find caller Path when provided path_id
         if event in (EventHandler.Event.PATH_ACTIVATED, EventHandler.Event.PATH_COMPLETE) and isinstance(caller, str):
             if (path_query_result := self.character.motion.query_path(caller)) is None:
@@ -358,24 +384,52 @@ class EventHandler:
             actions registered for that event/caller pair are executed in order.
 
         """
-        action_map = {
-            EventHandler.Action.ACTIVATE_PATH: self.character.motion.activate_path,
-            EventHandler.Action.ACTIVATE_SCENE: self.character.animation.activate_scene,
-            EventHandler.Action.DEACTIVATE_PATH: self.character.motion.deactivate_path,
-            EventHandler.Action.DEACTIVATE_SCENE: self.character.animation.deactivate_scene,
-            EventHandler.Action.RESET_APPEARANCE: lambda _: self.character.animation.set_appearance(
-                self.character.input_symbol,
-            ),
-            EventHandler.Action.SET_LAYER: lambda layer: setattr(self.character, "layer", layer),
-            EventHandler.Action.SET_COORDINATE: lambda coord: setattr(self.character.motion, "current_coord", coord),
-            EventHandler.Action.CALLBACK: lambda callback: callback.callback(self.character, *callback.args),
-        }
-
-        if (event, caller) not in self.registered_events:
+        if not self.registered_events:
+            return
+        event_actions = self.registered_events.get((event, caller))
+        if event_actions is None:
             return
-        for event_action in self.registered_events[(event, caller)]:
-            action, target = event_action
-            action_map[action](target)  # type: ignore[operator]
+        action_handlers = EventHandler._action_handlers
+        for action, target in event_actions:
+            action_handlers[action](self, target)
+
+    @staticmethod
+    def register_event_for_characters(
+        characters: typing.Iterable[EffectCharacter],
+        event: Event,
+        caller: animation.Scene | motion.Waypoint | motion.Path | str,
+        action: Action,
+        target: animation.Scene | motion.Path | int | Coord | Callback | str | None = None,
+    ) -> None:
+        """Register the same event with the EventHandler of each of the given characters.
+
+        This is equivalent to calling `register_event` on each character's EventHandler. Paths and scenes belong to
+        a single character, so `caller` and path or scene targets are typically given by ID and resolved for each
+        character.
+
+        Args:
+            characters (Iterable[EffectCharacter]): The characters to register the event for.
+            event (Event): The event to register.
+            caller (animation.Scene | motion.Waypoint | motion.Path | str): The object, or its ID, that triggers the
+                event.
+            action (Action): The action to take when the event is triggered.
+            target (animation.Scene | motion.Path | int | Coord | Callback | str | None): The target of the action.
+
+        Raises:
+            EventRegistrationCallerError: If the caller object is not the required type for the
+                specified event.
+            EventRegistrationTargetError: If the target is not the correct type for the action.
+            DuplicateEventRegistrationError: If the exact same event-caller-action-target combination
+                has already been registered for a character.
+
+        """
+        for character in characters:
+            character.event_handler.register_event(
+                event,
+                caller,  # pyright: ignore[reportArgumentType]
+                action,  # pyright: ignore[reportArgumentType]
+                target,  # pyright: ignore[reportArgumentType]
+            )
 
 
 class EffectCharacter:
@@ -393,9 +447,11 @@ class EffectCharacter:
         input_symbol (str): The symbol for the character in the input data.
         input_coord (Coord): The coordinate of the character in the input data.
         is_visible (bool): Whether the character is currently visible and should be printed to the terminal.
-        animation (animation.Animation): The animation object that controls the character's appearance.
-        motion (motion.Motion): The motion object that controls the character's movement.
-        event_handler (EventHandler): The event handler object that handles events related to the character.
+        animation (animation.Animation): The animation object that controls the character's appearance. Created on
+            first access.
+        motion (motion.Motion): The motion object that controls the character's movement. Created on first access.
+        event_handler (EventHandler): The event handler object that handles events related to the character. Created
+            on first access.
         layer (int): The layer of the character. The layer determines the order in which characters are printed.
         is_fill_character (bool): Whether the character is a fill character. Fill characters are used to fill
             the empty cells of the Canvas.
@@ -421,16 +477,84 @@ class EffectCharacter:
         self._character_id: int = character_id
         self._input_symbol: str = symbol
         self._input_coord: Coord = Coord(input_column, input_row)
-        self._input_ansi_sequences: dict[str, str | None] = {"fg_color": None, "bg_color": None}
+        self._input_ansi_sequences: typing.Mapping[str, str | None] = _NO_INPUT_ANSI_SEQUENCES
         self._is_visible: bool = False
-        self.animation: animation.Animation = animation.Animation(self)
-        self.motion: motion.Motion = motion.Motion(self)
-        self.event_handler: EventHandler = EventHandler(self)
-        self.layer: int = 0
+        self._frame_buffer: FrameBuffer | None = None
+        self._frame_placement: tuple[int, int, int] | None = None
+        self._scheduler: CharacterScheduler | None = None
+        self._idle_since = 0
+        self._wake_tick = 0
+        # number of upcoming updates after which the scheduler checks whether the character has become idle. A change
+        # that may start an idle period requests two checks, because the first move after the character's coordinate
+        # changes still updates `previous_coord`.
+        self._idle_checks = 2
+        self._layer: int = 0
+        # the animation, motion and event handler are created on first access. Until then, the character shows its
+        # interned input symbol at its input coordinate and has nothing to tick.
+        self._animation: animation.Animation | None = None
+        self._motion: motion.Motion | None = None
+        self._event_handler: EventHandler | None = None
+        # set by the Terminal, supplies the color settings of the animation when it is created
+        self._terminal_config: TerminalConfig | None = None
         self.is_fill_character = False
         self.uses_input_preexisting_colors = False
-        self.links: set[EffectCharacter] = set()
-        self.neighbors: dict[str, EffectCharacter | None] = {}
+        self._links: set[EffectCharacter] | None = None
+        self._neighbors: dict[str, EffectCharacter | None] | None = None
+        # set by the Terminal to look up the neighbors on first access
+        self._resolve_neighbors: typing.Callable[[EffectCharacter], dict[str, EffectCharacter | None]] | None = None
+
+    @property
+    def animation(self) -> animation.Animation:
+        """The animation object that controls the character's appearance."""
+        if self._animation is None:
+            self._animation = animation.Animation(self)
+        return self._animation
+
+    @property
+    def motion(self) -> motion.Motion:
+        """The motion object that controls the character's movement."""
+        if self._motion is None:
+            self._motion = motion.Motion(self)
+        return self._motion
+
+    @property
+    def event_handler(self) -> EventHandler:
+        """The event handler object that handles events related to the character."""
+        if self._event_handler is None:
+            self._event_handler = EventHandler(self)
+        return self._event_handler
+
+    @property
+    def links(self) -> set[EffectCharacter]:
+        """Linked neighboring characters used by spanning-tree algorithms."""
+        if self._links is None:
+            self._links = set()
+        return self._links
+
+    @property
+    def neighbors(self) -> dict[str, EffectCharacter | None]:
+        """Adjacent characters keyed by direction (`"north"`, `"east"`, `"south"`, `"west"`)."""
+        if self._resolve_neighbors is not None:
+            self._neighbors = self._resolve_neighbors(self)
+            self._resolve_neighbors = None
+        elif self._neighbors is None:
+            self._neighbors = {}
+        return self._neighbors
+
+    @neighbors.setter
+    def neighbors(self, value: dict[str, EffectCharacter | None]) -> None:
+        self._neighbors = value
+        self._resolve_neighbors = None
+
+    def _has_input_colors(self) -> bool:
+        """Return whether the character was parsed with an input foreground or background color.
+
+        Returns:
+            bool: True if the character has an input color, False if not.
+
+        """
+        animation = self._animation
+        return animation is not None and bool(animation.input_fg_color or animation.input_bg_color)
 
     @property
     def input_symbol(self) -> str:
@@ -452,6 +576,18 @@ class EffectCharacter:
         """The unique ID of the character, generated by the Terminal."""
         return self._character_id
 
+    @property
+    def layer(self) -> int:
+        """The layer of the character. The layer determines the order in which characters are printed."""
+        return self._layer
+
+    @layer.setter
+    def layer(self, value: int) -> None:
+        if value != self._layer:
+            self._layer = value
+            if self._frame_buffer is not None:
+                self._frame_buffer.update_position(self)
+
     @property
     def is_active(self) -> bool:
         """Returns whether the character is currently active.
@@ -463,16 +599,46 @@ class EffectCharacter:
             bool: True if the character is active, False if not.
 
         """
-        return bool(not self.animation.active_scene_is_complete() or not self.motion.movement_is_complete())
+        return bool(
+            (self._animation is not None and not self._animation.active_scene_is_complete())
+            or (self._motion is not None and not self._motion.movement_is_complete()),
+        )
 
     def tick(self) -> None:
         """Progress the character by one tick.
 
         Motion is advanced first, then animation is stepped so animation logic can react
-        to the character's updated motion state for the same tick.
+        to the character's updated motion state for the same tick. Components that have not been created
+        are skipped.
+        """
+        if self._motion is not None:
+            self._motion.move()
+        if self._animation is not None:
+            self._animation.step_animation()
+
+    def _idle_ticks(self) -> int:
+        """Return the number of upcoming ticks that will not change the character or trigger any events.
+
+        Returns:
+            int: Number of idle ticks.
+
+        """
+        idle_ticks = sys.maxsize if self._animation is None else self._animation._idle_ticks()
+        if idle_ticks and self._motion is not None:
+            return min(idle_ticks, self._motion._idle_ticks())
+        return idle_ticks
+
+    def _skip_idle_ticks(self, ticks: int) -> None:
+        """Apply the effect of the given number of idle ticks without ticking the character.
+
+        Args:
+            ticks (int): Number of idle ticks, no more than the value returned by `_idle_ticks()`.
+
         """
-        self.motion.move()
-        self.animation.step_animation()
+        if self._motion is not None:
+            self._motion._skip_idle_ticks(ticks)
+        if self._animation is not None:
+            self._animation._skip_idle_ticks(ticks)
 
     def _link(self, char: EffectCharacter, *, bidirectional: bool = True) -> None:
         """Link this character with another character.
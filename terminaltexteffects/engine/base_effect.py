@@ -20,6 +20,7 @@ from copy import deepcopy
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 from terminaltexteffects.engine.base_config import BaseConfig
+from terminaltexteffects.engine.scheduler import CharacterScheduler
 from terminaltexteffects.engine.terminal import Terminal, TerminalConfig
 
 if TYPE_CHECKING:
@@ -47,6 +48,7 @@ class BaseEffectIterator(ABC, Generic[T]):
 
     Methods:
         update: Run the tick method for all active characters and remove inactive characters from the active list.
+        advance: Advance the effect by one frame without formatting the frame.
         __iter__: Return the iterator object.
         __next__: Return the next frame of the effect.
 
@@ -62,9 +64,10 @@ class BaseEffectIterator(ABC, Generic[T]):
         self.config: T = deepcopy(effect.effect_config)
         self.terminal = Terminal(effect.input_data, deepcopy(effect.terminal_config))
         self.active_characters: set[EffectCharacter] = set()
+        self._character_scheduler = CharacterScheduler()
+        self._skip_frame = False
         self.preexisting_colors_present: bool = any(
-            any((character.animation.input_fg_color, character.animation.input_bg_color))
-            for character in self.terminal.get_characters()
+            character._has_input_colors() for character in self.terminal.get_characters()
         )
 
     @property
@@ -73,12 +76,15 @@ class BaseEffectIterator(ABC, Generic[T]):
 
         If the configured terminal frame rate is greater than `0`, enforce the frame rate
         before reading the formatted output string. This property does not advance effect
-        state on its own.
+        state on its own. While the effect is being advanced by `advance()`, no frame is
+        formatted and an empty string is returned.
 
         Returns:
             str: Current frame of the effect.
 
         """
+        if self._skip_frame:
+            return ""
         if self.terminal._frame_rate:
             self.terminal.enforce_framerate()
         return self.terminal.get_formatted_output_string()
@@ -87,11 +93,27 @@ class BaseEffectIterator(ABC, Generic[T]):
         """Run one tick for each active character and prune inactive characters.
 
         Each character in `active_characters` is ticked once. After all ticks complete,
-        characters whose `is_active` flag is false are removed from the set.
+        characters whose `is_active` flag is false are removed from the set. Ticks that would
+        only count down a frame duration or path hold time are skipped and applied in bulk
+        when the character next needs attention. See `CharacterScheduler`.
         """
-        for character in tuple(self.active_characters):
-            character.tick()
-        self.active_characters -= {character for character in self.active_characters if not character.is_active}
+        self._character_scheduler.update(self.active_characters)
+
+    def advance(self) -> bool:
+        """Advance the effect by one frame without formatting the frame or enforcing the frame rate.
+
+        Returns:
+            bool: False if the effect had already completed, otherwise True.
+
+        """
+        self._skip_frame = True
+        try:
+            next(self)
+        except StopIteration:
+            return False
+        finally:
+            self._skip_frame = False
+        return True
 
     def __iter__(self) -> BaseEffectIterator:
         """Return this iterator instance.
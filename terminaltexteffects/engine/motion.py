@@ -3,12 +3,16 @@
 Classes:
     Waypoint: A Waypoint comprises an identifier, a coordinate, and, optionally, bezier control point(s).
     Segment: A segment of a path consisting of two waypoints and the distance between them.
+    Trajectory: Per-step coordinates along a path, shared between paths with identical geometry.
     Path: Represents a path consisting of multiple waypoints for motion.
     Motion: Motion class for managing the movement of a character.
 """
 
 from __future__ import annotations
 
+import bisect
+import itertools
+import sys
 import typing
 from dataclasses import dataclass
 
@@ -83,6 +87,101 @@ class Segment:
         return hash((self.start, self.end))
 
 
+class Trajectory:
+    """Per-step coordinates along a path, shared between paths with identical geometry.
+
+    A trajectory is compiled from a path's segments, total distance, step count, and easing function. Each step
+    records the coordinate reached, the distance traveled, and the number of segments fully passed, which determines
+    the segment events triggered at that step. Steps are computed on first use and stored, so every path sharing the
+    trajectory looks steps up by index instead of recomputing them. The segment reached at a step is found by binary
+    search over the cumulative segment distances.
+
+    Attributes:
+        segments (tuple[tuple[Coord, tuple[Coord, ...] | None, Coord, float], ...]): (start coordinate, bezier
+            control points, end coordinate, distance) for each segment.
+        total_distance (float): Total travel distance across all segments.
+        max_steps (int): Number of steps to traverse the segments.
+        ease (easing.EasingFunction | None): Easing function applied across the traversal.
+
+    """
+
+    __slots__ = ("_segment_ends", "_steps", "ease", "max_steps", "segments", "total_distance")
+
+    def __init__(
+        self,
+        segments: tuple[tuple[Coord, tuple[Coord, ...] | None, Coord, float], ...],
+        total_distance: float,
+        max_steps: int,
+        ease: easing.EasingFunction | None,
+    ) -> None:
+        """Initialize the Trajectory.
+
+        Args:
+            segments (tuple[tuple[Coord, tuple[Coord, ...] | None, Coord, float], ...]): (start coordinate, bezier
+                control points, end coordinate, distance) for each segment.
+            total_distance (float): Total travel distance across all segments.
+            max_steps (int): Number of steps to traverse the segments.
+            ease (easing.EasingFunction | None): Easing function applied across the traversal.
+
+        """
+        self.segments = segments
+        self.total_distance = total_distance
+        self.max_steps = max_steps
+        self.ease = ease
+        self._segment_ends = tuple(itertools.accumulate(segment[3] for segment in segments))
+        self._steps: list[tuple[Coord, float, int]] = []
+
+    def step(self, step: int) -> tuple[Coord, float, int]:
+        """Return the state of the traversal at the given step.
+
+        Args:
+            step (int): Step number, from 1 to `max_steps`.
+
+        Returns:
+            tuple[Coord, float, int]: (coordinate, distance traveled, number of segments fully passed).
+
+        """
+        steps = self._steps
+        while len(steps) < step:
+            steps.append(self._compute_step(len(steps) + 1))
+        return steps[step - 1]
+
+    def _compute_step(self, step: int) -> tuple[Coord, float, int]:
+        """Compute the state of the traversal at the given step.
+
+        Args:
+            step (int): Step number, from 1 to `max_steps`.
+
+        Returns:
+            tuple[Coord, float, int]: (coordinate, distance traveled, number of segments fully passed).
+
+        """
+        if self.ease:
+            distance_factor = self.ease(step / self.max_steps)
+        else:
+            distance_factor = step / self.max_steps
+        distance_reached = distance_factor * self.total_distance
+        # the active segment is the first segment ending at or beyond the distance reached
+        segments_passed = bisect.bisect_left(self._segment_ends, distance_reached)
+        # if the distance reached is further than the last waypoint,
+        # preserve the distance from the start of the final segment
+        active_index = min(segments_passed, len(self.segments) - 1)
+        start, bezier_control, end, segment_distance = self.segments[active_index]
+        distance_to_travel = distance_reached - (self._segment_ends[active_index - 1] if active_index else 0)
+        if segment_distance == 0:
+            segment_distance_to_travel_factor = 0.0
+        elif self.ease:
+            segment_distance_to_travel_factor = distance_to_travel / segment_distance
+        else:
+            segment_distance_to_travel_factor = min((distance_to_travel / segment_distance, 1))
+
+        if bezier_control:
+            coord = geometry.find_coord_on_bezier_curve(start, bezier_control, end, segment_distance_to_travel_factor)
+        else:
+            coord = geometry.find_coord_on_line(start, end, segment_distance_to_travel_factor)
+        return coord, distance_reached, segments_passed
+
+
 @dataclass
 class Path:
     """Represents a path consisting of multiple waypoints for motion.
@@ -104,6 +203,8 @@ class Path:
         last_distance_reached (float): Most recent eased or linear distance traveled along the active path.
         origin_segment (Segment | None): Temporary segment from the current coordinate to the first waypoint,
             set on activation.
+        trajectory (Trajectory | None): Compiled per-step coordinates for the current segments. Compiled on the
+            first step after the path's geometry changes, and shared with paths of identical geometry.
 
     Methods:
         new_waypoint:
@@ -122,6 +223,9 @@ class Path:
     hold_time: int = 0
     loop: bool = False
 
+    _trajectory_cache: typing.ClassVar[dict[tuple, Trajectory]] = {}
+    _trajectory_cache_max_size: typing.ClassVar[int] = 2048
+
     def __post_init__(self) -> None:
         """Initialize the Path object and calculates the total distance and maximum steps."""
         self.segments: list[Segment] = []
@@ -133,6 +237,8 @@ class Path:
         self.hold_time_remaining = self.hold_time
         self.last_distance_reached: float = 0  # used for animation syncing to distance
         self.origin_segment: Segment | None = None
+        self.trajectory: Trajectory | None = None
+        self._segments_passed = 0
         if self.speed <= 0:
             raise PathInvalidSpeedError(self.speed)
 
@@ -205,6 +311,7 @@ class Path:
         self.total_distance += distance_from_previous
         self.segments.append(Segment(self.waypoints[-2], waypoint, distance_from_previous))
         self.max_steps = round(self.total_distance / self.speed)
+        self.trajectory = None
 
     def query_waypoint(self, waypoint_id: str) -> Waypoint:
         """Return the waypoint with the given waypoint_id.
@@ -221,12 +328,43 @@ class Path:
             raise WaypointNotFoundError(waypoint_id)
         return waypoint
 
+    def _compile_trajectory(self) -> Trajectory:
+        """Return the trajectory for the current segments, reusing a cached trajectory with identical geometry.
+
+        Returns:
+            Trajectory: The trajectory for the path.
+
+        """
+        segments = tuple(
+            (segment.start.coord, segment.end.bezier_control, segment.end.coord, segment.distance)
+            for segment in self.segments
+        )
+        key = (segments, self.total_distance, self.max_steps, self.ease)
+        trajectory = Path._trajectory_cache.get(key)
+        if trajectory is None:
+            trajectory = Trajectory(segments, self.total_distance, self.max_steps, self.ease)
+            if len(Path._trajectory_cache) >= Path._trajectory_cache_max_size:
+                del Path._trajectory_cache[next(iter(Path._trajectory_cache))]
+            Path._trajectory_cache[key] = trajectory
+        return trajectory
+
+    def _reset_traversal(self) -> None:
+        """Reset the traversal state so the path is traversed from its first step."""
+        self.current_step = 0
+        self.hold_time_remaining = self.hold_time
+        self.max_steps = round(self.total_distance / self.speed)
+        self.trajectory = None
+        self._segments_passed = 0
+        for segment in self.segments:
+            segment.enter_event_triggered = False
+            segment.exit_event_triggered = False
+
     def step(self, event_handler: base_character.EventHandler) -> Coord:
         """Progresses to the next step along the path and returns the coordinate at that step.
 
-        This method is called by the Motion.move() method. It calculates the next coordinate based on the current step,
-        total distance, bezier control points, and the easing function if provided. It also handles the triggering
-        of segment enter and exit events.
+        This method is called by the Motion.move() method. The coordinate for the next step is looked up in the
+        path's compiled trajectory, which is based on the current step, total distance, bezier control points, and
+        the easing function if provided. It also handles the triggering of segment enter and exit events.
 
         Args:
             event_handler (base_character.EventHandler): The EventHandler for the character.
@@ -239,53 +377,27 @@ class Path:
             # if the path has zero distance or there are no more steps, return the final waypoint coordinate
             return self.segments[-1].end.coord
         self.current_step += 1
-        if self.ease:
-            distance_factor = self.ease(self.current_step / self.max_steps)
-        else:
-            distance_factor = self.current_step / self.max_steps
-
-        distance_to_travel = distance_factor * self.total_distance
-        self.last_distance_reached = distance_to_travel
-        for segment in self.segments:
-            if distance_to_travel <= segment.distance:
-                active_segment = segment
-                if not segment.enter_event_triggered:
-                    segment.enter_event_triggered = True
-                    event_handler._handle_event(event_handler.Event.SEGMENT_ENTERED, segment.end)
-                break
-            distance_to_travel -= segment.distance
+        trajectory = self.trajectory
+        if trajectory is None or trajectory.ease is not self.ease:
+            trajectory = self.trajectory = self._compile_trajectory()
+        next_coord, self.last_distance_reached, segments_passed = trajectory.step(self.current_step)
+        # segments before `_segments_passed` have already triggered both events
+        for segment_index in range(self._segments_passed, segments_passed):
+            segment = self.segments[segment_index]
             if not segment.enter_event_triggered:
                 segment.enter_event_triggered = True
                 event_handler._handle_event(event_handler.Event.SEGMENT_ENTERED, segment.end)
             if not segment.exit_event_triggered:
                 segment.exit_event_triggered = True
                 event_handler._handle_event(event_handler.Event.SEGMENT_EXITED, segment.end)
-        # if the distance_to_travel is further than the last waypoint,
-        # preserve the distance from the start of the final segment
-        else:
-            active_segment = self.segments[-1]
-            distance_to_travel += active_segment.distance
-        if active_segment.distance == 0:
-            segment_distance_to_travel_factor = 0.0
-        elif self.ease:
-            segment_distance_to_travel_factor = distance_to_travel / active_segment.distance
-        else:
-            segment_distance_to_travel_factor = min((distance_to_travel / active_segment.distance, 1))
-
-        if active_segment.end.bezier_control:
-            next_coord = geometry.find_coord_on_bezier_curve(
-                active_segment.start.coord,
-                active_segment.end.bezier_control,
-                active_segment.end.coord,
-                segment_distance_to_travel_factor,
-            )
-        else:
-            next_coord = geometry.find_coord_on_line(
-                active_segment.start.coord,
-                active_segment.end.coord,
-                segment_distance_to_travel_factor,
-            )
-
+            # an event may have reactivated the path, which resets the traversal
+            if self._segments_passed == segment_index:
+                self._segments_passed = segment_index + 1
+        if segments_passed < len(self.segments):
+            segment = self.segments[segments_passed]
+            if not segment.enter_event_triggered:
+                segment.enter_event_triggered = True
+                event_handler._handle_event(event_handler.Event.SEGMENT_ENTERED, segment.end)
         return next_coord
 
     def __eq__(self, other: object) -> bool:
@@ -352,10 +464,25 @@ class Motion:
         """
         self.paths: dict[str, Path] = {}
         self.character = character
-        self.current_coord: Coord = Coord(character.input_coord.column, character.input_coord.row)
+        self._current_coord: Coord = Coord(character.input_coord.column, character.input_coord.row)
         self.previous_coord: Coord = Coord(-1, -1)
         self.active_path: Path | None = None
 
+    @property
+    def current_coord(self) -> Coord:
+        """The current coordinate of the character."""
+        return self._current_coord
+
+    @current_coord.setter
+    def current_coord(self, coord: Coord) -> None:
+        if coord is self._current_coord:
+            return
+        if self.character._scheduler is not None:
+            self.character._scheduler.wake(self.character)
+        self._current_coord = coord
+        if self.character._frame_buffer is not None:
+            self.character._frame_buffer.update_position(self.character)
+
     def set_coordinate(self, coord: Coord) -> None:
         """Set the current coordinate to the given coordinate.
 
@@ -496,6 +623,8 @@ class Motion:
             path (Path | str): The path to activate. Must be the Path itself, or the Path's ID.
 
         """
+        if self.character._scheduler is not None:
+            self.character._scheduler.wake(self.character)
         if isinstance(path, str):
             found_path = self.query_path(path)
             if found_path is None:
@@ -530,12 +659,7 @@ class Motion:
         else:
             self.active_path.segments.insert(0, new_origin_segment)
         self.active_path.origin_segment = new_origin_segment
-        self.active_path.current_step = 0
-        self.active_path.hold_time_remaining = self.active_path.hold_time
-        self.active_path.max_steps = round(self.active_path.total_distance / self.active_path.speed)
-        for segment in self.active_path.segments:
-            segment.enter_event_triggered = False
-            segment.exit_event_triggered = False
+        self.active_path._reset_traversal()
         if self.active_path.layer is not None:
             self.character.layer = self.active_path.layer
         self.character.event_handler._handle_event(self.character.event_handler.Event.PATH_ACTIVATED, self.active_path)
@@ -560,6 +684,9 @@ class Motion:
             PathNotFoundError: If `path` is a string and no path with that ID exists.
 
         """
+        if self.character._scheduler is not None:
+            self.character._scheduler.wake(self.character)
+        self.character._idle_checks = 2
         if path is None:
             self.active_path = None
             return
@@ -572,6 +699,42 @@ class Motion:
         if self.active_path and self.active_path is found_path:
             self.active_path = None
 
+    def _idle_ticks(self) -> int:
+        """Return the number of upcoming moves that will not change the character or trigger any events.
+
+        Moves are idle while the character is holding at the end of the active path, after the PATH_HOLDING event
+        has been triggered, and indefinitely when there is no active path.
+
+        Returns:
+            int: Number of idle moves.
+
+        """
+        current_coord = self._current_coord
+        if self.previous_coord is not current_coord and self.previous_coord != current_coord:
+            return 0
+        path = self.active_path
+        if path is None:
+            return sys.maxsize
+        if (
+            path.current_step != path.max_steps
+            or path.hold_time_remaining == path.hold_time
+            or not path.segments
+            or (path.segments[-1].end.coord is not current_coord and path.segments[-1].end.coord != current_coord)
+        ):
+            return 0
+        return path.hold_time_remaining
+
+    def _skip_idle_ticks(self, ticks: int) -> None:
+        """Apply the effect of the given number of idle moves.
+
+        Args:
+            ticks (int): Number of idle moves, no more than the value returned by `_idle_ticks()`.
+
+        """
+        self.previous_coord = self._current_coord
+        if self.active_path is not None:
+            self.active_path.hold_time_remaining -= ticks
+
     def move(self) -> None:
         """Move the character along the active path.
 
@@ -602,6 +765,7 @@ class Motion:
                     self.active_path,
                 )
                 self.active_path.hold_time_remaining -= 1
+                self.character._idle_checks = 2
                 return
             if self.active_path.hold_time_remaining:
                 self.active_path.hold_time_remaining -= 1
@@ -0,0 +1,740 @@
+"""Frame composition and incremental terminal output support.
+
+`FrameBuffer` holds the composed rows of the visible canvas between frames. Visible characters are bucketed by row
+and layer, and the buffer is notified when a character's position, layer, or visual changes. Only the rows touched by
+those changes are rebuilt, so the cost of a frame scales with the number of characters that changed rather than the
+number of visible characters.
+
+The `Terminal` produces each frame as a complete string of rows separated by newlines, where every cell may carry
+ANSI SGR formatting. Writing that string in full each frame is simple, but on links where bandwidth matters (SSH,
+tmux, serial consoles) most of those bytes describe cells that did not change since the previous frame.
+
+`IncrementalRenderer` compares each frame with the previously written frame, cell by cell, and produces an output
+string that repositions the cursor and rewrites only the runs of cells that changed. `OutputStats` records the number
+of bytes written for each frame alongside the number of bytes the full-frame path would have written.
+`FrameWriter` sends each frame, including its cursor control sequences, to the terminal in a single write.
+
+Classes:
+    FrameBuffer: Persistent, layered composition of the visible canvas with dirty-row tracking.
+    OutputStats: Per-frame and cumulative byte counts for terminal output.
+    IncrementalRenderer: Produces cursor-addressed output containing only the cells that changed between frames.
+    FrameWriter: Writes each frame to stdout as bytes with a single write, falling back to text writes.
+
+Functions:
+    move_cursor_to_canvas_top: Return the sequence that moves the cursor from the saved position to the canvas top.
+    byte_length: Return the number of bytes a string occupies when written as UTF-8.
+    cell_width: Return the number of terminal columns occupied by a symbol.
+    parse_row_cells: Split a formatted row string into cells of (SGR state, symbol).
+    encode_cells: Encode a sequence of cells as a formatted string.
+    encode_visual_row: Encode a row of character visuals as a formatted string.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import os
+import re
+import sys
+import typing
+import unicodedata
+from dataclasses import dataclass
+
+from terminaltexteffects.engine.animation import CharacterVisual
+from terminaltexteffects.utils import ansitools
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from terminaltexteffects.engine.base_character import EffectCharacter
+
+SgrState = typing.Tuple[typing.Tuple[str, ...], typing.Optional[str], typing.Optional[str]]
+"""SGR state of a cell as (sorted mode parameters, foreground color parameters, background color parameters)."""
+
+Cell = typing.Tuple[SgrState, str]
+"""A single terminal cell as (SGR state, symbol)."""
+
+DEFAULT_SGR_STATE: SgrState = ((), None, None)
+
+_SGR_TOKEN_PATTERN = re.compile(r"\x1b\[([0-9;]*)m|(.)", re.DOTALL)
+_MODE_RESET_PARAMETERS: dict[str, tuple[str, ...]] = {
+    "22": ("1", "2"),
+    "23": ("3",),
+    "24": ("4",),
+    "25": ("5", "6"),
+    "27": ("7",),
+    "28": ("8",),
+    "29": ("9",),
+}
+_COLOR_PARAMETER_COUNTS = {"5": 3, "2": 5}
+
+
+def move_cursor_to_canvas_top(canvas_rows: int) -> str:
+    """Return the sequence that restores the saved canvas cursor position and moves to the top of the canvas.
+
+    The saved position is restored and immediately saved again, so the cursor can be returned to the same position
+    for the next frame.
+
+    Args:
+        canvas_rows (int): Number of rows between the top of the canvas and the saved cursor position.
+
+    Returns:
+        str: The cursor movement sequence.
+
+    """
+    return (
+        ansitools.dec_restore_cursor_position()
+        + ansitools.dec_save_cursor_position()
+        + ansitools.move_cursor_up(canvas_rows)
+    )
+
+
+def byte_length(text: str) -> int:
+    """Return the number of bytes a string occupies when written as UTF-8.
+
+    ASCII strings are measured without encoding them.
+
+    Args:
+        text (str): The string to measure.
+
+    Returns:
+        int: The number of bytes.
+
+    """
+    if text.isascii():
+        return len(text)
+    return len(text.encode())
+
+
+@functools.lru_cache(maxsize=4096)
+def cell_width(symbol: str) -> int:
+    """Return the number of terminal columns occupied by a symbol.
+
+    Combining marks and format characters occupy no columns, wide and fullwidth East Asian characters occupy two
+    columns, and all other symbols occupy one column.
+
+    Args:
+        symbol (str): A single character.
+
+    Returns:
+        int: The number of columns, 0, 1, or 2.
+
+    """
+    if symbol.isascii():
+        return 1
+    if unicodedata.combining(symbol) or unicodedata.category(symbol) in ("Mn", "Me", "Cf"):
+        return 0
+    if unicodedata.east_asian_width(symbol) in ("W", "F"):
+        return 2
+    return 1
+
+
+def _apply_sgr_parameters(state: SgrState, parameters: str) -> SgrState:
+    """Return the SGR state that results from applying an SGR parameter string to an existing state.
+
+    Args:
+        state (SgrState): The current SGR state.
+        parameters (str): The parameter portion of an SGR sequence, e.g. `38;5;196` for `ESC[38;5;196m`.
+
+    Returns:
+        SgrState: The resulting SGR state.
+
+    """
+    modes, fg, bg = state
+    tokens = parameters.split(";")
+    index = 0
+    while index < len(tokens):
+        token = tokens[index] or "0"
+        if token == "0":
+            modes, fg, bg = (), None, None
+        elif token in ("38", "48"):
+            count = _COLOR_PARAMETER_COUNTS.get(tokens[index + 1] if index + 1 < len(tokens) else "", 1)
+            color = ";".join(tokens[index : index + count])
+            if token == "38":
+                fg = color
+            else:
+                bg = color
+            index += count
+            continue
+        elif token == "39":
+            fg = None
+        elif token == "49":
+            bg = None
+        elif token in _MODE_RESET_PARAMETERS:
+            modes = tuple(mode for mode in modes if mode not in _MODE_RESET_PARAMETERS[token])
+        elif token not in modes:
+            modes = tuple(sorted((*modes, token)))
+        index += 1
+    return modes, fg, bg
+
+
+def parse_row_cells(row: str) -> list[Cell]:
+    """Split a formatted row string into cells.
+
+    SGR sequences are tracked as running state, so a row produced by concatenating self-contained formatted symbols
+    and a row that shares formatting across adjacent cells produce the same cells when they look the same.
+
+    Args:
+        row (str): A single row of formatted terminal output, without newlines.
+
+    Returns:
+        list[Cell]: The cells in the row, in column order.
+
+    """
+    cells: list[Cell] = []
+    state = DEFAULT_SGR_STATE
+    for parameters, symbol in _SGR_TOKEN_PATTERN.findall(row):
+        if symbol:
+            cells.append((state, symbol))
+        else:
+            state = _apply_sgr_parameters(state, parameters)
+    return cells
+
+
+@functools.lru_cache(maxsize=8192)
+def _sgr_transition(current_state: SgrState, state: SgrState) -> str:
+    """Return the shortest supported SGR sequence that changes the terminal from one SGR state to another.
+
+    Colors are changed individually, using `39`/`49` to return to the default foreground/background. Modes are added
+    individually, but removing a mode resets all formatting before the new state is applied.
+
+    Args:
+        current_state (SgrState): The SGR state currently active in the terminal.
+        state (SgrState): The SGR state to apply.
+
+    Returns:
+        str: The SGR sequence.
+
+    """
+    if state == DEFAULT_SGR_STATE:
+        return ansitools.reset_all()
+    current_modes, current_fg, current_bg = current_state
+    modes, fg, bg = state
+    if current_state == DEFAULT_SGR_STATE or not set(current_modes).issubset(modes):
+        parameters = [*modes]
+        if fg is not None:
+            parameters.append(fg)
+        if bg is not None:
+            parameters.append(bg)
+        prefix = "" if current_state == DEFAULT_SGR_STATE else "0;"
+        return f"\x1b[{prefix}{';'.join(parameters)}m"
+    parameters = [mode for mode in modes if mode not in current_modes]
+    if fg != current_fg:
+        parameters.append("39" if fg is None else fg)
+    if bg != current_bg:
+        parameters.append("49" if bg is None else bg)
+    return f"\x1b[{';'.join(parameters)}m"
+
+
+def encode_cells(cells: Sequence[Cell]) -> str:
+    """Encode a sequence of cells as a formatted string.
+
+    SGR sequences are only written where the state changes between adjacent cells, and formatting is reset after the
+    last cell if any formatting is active.
+
+    Args:
+        cells (Sequence[Cell]): The cells to encode.
+
+    Returns:
+        str: The formatted string.
+
+    """
+    pieces: list[str] = []
+    current_state = DEFAULT_SGR_STATE
+    for state, symbol in cells:
+        if state != current_state:
+            pieces.append(_sgr_transition(current_state, state))
+            current_state = state
+        pieces.append(symbol)
+    if current_state != DEFAULT_SGR_STATE:
+        pieces.append(ansitools.reset_all())
+    return "".join(pieces)
+
+
+def encode_visual_row(visuals: Sequence[CharacterVisual | None]) -> str:
+    """Encode a row of character visuals as a formatted string.
+
+    The current SGR state is tracked across the row so a sequence is only written when the foreground color,
+    background color, or modes change between adjacent cells, and formatting is reset once at the end of the row.
+    `None` entries are written as unformatted spaces.
+
+    Args:
+        visuals (Sequence[CharacterVisual | None]): The visual for each cell in the row, in column order.
+
+    Returns:
+        str: The formatted row.
+
+    """
+    pieces: list[str] = []
+    current_state = DEFAULT_SGR_STATE
+    for visual in visuals:
+        if visual is None:
+            if current_state != DEFAULT_SGR_STATE:
+                pieces.append(ansitools.reset_all())
+                current_state = DEFAULT_SGR_STATE
+            pieces.append(" ")
+            continue
+        state = visual.sgr_state
+        if state != current_state:
+            pieces.append(_sgr_transition(current_state, state))
+            current_state = state
+        pieces.append(visual.symbol)
+    if current_state != DEFAULT_SGR_STATE:
+        pieces.append(ansitools.reset_all())
+    return "".join(pieces)
+
+
+class FrameBuffer:
+    """Persistent, layered composition of the visible canvas.
+
+    Each visible character is placed in a bucket for its row and layer. When a character's position or layer changes,
+    it is moved between buckets and the affected rows are marked dirty. When a character's visual changes, its row is
+    marked dirty. `refresh()` rebuilds only the dirty rows, rendering each row's buckets in ascending layer order.
+    Within a layer, the character with the highest `character_id` is rendered on top. Rows are encoded with
+    `encode_visual_row()`, so adjacent cells sharing formatting share SGR sequences.
+
+    Characters notify the buffer through their `_frame_buffer` reference, which is set while they are visible. The
+    buffer records each character's current (row index, column index, layer) placement on the character itself in
+    `_frame_placement`, or `None` when the character is outside the visible bounds.
+
+    Args:
+        height (int): Number of rows in the buffer. Row 1 is the bottom row.
+        width (int): Number of columns in the buffer.
+        row_offset (int): Offset added to a character's row to find its row in the buffer.
+        column_offset (int): Offset added to a character's column to find its column in the buffer.
+        bottom (int, optional): Lowest row, 1-based, in which characters are rendered. Defaults to 1.
+        left (int, optional): Leftmost column, 1-based, in which characters are rendered. Defaults to 1.
+
+    """
+
+    def __init__(
+        self,
+        height: int,
+        width: int,
+        row_offset: int,
+        column_offset: int,
+        bottom: int = 1,
+        left: int = 1,
+    ) -> None:
+        """Initialize the FrameBuffer.
+
+        Args:
+            height (int): Number of rows in the buffer. Row 1 is the bottom row.
+            width (int): Number of columns in the buffer.
+            row_offset (int): Offset added to a character's row to find its row in the buffer.
+            column_offset (int): Offset added to a character's column to find its column in the buffer.
+            bottom (int, optional): Lowest row, 1-based, in which characters are rendered. Defaults to 1.
+            left (int, optional): Leftmost column, 1-based, in which characters are rendered. Defaults to 1.
+
+        """
+        self.height = height
+        self.width = width
+        self.row_offset = row_offset
+        self.column_offset = column_offset
+        self.bottom = bottom
+        self.left = left
+        self._blank_row = " " * width
+        self._rows: list[str] = [self._blank_row] * height
+        # row index -> layer -> character_id -> (column index, character)
+        self._row_layers: list[dict[int, dict[int, tuple[int, EffectCharacter]]]] = [{} for _ in range(height)]
+        self._dirty_rows: set[int] = set()
+        self._output: str | None = None
+
+    @property
+    def rows(self) -> list[str]:
+        """list[str]: The composed rows, ordered from the bottom row to the top row, as of the last refresh."""
+        return list(self._rows)
+
+    @property
+    def output(self) -> str:
+        """str: The composed rows joined for printing, ordered from the top row to the bottom row."""
+        if self._output is None:
+            self._output = "\n".join(reversed(self._rows))
+        return self._output
+
+    def add(self, character: EffectCharacter) -> None:
+        """Start tracking a visible character.
+
+        Args:
+            character (EffectCharacter): The character to track.
+
+        """
+        character._frame_buffer = self
+        self.update_position(character)
+
+    def remove(self, character: EffectCharacter) -> None:
+        """Stop tracking a character and clear it from the buffer.
+
+        Args:
+            character (EffectCharacter): The character to stop tracking.
+
+        """
+        if character._frame_buffer is self:
+            character._frame_buffer = None
+        self._unplace(character)
+
+    def update_position(self, character: EffectCharacter) -> None:
+        """Update the placement of a character after its coordinate or layer changed.
+
+        Args:
+            character (EffectCharacter): The character that changed.
+
+        """
+        coord = character._input_coord if character._motion is None else character._motion._current_coord
+        row = coord.row + self.row_offset
+        column = coord.column + self.column_offset
+        if self.bottom <= row <= self.height and self.left <= column <= self.width:
+            placement = (row - 1, column - 1, character._layer)
+            if character._frame_placement == placement:
+                return
+            self._unplace(character)
+            row_index, column_index, layer = placement
+            character._frame_placement = placement
+            self._row_layers[row_index].setdefault(layer, {})[character._character_id] = (column_index, character)
+            self._dirty_rows.add(row_index)
+        else:
+            self._unplace(character)
+
+    def update_visual(self, character: EffectCharacter) -> None:
+        """Mark the row containing a character dirty after its visual changed.
+
+        Args:
+            character (EffectCharacter): The character that changed.
+
+        """
+        placement = character._frame_placement
+        if placement is not None:
+            self._dirty_rows.add(placement[0])
+
+    def _unplace(self, character: EffectCharacter) -> None:
+        """Remove a character from its row bucket, if placed, and mark the row dirty.
+
+        Args:
+            character (EffectCharacter): The character to remove.
+
+        """
+        placement = character._frame_placement
+        if placement is None:
+            return
+        character._frame_placement = None
+        row_index, _, layer = placement
+        layers = self._row_layers[row_index]
+        bucket = layers[layer]
+        del bucket[character._character_id]
+        if not bucket:
+            del layers[layer]
+        self._dirty_rows.add(row_index)
+
+    def refresh(self) -> bool:
+        """Rebuild the dirty rows.
+
+        Returns:
+            bool: True if any rows were rebuilt, False if the buffer was already up to date.
+
+        """
+        if not self._dirty_rows:
+            return False
+        for row_index in self._dirty_rows:
+            layers = self._row_layers[row_index]
+            if not layers:
+                self._rows[row_index] = self._blank_row
+                continue
+            visuals: list[CharacterVisual | None] = [None] * self.width
+            for layer in sorted(layers):
+                bucket = layers[layer]
+                for character_id in sorted(bucket):
+                    column_index, character = bucket[character_id]
+                    animation = character._animation
+                    visuals[column_index] = (
+                        CharacterVisual.interned(character._input_symbol)
+                        if animation is None
+                        else animation._current_character_visual
+                    )
+            self._rows[row_index] = encode_visual_row(visuals)
+        self._dirty_rows.clear()
+        self._output = None
+        return True
+
+
+@dataclass
+class OutputStats:
+    """Byte counts for frames written to the terminal.
+
+    Every frame records the number of bytes actually written and the number of bytes the full-frame output path
+    would have written for the same frame. When incremental output is disabled, both values are identical.
+
+    Attributes:
+        frames (int): Number of frames written.
+        last_frame_bytes (int): Bytes written for the most recent frame.
+        last_full_frame_bytes (int): Bytes the full-frame path would have written for the most recent frame.
+        total_bytes (int): Total bytes written across all frames.
+        total_full_frame_bytes (int): Total bytes the full-frame path would have written across all frames.
+
+    """
+
+    frames: int = 0
+    last_frame_bytes: int = 0
+    last_full_frame_bytes: int = 0
+    total_bytes: int = 0
+    total_full_frame_bytes: int = 0
+
+    def record(self, frame_bytes: int, full_frame_bytes: int) -> None:
+        """Record the byte counts for a frame.
+
+        Args:
+            frame_bytes (int): Bytes written for the frame.
+            full_frame_bytes (int): Bytes the full-frame path would have written for the frame.
+
+        """
+        self.frames += 1
+        self.last_frame_bytes = frame_bytes
+        self.last_full_frame_bytes = full_frame_bytes
+        self.total_bytes += frame_bytes
+        self.total_full_frame_bytes += full_frame_bytes
+
+    @property
+    def savings_ratio(self) -> float:
+        """float: Fraction of full-frame bytes that were not written, from 0 (no savings) to 1."""
+        if not self.total_full_frame_bytes:
+            return 0.0
+        return 1 - (self.total_bytes / self.total_full_frame_bytes)
+
+
+class IncrementalRenderer:
+    """Produce terminal output containing only the cells that changed since the previous frame.
+
+    The first frame, and any frame whose dimensions differ from the previous frame, is written in full. Subsequent
+    frames are compared with the previous frame row by row. Rows with identical strings are skipped without parsing.
+    Changed rows are split into cells and compared cell by cell, and runs of changed cells are written after
+    positioning the cursor with relative row movement and absolute column addressing. Changed cells separated by
+    `merge_gap` or fewer unchanged cells are merged into a single run, as rewriting a few unchanged cells is
+    cheaper than repositioning the cursor. Rows containing non-ASCII symbols are positioned by display width, using
+    `cell_width()`, and are rewritten in full when the width of any cell changed.
+
+    The cursor is expected to be saved (DEC) on the row below the canvas, as done by `Terminal.prep_canvas()`. After
+    writing changes, the cursor is left at the end of the bottom canvas row, matching the full-frame output path.
+
+    Args:
+        canvas_rows (int): Number of rows between the top of the canvas and the saved cursor position.
+        merge_gap (int, optional): Maximum number of unchanged cells between two changed cells for them to be
+            written as a single run. Defaults to 4.
+
+    """
+
+    def __init__(self, canvas_rows: int, merge_gap: int = 4) -> None:
+        """Initialize the IncrementalRenderer.
+
+        Args:
+            canvas_rows (int): Number of rows between the top of the canvas and the saved cursor position.
+            merge_gap (int, optional): Maximum number of unchanged cells between two changed cells for them to be
+                written as a single run. Defaults to 4.
+
+        """
+        self.canvas_rows = canvas_rows
+        self.merge_gap = merge_gap
+        self._previous_rows: list[str] | None = None
+        self._previous_cells: list[list[Cell] | None] = []
+
+    def reset(self) -> None:
+        """Forget the previous frame so the next frame is written in full."""
+        self._previous_rows = None
+        self._previous_cells = []
+
+    def full_frame(self, frame: str) -> str:
+        """Return the full-frame output for a frame, positioned at the top of the canvas.
+
+        Args:
+            frame (str): The formatted frame.
+
+        Returns:
+            str: The output string.
+
+        """
+        return move_cursor_to_canvas_top(self.canvas_rows) + frame
+
+    def render(self, frame: str) -> str:
+        """Return the output required to update the terminal from the previous frame to the given frame.
+
+        Args:
+            frame (str): The formatted frame, with rows ordered top to bottom and separated by newlines.
+
+        Returns:
+            str: The output string. Empty if nothing changed.
+
+        """
+        rows = frame.split("\n")
+        previous_rows = self._previous_rows
+        self._previous_rows = rows
+        if previous_rows is None or len(previous_rows) != len(rows) or len(rows) != self.canvas_rows:
+            self._previous_cells = [None] * len(rows)
+            return self.full_frame(frame)
+
+        pieces: list[str] = []
+        cursor_row = self.canvas_rows
+        cursor_column = 0
+        for row_index, (previous_row, row) in enumerate(zip(previous_rows, rows)):
+            if previous_row == row:
+                continue
+            previous_cells = self._previous_cells[row_index] or parse_row_cells(previous_row)
+            cells = parse_row_cells(row)
+            self._previous_cells[row_index] = cells
+            if len(previous_cells) != len(cells):
+                self._previous_cells = [None] * len(rows)
+                return self.full_frame(frame)
+            if previous_row.isascii() and row.isascii():
+                columns = None
+                runs = self._changed_runs(previous_cells, cells)
+            else:
+                widths = [cell_width(symbol) for _, symbol in cells]
+                columns = list(itertools.accumulate(widths, initial=0))
+                if widths != [cell_width(symbol) for _, symbol in previous_cells]:
+                    # the cells after a width change have moved, so the whole row is rewritten
+                    runs = [(0, len(cells))]
+                else:
+                    runs = [
+                        (self._run_start(widths, start), end)
+                        for start, end in self._changed_runs(previous_cells, cells)
+                    ]
+            for start, end in runs:
+                if not pieces:
+                    pieces.append(ansitools.dec_restore_cursor_position())
+                if row_index < cursor_row:
+                    pieces.append(ansitools.move_cursor_up(cursor_row - row_index))
+                elif row_index > cursor_row:
+                    pieces.append(ansitools.move_cursor_down(row_index - cursor_row))
+                start_column = start if columns is None else columns[start]
+                if start_column != cursor_column:
+                    pieces.append(ansitools.move_cursor_to_column(start_column + 1))
+                pieces.append(encode_cells(cells[start:end]))
+                cursor_row = row_index
+                cursor_column = end if columns is None else columns[end]
+        if pieces:
+            bottom_row = self.canvas_rows - 1
+            if cursor_row != bottom_row:
+                pieces.append(ansitools.move_cursor_down(bottom_row - cursor_row))
+            bottom_row_width = self._row_width(bottom_row, rows[bottom_row])
+            if cursor_column != bottom_row_width:
+                pieces.append(ansitools.move_cursor_to_column(bottom_row_width + 1))
+        return "".join(pieces)
+
+    def _row_width(self, row_index: int, row: str) -> int:
+        """Return the number of terminal columns occupied by a row of the current frame.
+
+        Args:
+            row_index (int): Index of the row, from the top of the canvas.
+            row (str): The formatted row.
+
+        Returns:
+            int: The number of columns.
+
+        """
+        cells = self._previous_cells[row_index]
+        if cells is None:
+            cells = self._previous_cells[row_index] = parse_row_cells(row)
+        if row.isascii():
+            return len(cells)
+        return sum(cell_width(symbol) for _, symbol in cells)
+
+    @staticmethod
+    def _run_start(widths: list[int], start: int) -> int:
+        """Move the start of a run back to the nearest cell that occupies a column.
+
+        A combining mark cannot be written on its own, so a run starting with one also rewrites the cell it combines
+        with.
+
+        Args:
+            widths (list[int]): The width of each cell in the row.
+            start (int): The index of the first changed cell.
+
+        Returns:
+            int: The index of the first cell to write.
+
+        """
+        while start > 0 and not widths[start]:
+            start -= 1
+        return start
+
+    def _changed_runs(self, previous_cells: list[Cell], cells: list[Cell]) -> list[tuple[int, int]]:
+        """Return the runs of changed cells in a row as (start, end) column index pairs, end exclusive.
+
+        Args:
+            previous_cells (list[Cell]): The cells from the previous frame.
+            cells (list[Cell]): The cells from the current frame.
+
+        Returns:
+            list[tuple[int, int]]: The changed runs, with nearby runs merged.
+
+        """
+        runs: list[tuple[int, int]] = []
+        start = end = -1
+        for column, (previous_cell, cell) in enumerate(zip(previous_cells, cells)):
+            if previous_cell == cell:
+                continue
+            if start >= 0 and column - end <= self.merge_gap:
+                end = column + 1
+                continue
+            if start >= 0:
+                runs.append((start, end))
+            start, end = column, column + 1
+        if start >= 0:
+            runs.append((start, end))
+        return runs
+
+
+class FrameWriter:
+    """Write terminal output to stdout with a single write per frame.
+
+    When `sys.stdout` exposes a binary buffer, the pieces of a frame, including cursor control sequences, are encoded
+    into a reusable `bytearray` and written to the buffer in one call, bypassing the text layer. Partial writes are
+    continued until the whole frame is written. Streams without a binary buffer, such as `io.StringIO`, and writers
+    created with `use_binary=False`, write the joined pieces as text instead.
+
+    `sys.stdout` is looked up on every write, so redirecting stdout is respected.
+
+    Args:
+        use_binary (bool, optional): Whether to write to the binary buffer when one is available. Defaults to True
+            on platforms where the text layer does not translate newlines.
+
+    """
+
+    def __init__(self, *, use_binary: bool = os.linesep == "\n") -> None:
+        """Initialize the FrameWriter.
+
+        Args:
+            use_binary (bool, optional): Whether to write to the binary buffer when one is available. Defaults to
+                True on platforms where the text layer does not translate newlines.
+
+        """
+        self.use_binary = use_binary
+        self._buffer = bytearray()
+
+    def write(self, *pieces: str) -> None:
+        """Write the pieces of a frame to stdout and flush.
+
+        Args:
+            *pieces (str): Strings to write, in order.
+
+        """
+        stream = sys.stdout
+        binary = getattr(stream, "buffer", None) if self.use_binary else None
+        if binary is None:
+            stream.write("".join(pieces))
+            stream.flush()
+            return
+        # anything already written through the text layer must reach the terminal first
+        stream.flush()
+        encoding = stream.encoding or "utf-8"
+        errors = stream.errors or "strict"
+        buffer = self._buffer
+        buffer.clear()
+        for piece in pieces:
+            buffer += piece.encode(encoding, errors)
+        with memoryview(buffer) as view:
+            offset = 0
+            while offset < len(view):
+                try:
+                    written = binary.write(view[offset:])
+                except BlockingIOError as error:
+                    written = error.characters_written
+                offset += written or 0
+        binary.flush()
@@ -0,0 +1,370 @@
+"""Character tick scheduling, wall-clock frame scheduling and pipelined output for effect iterators.
+
+`CharacterScheduler` ticks the active characters of an effect each frame. Many active characters spend most of their
+ticks waiting, displaying an animation frame with a long duration or holding at the end of a path. The scheduler
+parks such characters until they next need attention and accounts for the skipped ticks in bulk.
+
+By default, an effect iterator enforces its frame rate by sleeping when a frame is produced early. When updating and
+formatting a frame takes longer than the frame budget, nothing makes up the difference and the animation slows down.
+
+`FrameScheduler` keeps an effect on a fixed wall-clock schedule instead. Each frame has a deadline. Frames produced
+early are held until their deadline. When the effect falls behind by one or more whole frames, the missed frames are
+simulated with `BaseEffectIterator.advance()`, which ticks the effect without formatting a frame, and are counted as
+dropped.
+
+Writing a frame can block for a long time on slow terminals and remote sessions. `BackgroundPrinter` prints frames
+from a dedicated writer thread, so the next frame is computed while the previous one is being written. Pending frames
+are held in a bounded queue. When the writer falls behind, the oldest pending frames are discarded in favour of the
+newest.
+
+Classes:
+    CharacterScheduler: Tick an effect's active characters, skipping ticks for characters that are idle.
+    FrameScheduler: Iterate an effect's frames on a deadline schedule, dropping frames when the effect falls behind.
+    BackgroundPrinter: Print frames to a terminal from a writer thread, coalescing to the newest frame when behind.
+"""
+
+from __future__ import annotations
+
+import collections
+import operator
+import threading
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from types import TracebackType
+
+    from terminaltexteffects.engine.base_character import EffectCharacter
+    from terminaltexteffects.engine.base_effect import BaseEffectIterator
+    from terminaltexteffects.engine.terminal import Terminal
+
+
+class CharacterScheduler:
+    """Tick an effect's active characters, skipping ticks for characters that are idle.
+
+    A tick is idle when it would only count down the duration of the current animation frame or the hold time at the
+    end of the active path: the character's appearance and position do not change and no events are triggered. After
+    each update, active characters with upcoming idle ticks are parked on a timing wheel, keyed by the tick at which
+    they next need attention. Parked characters are not ticked. When a parked character is woken, the ticks it skipped
+    are applied at once. A parked character is woken when its wake tick is reached, when it is removed from the active
+    set, or when its path, scene, appearance, coordinate, or registered events are changed.
+
+    Attributes:
+        tick_count (int): Number of updates run.
+
+    """
+
+    min_idle_ticks: typing.ClassVar[int] = 2
+
+    def __init__(self) -> None:
+        """Initialize the CharacterScheduler."""
+        self.tick_count = 0
+        self._parked: set[EffectCharacter] = set()
+        self._wheel: collections.defaultdict[int, list[EffectCharacter]] = collections.defaultdict(list)
+        # order in which characters are ticked during an update, and the position of the character being ticked
+        self._tick_order: tuple[EffectCharacter, ...] | None = None
+        self._tick_positions: dict[EffectCharacter, int] | None = None
+        self._tick_iterator: typing.Iterator[EffectCharacter] | None = None
+
+    def update(self, active_characters: set[EffectCharacter]) -> None:
+        """Tick the active characters that are not parked, then prune inactive characters and park idle characters.
+
+        Characters are ticked in the iteration order of `active_characters`, so the result is the same as ticking
+        every active character once with `EffectCharacter.tick()`. Inactive characters are removed from
+        `active_characters`.
+
+        Args:
+            active_characters (set[EffectCharacter]): The active characters of the effect.
+
+        """
+        parked = self._parked
+        if parked:
+            # parked characters stopped being ticked when they were removed from the active set
+            for character in parked - active_characters:
+                self.wake(character)
+            for character in self._wheel.pop(self.tick_count + 1, ()):
+                if character._scheduler is self and character._wake_tick == self.tick_count + 1:
+                    self.wake(character)
+        self.tick_count += 1
+        self._tick_order = tick_order = tuple(active_characters)
+        # the iterator is shared with wake(), which reads the tick position from the number of remaining characters
+        self._tick_iterator = tick_iterator = iter(tick_order)
+        try:
+            for character in tick_iterator:
+                if character._scheduler is None:
+                    character.tick()
+        finally:
+            self._tick_order = self._tick_positions = self._tick_iterator = None
+        inactive_characters = []
+        min_idle_ticks = self.min_idle_ticks
+        for character in active_characters - parked if parked else active_characters:
+            if not character.is_active:
+                inactive_characters.append(character)
+            elif character._idle_checks:
+                character._idle_checks -= 1
+                if (idle_ticks := character._idle_ticks()) >= min_idle_ticks:
+                    self._park(character, idle_ticks)
+        active_characters.difference_update(inactive_characters)
+
+    def wake(self, character: EffectCharacter) -> None:
+        """Apply the ticks skipped by a parked character and stop skipping its ticks.
+
+        A character woken during an update by another character is ticked in that update if it comes later in the
+        tick order. Otherwise, its tick for the update has passed and is counted as skipped.
+
+        Args:
+            character (EffectCharacter): The parked character to wake.
+
+        """
+        character._scheduler = None
+        character._idle_checks = 2
+        self._parked.discard(character)
+        last_tick = self.tick_count
+        if self._tick_order is not None and self._tick_iterator is not None:
+            if self._tick_positions is None:
+                self._tick_positions = {character: index for index, character in enumerate(self._tick_order)}
+            ticked_count = len(self._tick_order) - operator.length_hint(self._tick_iterator)
+            if self._tick_positions[character] >= ticked_count:
+                last_tick -= 1
+        if skipped_ticks := min(last_tick, character._wake_tick - 1) - character._idle_since:
+            character._skip_idle_ticks(skipped_ticks)
+
+    def _park(self, character: EffectCharacter, idle_ticks: int) -> None:
+        """Skip ticking a character for the given number of ticks.
+
+        Args:
+            character (EffectCharacter): The character to park.
+            idle_ticks (int): Number of upcoming idle ticks for the character.
+
+        """
+        character._scheduler = self
+        character._idle_since = self.tick_count
+        character._wake_tick = wake_tick = self.tick_count + idle_ticks + 1
+        self._parked.add(character)
+        self._wheel[wake_tick].append(character)
+
+
+class FrameScheduler:
+    """Iterate an effect's frames on a deadline schedule, dropping frames when the effect falls behind.
+
+    The scheduler takes over frame rate enforcement from the effect iterator. If the effect completes while missed
+    frames are being simulated, the final state of the effect is returned as the last frame rather than dropped.
+
+    Args:
+        effect_iterator (BaseEffectIterator): The effect iterator to schedule.
+        frame_rate (int | None, optional): Target frame rate in frames per second. `0` disables scheduling and frames
+            are returned as fast as they are produced. Defaults to the frame rate of the iterator's terminal config.
+        max_dropped_frames (int, optional): Maximum number of frames dropped in a row. When the effect is further
+            behind, the schedule is restarted from the current time instead of catching up. Defaults to 10.
+
+    Attributes:
+        effect_iterator (BaseEffectIterator): The effect iterator being scheduled.
+        dropped_frames (int): Number of frames that were simulated without being formatted or returned.
+
+    """
+
+    def __init__(
+        self,
+        effect_iterator: BaseEffectIterator,
+        frame_rate: int | None = None,
+        max_dropped_frames: int = 10,
+    ) -> None:
+        """Initialize the FrameScheduler.
+
+        Args:
+            effect_iterator (BaseEffectIterator): The effect iterator to schedule.
+            frame_rate (int | None, optional): Target frame rate in frames per second. `0` disables scheduling and
+                frames are returned as fast as they are produced. Defaults to the frame rate of the iterator's
+                terminal config.
+            max_dropped_frames (int, optional): Maximum number of frames dropped in a row. When the effect is
+                further behind, the schedule is restarted from the current time instead of catching up.
+                Defaults to 10.
+
+        """
+        self.effect_iterator = effect_iterator
+        if frame_rate is None:
+            frame_rate = effect_iterator.terminal.config.frame_rate
+        self._frame_delay = 1 / frame_rate if frame_rate else 0.0
+        self.max_dropped_frames = max_dropped_frames
+        self.dropped_frames = 0
+        self._deadline: float | None = None
+        self._completed = False
+        # the scheduler enforces the frame rate, so the iterator must not sleep as well
+        effect_iterator.terminal._frame_rate = 0
+
+    def __iter__(self) -> FrameScheduler:
+        """Return this scheduler instance.
+
+        Returns:
+            FrameScheduler: This scheduler.
+
+        """
+        return self
+
+    def __next__(self) -> str:
+        """Return the next frame once its deadline is reached, first simulating any frames that were missed.
+
+        Raises:
+            StopIteration: The effect has completed.
+
+        Returns:
+            str: The next frame of the effect.
+
+        """
+        if self._completed:
+            raise StopIteration
+        if not self._frame_delay:
+            return next(self.effect_iterator)
+        now = time.monotonic()
+        if self._deadline is None:
+            self._deadline = now
+        missed_frames = int((now - self._deadline) / self._frame_delay)
+        if missed_frames > self.max_dropped_frames:
+            missed_frames = self.max_dropped_frames
+            self._deadline = now - missed_frames * self._frame_delay
+        dropped = 0
+        effect_completed = False
+        for _ in range(missed_frames):
+            if not self.effect_iterator.advance():
+                effect_completed = True
+                break
+            dropped += 1
+            self._deadline += self._frame_delay
+        if not effect_completed:
+            try:
+                frame = next(self.effect_iterator)
+            except StopIteration:
+                effect_completed = True
+        if effect_completed:
+            if not dropped:
+                raise StopIteration
+            # the last simulated frame is the final state of the effect, which has not been shown yet
+            self._completed = True
+            self.dropped_frames += dropped - 1
+            return self.effect_iterator.terminal.get_formatted_output_string()
+        self.dropped_frames += dropped
+        if (remaining := self._deadline - time.monotonic()) > 0:
+            time.sleep(remaining)
+        self._deadline += self._frame_delay
+        return frame
+
+
+class BackgroundPrinter:
+    """Print frames to a terminal from a writer thread, coalescing to the newest frame when the writer falls behind.
+
+    Frames passed to `print()` are queued and printed with `Terminal.print()` on a daemon thread. At most
+    `max_pending_frames` frames are queued. Queueing a frame while the queue is full discards the oldest pending frame.
+    Discarded frames are counted in `coalesced_frames`. On normal exit, the writer prints every pending frame before
+    the printer is closed. On exit due to an exception, pending frames are discarded. An exception raised by the
+    writer thread is re-raised on the next call to `print()` or `close()`.
+
+    The printer is used as a context manager:
+
+        with BackgroundPrinter(terminal) as printer:
+            for frame in effect:
+                printer.print(frame)
+
+    Args:
+        terminal (Terminal): The terminal to print frames with.
+        max_pending_frames (int, optional): Maximum number of frames waiting to be printed. Defaults to 2.
+
+    Attributes:
+        terminal (Terminal): The terminal frames are printed with.
+        coalesced_frames (int): Number of frames discarded because the writer fell behind.
+
+    """
+
+    def __init__(self, terminal: Terminal, max_pending_frames: int = 2) -> None:
+        """Initialize the BackgroundPrinter.
+
+        Args:
+            terminal (Terminal): The terminal to print frames with.
+            max_pending_frames (int, optional): Maximum number of frames waiting to be printed. Defaults to 2.
+
+        """
+        self.terminal = terminal
+        self.coalesced_frames = 0
+        self._pending: collections.deque[str] = collections.deque(maxlen=max_pending_frames)
+        self._condition = threading.Condition()
+        self._closed = False
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._write_frames, name="tte-writer", daemon=True)
+
+    def __enter__(self) -> BackgroundPrinter:
+        """Start the writer thread.
+
+        Returns:
+            BackgroundPrinter: This printer.
+
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the writer thread, printing pending frames unless an exception is propagating."""
+        self.close(discard_pending=exc_type is not None)
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self._thread.start()
+
+    def print(self, frame: str) -> None:
+        """Queue a frame to be printed by the writer thread.
+
+        Args:
+            frame (str): The frame to print.
+
+        """
+        with self._condition:
+            self._raise_writer_error()
+            if len(self._pending) == self._pending.maxlen:
+                self.coalesced_frames += 1
+            self._pending.append(frame)
+            self._condition.notify()
+
+    def close(self, *, discard_pending: bool = False) -> None:
+        """Stop the writer thread and wait for it to finish.
+
+        Args:
+            discard_pending (bool, optional): Discard frames that have not been printed yet instead of printing them.
+                Defaults to False.
+
+        """
+        with self._condition:
+            if discard_pending:
+                self._pending.clear()
+            self._closed = True
+            self._condition.notify()
+        if self._thread.is_alive():
+            self._thread.join()
+        with self._condition:
+            self._raise_writer_error()
+
+    def _raise_writer_error(self) -> None:
+        """Re-raise an exception raised by the writer thread, once."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _write_frames(self) -> None:
+        """Print queued frames until the printer is closed and the queue is empty."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                frame = self._pending.popleft()
+            try:
+                self.terminal.print(frame)
+            except BaseException as error:  # noqa: BLE001
+                with self._condition:
+                    self._error = error
+                    self._pending.clear()
+                    self._closed = True
+                return
@@ -9,6 +9,7 @@ Classes:
 
 from __future__ import annotations
 
+import bisect
 import random
 import re
 import shutil
@@ -20,6 +21,14 @@ from typing import Literal
 
 from terminaltexteffects.engine.base_character import EffectCharacter
 from terminaltexteffects.engine.base_config import BaseConfig
+from terminaltexteffects.engine.renderer import (
+    FrameBuffer,
+    FrameWriter,
+    IncrementalRenderer,
+    OutputStats,
+    byte_length,
+    move_cursor_to_canvas_top,
+)
 from terminaltexteffects.utils import ansitools, argutils
 from terminaltexteffects.utils.argutils import CharacterGroup, CharacterSort, ColorSort
 from terminaltexteffects.utils.exceptions import (
@@ -67,6 +76,13 @@ class TerminalConfig(BaseConfig):
             position of the previous canvas.
         no_eol (bool): Suppress the trailing newline emitted when an effect animation completes.
         no_restore_cursor (bool): Do not restore cursor visibility when an effect animation completes.
+        incremental_output (bool): Write only the cells that changed since the previous frame instead of the full
+            frame. Reduces the bytes written per frame, which helps over SSH, tmux, and other bandwidth-limited
+            links.
+        frame_skip (bool): Keep the animation on wall-clock time by dropping frames when updating and formatting
+            frames falls behind the frame rate.
+        threaded_output (bool): Write frames to the terminal from a background thread so the effect keeps updating
+            while output is blocked on a slow terminal. When output falls behind, only the newest frames are written.
 
     """
 
@@ -253,6 +269,48 @@ class TerminalConfig(BaseConfig):
     )  # pyright: ignore[reportAssignmentType]
     ("bool : Do not restore cursor visibility after the effect.")
 
+    incremental_output: bool = argutils.ArgSpec(
+        name="--incremental-output",
+        default=False,
+        action="store_true",
+        help=(
+            "Write only the cells that changed since the previous frame instead of redrawing the full canvas. "
+            "Reduces output size over SSH, tmux, and other bandwidth-limited links."
+        ),
+    )  # pyright: ignore[reportAssignmentType]
+    (
+        "bool : Write only the cells that changed since the previous frame instead of redrawing the full canvas. "
+        "Reduces output size over SSH, tmux, and other bandwidth-limited links."
+    )
+
+    frame_skip: bool = argutils.ArgSpec(
+        name="--frame-skip",
+        default=False,
+        action="store_true",
+        help=(
+            "Keep the animation on wall-clock time by dropping frames when the effect cannot keep up with the frame "
+            "rate. Dropped frames are simulated but not drawn."
+        ),
+    )  # pyright: ignore[reportAssignmentType]
+    (
+        "bool : Keep the animation on wall-clock time by dropping frames when the effect cannot keep up with the "
+        "frame rate. Dropped frames are simulated but not drawn."
+    )
+
+    threaded_output: bool = argutils.ArgSpec(
+        name="--threaded-output",
+        default=False,
+        action="store_true",
+        help=(
+            "Write frames to the terminal from a background thread so the effect keeps updating while output is "
+            "blocked on a slow terminal. When output falls behind, only the newest frames are written."
+        ),
+    )  # pyright: ignore[reportAssignmentType]
+    (
+        "bool : Write frames to the terminal from a background thread so the effect keeps updating while output is "
+        "blocked on a slow terminal. When output falls behind, only the newest frames are written."
+    )
+
 
 @dataclass
 class Canvas:
@@ -399,7 +457,8 @@ class Canvas:
                 current_coord.row + row_delta,
             )
             character._input_coord = anchored_coord
-            character.motion.set_coordinate(anchored_coord)
+            if character._motion is not None:
+                character._motion.set_coordinate(anchored_coord)
 
         characters = [character for character in characters if self.coord_is_in_canvas(character.input_coord)]
 
@@ -517,12 +576,15 @@ class Terminal:
         config (TerminalConfig): Configuration for the terminal.
         canvas (Canvas): The canvas in the terminal.
         character_by_input_coord (dict[Coord, EffectCharacter]): Mapping of input and fill characters keyed by
-            canvas coordinates. Characters created with `add_character()` are tracked separately.
+            canvas coordinates. Characters created with `add_character()` are tracked separately. Fill characters
+            are created when first requested, accessing the mapping creates all of them.
         terminal_state (list[str]): Internal row-by-row representation of the currently visible terminal output.
         visible_top (int): Top visible row within the terminal after canvas anchoring is applied.
         visible_bottom (int): Bottom visible row within the terminal after canvas anchoring is applied.
         visible_right (int): Rightmost visible column within the terminal after canvas anchoring is applied.
         visible_left (int): Leftmost visible column within the terminal after canvas anchoring is applied.
+        output_stats (OutputStats): Bytes written by `print()` for the most recent frame and in total, alongside
+            the bytes the full-frame output path would have written.
 
     Methods:
         get_piped_input:
@@ -591,14 +653,33 @@ class Terminal:
             if character.input_coord.row <= self.canvas.top and character.input_coord.column <= self.canvas.right
         ]
         self._added_characters: list[EffectCharacter] = []
-        self.character_by_input_coord: dict[Coord, EffectCharacter] = {
+        self._character_by_input_coord: dict[Coord, EffectCharacter] = {
             (character.input_coord): character for character in self._input_characters
         }
-        self._inner_fill_characters, self._outer_fill_characters = self._make_fill_characters()
-        self._setup_character_neighbors()
+        # fill characters are created on first access, with the IDs they would have if all were created up front
+        self._fill_character_id_start = self._next_character_id
+        self._occupied_cell_indices = sorted(
+            self._cell_index(coord.column, coord.row) for coord in self._character_by_input_coord
+        )
+        self._next_character_id += self.canvas.top * self.canvas.right - len(self._occupied_cell_indices)
+        self._fill_characters: dict[bool, list[EffectCharacter]] = {}
+        for character in self._input_characters:
+            character._resolve_neighbors = self._get_character_neighbors
         self._visible_characters: set[EffectCharacter] = set()
+        self._frame_buffer = FrameBuffer(
+            self.visible_top,
+            self.visible_right,
+            self.canvas_row_offset,
+            self.canvas_column_offset,
+            bottom=self.visible_bottom,
+            left=self.visible_left,
+        )
         self._frame_rate = self.config.frame_rate
         self._last_time_printed = time.monotonic()
+        self._incremental_renderer = IncrementalRenderer(self.visible_top) if self.config.incremental_output else None
+        self.output_stats = OutputStats()
+        self._frame_writer = FrameWriter()
+        self.terminal_state: list[str] = self._frame_buffer.rows
         self._update_terminal_state()
 
     def _preprocess_input_data(self, input_data: str) -> list[list[EffectCharacter]]:  # noqa: PLR0915
@@ -763,21 +844,21 @@ class Terminal:
             """Build an input character with the current terminal configuration and input colors."""
             character = EffectCharacter(self._next_character_id, symbol, 0, 0)
             self._next_character_id += 1
+            character._terminal_config = self.config
             for sequence_type, sequence in active_sequences.items():
                 color = active_colors[sequence_type]
                 if sequence and color:
-                    character._input_ansi_sequences[sequence_type] = sequence
+                    character._input_ansi_sequences = {**character._input_ansi_sequences, sequence_type: sequence}
                     self._input_colors_frequency[color] = self._input_colors_frequency.get(color, 0) + 1
                     if sequence_type == "fg_color":
                         character.animation.input_fg_color = color
                     else:
                         character.animation.input_bg_color = color
-            character.animation.input_bold = active_styles["bold"]
-            character.animation.no_color = self.config.no_color
-            character.animation.use_xterm_colors = self.config.xterm_colors
-            character.animation.existing_color_handling = self.config.existing_color_handling
+            # the animation is only created for characters with input colors or styles, or when they are applied
+            if active_styles["bold"]:
+                character.animation.input_bold = True
             character.uses_input_preexisting_colors = True
-            if character.animation.existing_color_handling == "always":
+            if self.config.existing_color_handling == "always":
                 character.animation.set_appearance(character.input_symbol)
             return character
 
@@ -851,8 +932,10 @@ class Terminal:
                         {"bold": False},
                     )
                 character_line.append(character)
-            while character_line and character_line[-1].input_symbol == " " and not any(
-                (character_line[-1].animation.input_fg_color, character_line[-1].animation.input_bg_color),
+            while (
+                character_line
+                and character_line[-1].input_symbol == " "
+                and not character_line[-1]._has_input_colors()
             ):
                 character_line.pop()
             characters.append(character_line)
@@ -1005,57 +1088,111 @@ class Terminal:
         for row, line in enumerate(formatted_lines):
             for column, character in enumerate(line, start=1):
                 character._input_coord = Coord(column, input_height - row)
-                if character._input_symbol != " " or any(
-                    (character.animation.input_fg_color, character.animation.input_bg_color),
-                ):
+                if character._input_symbol != " " or character._has_input_colors():
                     input_characters.append(character)
 
         anchored_characters = self.canvas._anchor_text(input_characters, self.config.anchor_text)
         return [char for char in anchored_characters if self.canvas.coord_is_in_canvas(char._input_coord)]
 
-    def _make_fill_characters(self) -> tuple[list[EffectCharacter], list[EffectCharacter]]:
-        """Create fill characters for unoccupied canvas coordinates.
+    @property
+    def character_by_input_coord(self) -> dict[Coord, EffectCharacter]:
+        """Mapping of input and fill characters keyed by canvas coordinates.
+
+        Accessing the mapping creates every fill character. Use `get_character_by_input_coord()` to look up
+        individual coordinates.
+        """
+        self._get_fill_characters(inner=True)
+        self._get_fill_characters(inner=False)
+        return self._character_by_input_coord
+
+    @property
+    def _inner_fill_characters(self) -> list[EffectCharacter]:
+        """Fill characters within the anchored text bounds, in row-major order."""
+        return self._get_fill_characters(inner=True)
+
+    @property
+    def _outer_fill_characters(self) -> list[EffectCharacter]:
+        """Fill characters outside the anchored text bounds, in row-major order."""
+        return self._get_fill_characters(inner=False)
+
+    def _cell_index(self, column: int, row: int) -> int:
+        """Return the row-major index of a canvas cell, counting from the bottom left cell."""
+        return (row - 1) * self.canvas.right + column - 1
+
+    def _make_fill_character(self, column: int, row: int) -> EffectCharacter:
+        """Create the fill character for an unoccupied canvas coordinate.
+
+        The character ID is the one the character would have if fill characters were created for every unoccupied
+        coordinate in row-major order, so IDs do not depend on the order in which fill characters are requested.
+
+        Args:
+            column (int): The column of the coordinate.
+            row (int): The row of the coordinate.
+
+        Returns:
+            EffectCharacter: The fill character.
+
+        """
+        cell_index = self._cell_index(column, row)
+        character_id = (
+            self._fill_character_id_start + cell_index - bisect.bisect_left(self._occupied_cell_indices, cell_index)
+        )
+        fill_char = EffectCharacter(character_id, " ", column, row)
+        fill_char.is_fill_character = True
+        fill_char._terminal_config = self.config
+        fill_char.uses_input_preexisting_colors = False
+        fill_char._resolve_neighbors = self._get_character_neighbors
+        self._character_by_input_coord[fill_char.input_coord] = fill_char
+        return fill_char
+
+    def _get_fill_characters(self, *, inner: bool) -> list[EffectCharacter]:
+        """Return the inner or outer fill characters, creating any that have not been requested yet.
 
-        Fill characters use a space as `input_symbol` and are inserted into
-        `character_by_input_coord` for any canvas coordinate not already occupied by an
-        input character. They are split into inner and outer fill characters based on
-        whether the coordinate falls within the anchored text bounds.
+        Fill characters use a space as `input_symbol` and occupy every canvas coordinate not occupied by an input
+        character. They are split into inner and outer fill characters based on whether the coordinate falls
+        within the anchored text bounds.
+
+        Args:
+            inner (bool): Whether to return the inner fill characters rather than the outer fill characters.
 
         Returns:
-            tuple[list[EffectCharacter], list[EffectCharacter]]: Lists of inner and outer
-                fill characters.
+            list[EffectCharacter]: The fill characters, in row-major order from the bottom left coordinate.
 
         """
-        inner_fill_characters = []
-        outer_fill_characters = []
-        for row in range(1, self.canvas.top + 1):
-            for column in range(1, self.canvas.right + 1):
-                coord = Coord(column, row)
-                if coord not in self.character_by_input_coord:
-                    fill_char = EffectCharacter(self._next_character_id, " ", column, row)
-                    fill_char.is_fill_character = True
-                    fill_char.animation.no_color = self.config.no_color
-                    fill_char.animation.use_xterm_colors = self.config.xterm_colors
-                    fill_char.animation.existing_color_handling = self.config.existing_color_handling
-                    fill_char.uses_input_preexisting_colors = False
-                    self.character_by_input_coord[coord] = fill_char
-                    self._next_character_id += 1
-                    if (
+        fill_characters = self._fill_characters.get(inner)
+        if fill_characters is None:
+            fill_characters = self._fill_characters[inner] = []
+            for row in range(1, self.canvas.top + 1):
+                for column in range(1, self.canvas.right + 1):
+                    is_inner = (
                         self.canvas.text_left <= column <= self.canvas.text_right
                         and self.canvas.text_bottom <= row <= self.canvas.text_top
-                    ):
-                        inner_fill_characters.append(fill_char)
-                    else:
-                        outer_fill_characters.append(fill_char)
-        return inner_fill_characters, outer_fill_characters
+                    )
+                    if is_inner is not inner:
+                        continue
+                    fill_char = self._character_by_input_coord.get(Coord(column, row))
+                    if fill_char is None:
+                        fill_char = self._make_fill_character(column, row)
+                    elif not fill_char.is_fill_character:
+                        continue
+                    fill_characters.append(fill_char)
+        return fill_characters
+
+    def _get_character_neighbors(self, character: EffectCharacter) -> dict[str, EffectCharacter | None]:
+        """Return the characters adjacent to a character in `character_by_input_coord`, keyed by direction.
+
+        Args:
+            character (EffectCharacter): The character whose neighbors are returned.
+
+        Returns:
+            dict[str, EffectCharacter | None]: The adjacent characters, or None where there is no character.
 
-    def _setup_character_neighbors(self) -> None:
-        """Create the neighbor map for characters tracked in `character_by_input_coord`."""
-        delta_map = {"north": (0, 1), "east": (1, 0), "south": (0, -1), "west": (-1, 0)}
-        for coord, char in self.character_by_input_coord.items():
-            for direction, delta in delta_map.items():
-                neighbor_coord = Coord(column=coord.column + delta[0], row=coord.row + delta[1])
-                char.neighbors[direction] = self.character_by_input_coord.get(neighbor_coord)
+        """
+        coord = character.input_coord
+        return {
+            direction: self.get_character_by_input_coord(Coord(coord.column + delta[0], coord.row + delta[1]))
+            for direction, delta in (("north", (0, 1)), ("east", (1, 0)), ("south", (0, -1)), ("west", (-1, 0)))
+        }
 
     def add_character(self, symbol: str, coord: Coord) -> EffectCharacter:
         """Add a character to the terminal for printing.
@@ -1075,9 +1212,7 @@ class Terminal:
 
         """
         character = EffectCharacter(self._next_character_id, symbol, coord.column, coord.row)
-        character.animation.no_color = self.config.no_color
-        character.animation.use_xterm_colors = self.config.xterm_colors
-        character.animation.existing_color_handling = self.config.existing_color_handling
+        character._terminal_config = self.config
         character.uses_input_preexisting_colors = False
 
         self._added_characters.append(character)
@@ -1323,7 +1458,8 @@ class Terminal:
 
         Lookup is limited to characters stored in `character_by_input_coord`, which
         includes input and fill characters but not characters added through
-        `add_character()`.
+        `add_character()`. The fill character at the coordinate is created if it does
+        not exist yet.
 
         Args:
             coord (Coord): input coordinates of the character
@@ -1332,7 +1468,10 @@ class Terminal:
             EffectCharacter | None: the character at the specified coordinates, or None if no character is found
 
         """
-        return self.character_by_input_coord.get(coord, None)
+        character = self._character_by_input_coord.get(coord)
+        if character is None and self.canvas.coord_is_in_canvas(coord):
+            character = self._make_fill_character(coord.column, coord.row)
+        return character
 
     def set_character_visibility(self, character: EffectCharacter, is_visible: bool) -> None:  # noqa: FBT001
         """Set whether a character participates in terminal rendering.
@@ -1348,8 +1487,10 @@ class Terminal:
         character._is_visible = is_visible
         if is_visible:
             self._visible_characters.add(character)
+            self._frame_buffer.add(character)
         else:
             self._visible_characters.discard(character)
+            self._frame_buffer.remove(character)
 
     def get_formatted_output_string(self) -> str:
         """Get the formatted output string based on the current terminal state.
@@ -1362,24 +1503,19 @@ class Terminal:
 
         """
         self._update_terminal_state()
-        return "\n".join(self.terminal_state[::-1])
+        return self._frame_buffer.output
 
     def _update_terminal_state(self) -> None:
-        """Rebuild the internal representation of the visible terminal state.
+        """Bring the internal representation of the visible terminal state up to date.
 
-        A blank buffer covering the visible terminal area is created, then visible
-        characters are rendered into it in ascending layer order using their current
-        motion coordinates adjusted by the canvas offsets. Characters outside the visible
-        bounds are skipped.
+        Visible characters are tracked in a persistent frame buffer, bucketed by row and
+        layer, which is notified when a character's coordinate, layer, or visual changes.
+        Only rows affected by those changes are rebuilt, rendering characters in ascending
+        layer order using their current motion coordinates adjusted by the canvas offsets.
+        Characters outside the visible bounds are skipped.
         """
-        rows = [[" " for _ in range(self.visible_right)] for _ in range(self.visible_top)]
-        for character in sorted(self._visible_characters, key=lambda c: c.layer):
-            row = character.motion.current_coord.row + self.canvas_row_offset
-            column = character.motion.current_coord.column + self.canvas_column_offset
-            if self.visible_bottom <= row <= self.visible_top and self.visible_left <= column <= self.visible_right:
-                rows[row - 1][column - 1] = character.animation.current_character_visual.formatted_symbol
-        terminal_state = ["".join(row) for row in rows]
-        self.terminal_state = terminal_state
+        if self._frame_buffer.refresh():
+            self.terminal_state = self._frame_buffer.rows
 
     def prep_canvas(self) -> None:
         """Prepare the terminal for the effect.
@@ -1394,12 +1530,12 @@ class Terminal:
         Note: Use of `config.reuse_canvas` is less predictable if other canvas dimension
         options differ between the last run and the current run.
         """
-        sys.stdout.write(ansitools.hide_cursor())
+        pieces = [ansitools.hide_cursor()]
         if self.config.reuse_canvas:
-            self.move_cursor_to_top()
-        for _ in range(self.visible_top):
-            sys.stdout.write((" " * self.visible_right) + "\n")
-        sys.stdout.write(ansitools.dec_save_cursor_position())
+            pieces.append(move_cursor_to_canvas_top(self.visible_top))
+        pieces.append(((" " * self.visible_right) + "\n") * self.visible_top)
+        pieces.append(ansitools.dec_save_cursor_position())
+        self._frame_writer.write(*pieces)
 
     def restore_cursor(self, end_symbol: str = "\n") -> None:
         """Restore cursor visibility when enabled and write the configured end symbol.
@@ -1414,23 +1550,35 @@ class Terminal:
         """
         if self.config.no_eol:
             end_symbol = ""
-        if not self.config.no_restore_cursor:
-            sys.stdout.write(ansitools.show_cursor())
-        sys.stdout.write(end_symbol)
+        cursor_visibility = "" if self.config.no_restore_cursor else ansitools.show_cursor()
+        self._frame_writer.write(cursor_visibility, end_symbol)
 
     def print(self, output_string: str) -> None:
         """Print the provided output string at the top of the current canvas.
 
         The cursor is restored to the saved canvas position, moved to the top of the
-        canvas, and the output string is written to stdout.
+        canvas, and the output string is written to stdout. The cursor movement and the
+        frame are sent to the terminal in a single write.
+
+        If `config.incremental_output` is `True`, the output string is compared with the
+        previously printed string and only the changed cells are written, using cursor
+        addressing to reach each run of changes. The first frame is always written in full.
+
+        The bytes written are recorded in `output_stats`.
 
         Args:
             output_string (str): The string to print.
 
         """
-        self.move_cursor_to_top()
-        sys.stdout.write(output_string)
-        sys.stdout.flush()
+        cursor_prefix = move_cursor_to_canvas_top(self.visible_top)
+        full_frame_bytes = len(cursor_prefix) + byte_length(output_string)
+        if self._incremental_renderer is None:
+            self.output_stats.record(full_frame_bytes, full_frame_bytes)
+            self._frame_writer.write(cursor_prefix, output_string)
+        else:
+            output = self._incremental_renderer.render(output_string)
+            self.output_stats.record(byte_length(output), full_frame_bytes)
+            self._frame_writer.write(output)
 
     def enforce_framerate(self) -> None:
         """Enforce the frame rate set in the terminal config.
@@ -1451,6 +1599,4 @@ class Terminal:
         The saved cursor position is restored, immediately saved again as the current
         canvas origin, and then the cursor is moved up by the visible canvas height.
         """
-        sys.stdout.write(ansitools.dec_restore_cursor_position())
-        sys.stdout.write(ansitools.dec_save_cursor_position())
-        sys.stdout.write(ansitools.move_cursor_up(self.visible_top))
+        self._frame_writer.write(move_cursor_to_canvas_top(self.visible_top))
@@ -10,6 +10,7 @@ Functions:
     hide_cursor() -> str: Hide the cursor.
     show_cursor() -> str: Show the cursor.
     move_cursor_up(y: int) -> str: Move the cursor up y lines.
+    move_cursor_down(y: int) -> str: Move the cursor down y lines.
     move_cursor_to_column(x: int) -> str: Move the cursor to the specified column.
     reset_all() -> str: Reset all formatting.
     apply_bold() -> str: Apply bold formatting.
@@ -114,6 +115,19 @@ def move_cursor_up(y: int) -> str:
     return f"\033[{y}A"
 
 
+def move_cursor_down(y: int) -> str:
+    """Move the cursor down by a relative number of rows.
+
+    Args:
+        y (int): Number of rows to move downward from the current cursor position.
+
+    Returns:
+        str: ANSI escape code
+
+    """
+    return f"\033[{y}B"
+
+
 def move_cursor_to_column(x: int) -> str:
     """Move the cursor to the specified 1-based column.
 
@@ -3,10 +3,24 @@
 Functions:
     fg(color_code: str | int) -> str: Set the foreground color using an XTerm code or RGB hex string.
     bg(color_code: str | int) -> str: Set the background color using an XTerm code or RGB hex string.
+    fg_parameters(color_code: str | int) -> str: Get the SGR parameters that set the foreground color.
+    bg_parameters(color_code: str | int) -> str: Get the SGR parameters that set the background color.
+    sgr(fg_color_code, bg_color_code, modes) -> str: Build one SGR sequence applying modes and colors.
+
+XTerm 256 color sequences are precomputed, and RGB hex color sequences are cached.
 """
 
 from __future__ import annotations
 
+import functools
+
+_XTERM_PARAMETERS: dict[int, tuple[str, ...]] = {
+    location: tuple(f"{location};5;{color_code}" for color_code in range(256)) for location in (38, 48)
+}
+_XTERM_SEQUENCES: dict[int, tuple[str, ...]] = {
+    location: tuple(f"\x1b[{parameters}m" for parameters in table) for location, table in _XTERM_PARAMETERS.items()
+}
+
 
 def _hex_to_int(hex_color: str) -> tuple[int, int, int]:
     """Convert a hex color string into an RGB integer tuple.
@@ -23,6 +37,56 @@ def _hex_to_int(hex_color: str) -> tuple[int, int, int]:
     return ints[0], ints[1], ints[2]
 
 
+@functools.lru_cache(maxsize=4096)
+def _rgb_parameters(hex_color: str, location: int) -> str:
+    """Return the SGR parameters to color the foreground/background of text with an RGB hex color.
+
+    Args:
+        hex_color (str): Hex color string in the range 000000 -> FFFFFF. '#' is optional.
+        location (int): ANSI SGR color selector, where `38` applies foreground color
+            and `48` applies background color.
+
+    Returns:
+        str: The SGR parameters for the color, e.g. `38;2;255;0;0`.
+
+    """
+    color_ints = _hex_to_int(hex_color)
+    return f"{location};2;{color_ints[0]};{color_ints[1]};{color_ints[2]}"
+
+
+def _color_parameters(color_code: str | int, location: int) -> str:
+    """Return the SGR parameters to color the foreground/background of text.
+
+    This is a helper function for _color(), fg_parameters() and bg_parameters().
+
+    Args:
+        color_code (str | int): The color code to be converted.
+        location (int): ANSI SGR color selector, where `38` applies foreground color
+            and `48` applies background color.
+
+    Returns:
+        str: The SGR parameters for the color, e.g. `38;5;196`.
+
+    Raises:
+        ValueError: If the color code is not in the range 000000 -> FFFFFF or 0 -> 255.
+
+    """
+    if isinstance(color_code, str):
+        return _rgb_parameters(color_code, location)
+    if isinstance(color_code, int):
+        if 0 <= color_code <= 255:
+            return _XTERM_PARAMETERS[location][color_code]
+        msg = f"Got color code ({color_code}): xterm color codes must be an integer: 0 <= n <= 255"
+        raise ValueError(msg)
+    msg = (
+        f"Got color code ({color_code}): Color must be either hex string #000000 -> #FFFFFF or"
+        f" int xterm color code 0 <= n <= 255"
+    )
+    raise TypeError(
+        msg,
+    )
+
+
 def _color(color_code: str | int, location: int) -> str:
     """Return an ANSI escape sequence to color the foreground/background of text.
 
@@ -40,23 +104,9 @@ def _color(color_code: str | int, location: int) -> str:
         ValueError: If the color code is not in the range 000000 -> FFFFFF or 0 -> 255.
 
     """
-    if isinstance(color_code, str):
-        color_ints = _hex_to_int(color_code)
-        sequence = f"\x1b[{location};2;{color_ints[0]};{color_ints[1]};{color_ints[2]}m"
-    elif isinstance(color_code, int):
-        if color_code not in range(256):
-            msg = f"Got color code ({color_code}): xterm color codes must be an integer: 0 <= n <= 255"
-            raise ValueError(msg)
-        sequence = f"\x1b[{location};5;{color_code}m"
-    else:
-        msg = (
-            f"Got color code ({color_code}): Color must be either hex string #000000 -> #FFFFFF or"
-            f" int xterm color code 0 <= n <= 255"
-        )
-        raise TypeError(
-            msg,
-        )
-    return sequence
+    if isinstance(color_code, int) and 0 <= color_code <= 255:
+        return _XTERM_SEQUENCES[location][color_code]
+    return f"\x1b[{_color_parameters(color_code, location)}m"
 
 
 def fg(color_code: str | int) -> str:
@@ -85,3 +135,62 @@ def bg(color_code: str | int) -> str:
 
     """
     return _color(color_code, 48)
+
+
+def fg_parameters(color_code: str | int) -> str:
+    """Get the SGR parameters that set the foreground color of the terminal text.
+
+    Args:
+        color_code (str | int): The foreground color as an XTerm 256 color code
+            or an RGB hex string, with or without a leading `#`.
+
+    Returns:
+        str: The SGR parameters, without the CSI introducer and final byte, e.g. `38;5;196`.
+
+    """
+    return _color_parameters(color_code, 38)
+
+
+def bg_parameters(color_code: str | int) -> str:
+    """Get the SGR parameters that set the background color of the terminal text.
+
+    Args:
+        color_code (str | int): The background color as an XTerm 256 color code
+            or an RGB hex string, with or without a leading `#`.
+
+    Returns:
+        str: The SGR parameters, without the CSI introducer and final byte, e.g. `48;5;196`.
+
+    """
+    return _color_parameters(color_code, 48)
+
+
+@functools.lru_cache(maxsize=4096)
+def sgr(
+    fg_color_code: str | int | None = None,
+    bg_color_code: str | int | None = None,
+    modes: tuple[int, ...] = (),
+) -> str:
+    """Build a single SGR sequence that applies the given modes and foreground/background colors.
+
+    Args:
+        fg_color_code (str | int | None, optional): The foreground color as an XTerm 256 color code
+            or an RGB hex string. Defaults to None.
+        bg_color_code (str | int | None, optional): The background color as an XTerm 256 color code
+            or an RGB hex string. Defaults to None.
+        modes (tuple[int, ...], optional): SGR mode parameters to apply before the colors, e.g. `(1, 4)` for
+            bold and underline. Defaults to ().
+
+    Returns:
+        str: The combined SGR sequence, e.g. `\x1b[1;38;5;196;48;5;16m`, or an empty string if there is
+            nothing to apply.
+
+    """
+    parameters = [str(mode) for mode in modes]
+    if fg_color_code is not None:
+        parameters.append(_color_parameters(fg_color_code, 38))
+    if bg_color_code is not None:
+        parameters.append(_color_parameters(bg_color_code, 48))
+    if not parameters:
+        return ""
+    return f"\x1b[{';'.join(parameters)}m"
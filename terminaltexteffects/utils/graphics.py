@@ -29,6 +29,10 @@ class Color:
     The color can be initialized with an XTerm-256 color code or an RGB hex color string. Can be printed
     to display the color code and appearance as a color block.
 
+    Colors are flyweights. Creating a `Color` with a color value that has already been used returns the existing
+    instance, so equal colors created anywhere in the process share one object and the color value is only parsed
+    and validated once. Colors must not be modified after creation.
+
     Attributes:
         color_arg (int | str): The color value as an XTerm-256 color code or an RGB hex color string.
         xterm_color (int | None): The XTerm-256 color code. None if the color is an RGB hex color string.
@@ -42,9 +46,32 @@ class Color:
 
     """
 
+    _interned: typing.ClassVar[dict[int | str, Color]] = {}
+    _interned_max_size: typing.ClassVar[int] = 65536
+    _initialized: bool = False
+
+    def __new__(cls, color_value: int | str) -> Color:
+        """Return the existing Color for the color value, or a new uninitialized Color.
+
+        Args:
+            color_value (int | str): The color value as an XTerm-256 color code or an RGB hex color string.
+
+        Returns:
+            Color: The Color instance.
+
+        """
+        if isinstance(color_value, str):
+            color_value = color_value.strip("#")
+        color = cls._interned.get(color_value)
+        if color is None:
+            color = super().__new__(cls)
+        return color
+
     def __init__(self, color_value: int | str) -> None:
         """Initialize a Color object.
 
+        Initialization is skipped for interned colors, which were initialized when first created.
+
         Args:
             color_value (int | str): The color value as an XTerm-256 color code or an RGB hex color string.
                 Example: 255 or 'ffffff' or '#ffffff'
@@ -53,6 +80,8 @@ class Color:
             ValueError: If the color value is not a valid XTerm-256 color code or an RGB hex color string.
 
         """
+        if self._initialized:
+            return
         if isinstance(color_value, str):
             color_value = color_value.strip("#")
         self.color_arg = color_value
@@ -72,6 +101,21 @@ class Color:
             raise ValueError(
                 msg,
             )
+        self._initialized = True
+        if len(Color._interned) < Color._interned_max_size:
+            Color._interned[color_value] = self
+
+    def __reduce__(self) -> tuple[type[Color], tuple[int | str]]:
+        """Return the arguments used to recreate the Color, so unpickled colors are interned."""
+        return Color, (self.color_arg,)
+
+    def __copy__(self) -> Color:
+        """Return this Color. Colors are shared and immutable."""
+        return self
+
+    def __deepcopy__(self, memo: dict[int, typing.Any]) -> Color:
+        """Return this Color. Colors are shared and immutable."""
+        return self
 
     @property
     def rgb_ints(self) -> tuple[int, int, int]:
@@ -262,6 +306,9 @@ class Gradient:
     def _generate(self, steps: int | tuple[int, ...]) -> list[Color]:
         """Calculate a gradient of colors between two colors using linear interpolation.
 
+        Spectra are cached by (stops, steps, loop), so gradients with the same configuration share their `Color`
+        objects and are only interpolated once. Each Gradient receives its own copy of the spectrum list.
+
         If there is only one color in the stops tuple, the gradient will be a list of the same color.
 
         If multiple steps are given, the gradient between pairs of colors will be equal to the number of steps
@@ -282,56 +329,11 @@ class Gradient:
                 colors are the start and end stops, respectively.
 
         """
-        if isinstance(steps, int):
-            steps = (steps,)
-            for step in steps:
-                if step < 1:
-                    msg = "Steps must be greater than 0."
-                    raise ValueError(msg)
-        spectrum: list[Color] = []
-        if len(self._stops) == 1:
-            color = self._stops[0]
-            spectrum.extend(color for _ in range(steps[0]))
-            return spectrum
-        if self._loop:
+        if not isinstance(steps, int):
+            steps = tuple(steps)
+        spectrum = list(_generate_spectrum(self._stops, steps, loop=self._loop))
+        if self._loop and len(self._stops) > 1:
             self._stops = (*self._stops, self._stops[0])
-        a, b = itertools.tee(self._stops)
-        next(b, None)
-        color_pairs = list(zip(a, b))
-        steps = steps[: len(color_pairs)]
-        if len(steps) < len(color_pairs):
-            steps = steps + (steps[-1],) * (len(color_pairs) - len(steps))
-        color_pair: tuple[Color, Color]
-        for color_pair, step_count in zip(color_pairs, steps):
-            if step_count < 1:
-                msg = f"Invalid steps: {step_count} | Steps must be greater than 0."
-                raise ValueError(msg)
-            start, end = color_pair
-            start_color_ints = start.rgb_ints
-            end_color_ints = end.rgb_ints
-            # Initialize an empty list to store the gradient colors
-            gradient_colors: list[Color] = []
-            # Calculate the color deltas for each RGB value
-            red_delta = (end_color_ints[0] - start_color_ints[0]) // step_count
-            green_delta = (end_color_ints[1] - start_color_ints[1]) // step_count
-            blue_delta = (end_color_ints[2] - start_color_ints[2]) // step_count
-            # Calculate the intermediate colors and add them to the gradient colors list
-            range_start = int(len(spectrum) > 0)  # if this is the first pair, add the start color to the spectrum
-            for i in range(range_start, max(step_count, 0)):
-                red = start_color_ints[0] + (red_delta * i)
-                green = start_color_ints[1] + (green_delta * i)
-                blue = start_color_ints[2] + (blue_delta * i)
-
-                # Ensure that the RGB values are within the valid range of 0-255
-                red = max(0, min(red, 255))
-                green = max(0, min(green, 255))
-                blue = max(0, min(blue, 255))
-
-                # Convert the RGB values to a hex color string and add it to the gradient colors list
-                gradient_colors.append(Color(f"{red:02x}{green:02x}{blue:02x}"))
-            # Add the end color to the gradient colors list
-            gradient_colors.append(end)
-            spectrum.extend(gradient_colors)
         return spectrum
 
     def build_coordinate_color_mapping(
@@ -429,6 +431,77 @@ class Gradient:
         )
 
 
+@functools.lru_cache(maxsize=1024)
+def _generate_spectrum(stops: tuple[Color, ...], steps: int | tuple[int, ...], *, loop: bool) -> tuple[Color, ...]:
+    """Calculate the spectrum for a gradient configuration using linear interpolation.
+
+    This is a helper function for Gradient._generate(), which documents the spectrum layout.
+
+    Args:
+        stops (tuple[Color, ...]): The color stops.
+        steps (int | tuple[int, ...]): Number of steps or a tuple of step values for each pair of stops.
+        loop (bool): Transition the final stop back to the first stop.
+
+    Returns:
+        tuple[Color, ...]: The generated spectrum.
+
+    Raises:
+        ValueError: If any step value is less than 1.
+
+    """
+    if isinstance(steps, int):
+        steps = (steps,)
+        for step in steps:
+            if step < 1:
+                msg = "Steps must be greater than 0."
+                raise ValueError(msg)
+    spectrum: list[Color] = []
+    if len(stops) == 1:
+        color = stops[0]
+        spectrum.extend(color for _ in range(steps[0]))
+        return tuple(spectrum)
+    if loop:
+        stops = (*stops, stops[0])
+    a, b = itertools.tee(stops)
+    next(b, None)
+    color_pairs = list(zip(a, b))
+    steps = steps[: len(color_pairs)]
+    if len(steps) < len(color_pairs):
+        steps = steps + (steps[-1],) * (len(color_pairs) - len(steps))
+    color_pair: tuple[Color, Color]
+    for color_pair, step_count in zip(color_pairs, steps):
+        if step_count < 1:
+            msg = f"Invalid steps: {step_count} | Steps must be greater than 0."
+            raise ValueError(msg)
+        start, end = color_pair
+        start_color_ints = start.rgb_ints
+        end_color_ints = end.rgb_ints
+        # Initialize an empty list to store the gradient colors
+        gradient_colors: list[Color] = []
+        # Calculate the color deltas for each RGB value
+        red_delta = (end_color_ints[0] - start_color_ints[0]) // step_count
+        green_delta = (end_color_ints[1] - start_color_ints[1]) // step_count
+        blue_delta = (end_color_ints[2] - start_color_ints[2]) // step_count
+        # Calculate the intermediate colors and add them to the gradient colors list
+        range_start = int(len(spectrum) > 0)  # if this is the first pair, add the start color to the spectrum
+        for i in range(range_start, max(step_count, 0)):
+            red = start_color_ints[0] + (red_delta * i)
+            green = start_color_ints[1] + (green_delta * i)
+            blue = start_color_ints[2] + (blue_delta * i)
+
+            # Ensure that the RGB values are within the valid range of 0-255
+            red = max(0, min(red, 255))
+            green = max(0, min(green, 255))
+            blue = max(0, min(blue, 255))
+
+            # Convert the RGB values to a hex color string and add it to the gradient colors list
+            gradient_colors.append(Color(f"{red:02x}{green:02x}{blue:02x}"))
+        # Add the end color to the gradient colors list
+        gradient_colors.append(end)
+        spectrum.extend(gradient_colors)
+    return tuple(spectrum)
+
+
 def random_color() -> Color:
     """Return a random `Color` created from a six-digit RGB hex value.
 
@@ -3,12 +3,18 @@ between RGB hex colors and XTerm-256 color codes.
 
 Functions:
     hex_to_xterm: Convert RGB Hex colors to their closest XTerm-256 color.
+    hex_colors_to_xterm: Convert a sequence of RGB Hex colors to their closest XTerm-256 colors.
     xterm_to_hex: Convert XTerm-256 color codes to RGB Hex colors.
     is_valid_color: Check if the input is a valid XTerm-256 or RGB hex color code.
 """
 
 from __future__ import annotations
 
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterable
+
 xterm_to_hex_map = {
     0: "#000000",
     1: "#800000",
@@ -271,11 +277,57 @@ xterm_to_hex_map = {
 xterm_to_rgb_map = {k: (int(v[1:3], 16), int(v[3:5], 16), int(v[5:7], 16)) for k, v in xterm_to_hex_map.items()}
 
 
+_CUBE_CELL_SIZE = 16
+_CUBE_CELLS_PER_AXIS = 256 // _CUBE_CELL_SIZE
+_xterm_palette: tuple[tuple[int, int, int, int], ...] = tuple((k, *v) for k, v in xterm_to_rgb_map.items())
+# Coarse RGB cube. Each cell holds, in palette order, the XTerm colors that can be nearest to some
+# color inside the cell. Cells are filled on first use.
+_xterm_cube: list[tuple[tuple[int, int, int, int], ...] | None] = [None] * _CUBE_CELLS_PER_AXIS**3
+_xterm_cache: dict[str, int] = {}
+_xterm_cache_max_size = 65536
+
+
+def _cube_candidates(cell: int) -> tuple[tuple[int, int, int, int], ...]:
+    """Return the XTerm colors that can be nearest to a color in the given cube cell.
+
+    A palette color is a candidate when its smallest possible distance to the cell does not exceed
+    the largest distance from the cell to the palette color that is closest in the worst case.
+
+    Args:
+        cell (int): index of the cell in the coarse cube
+
+    Returns:
+        tuple[tuple[int, int, int, int], ...]: (xterm code, red, green, blue) candidates in palette order
+
+    """
+    candidates = _xterm_cube[cell]
+    if candidates is not None:
+        return candidates
+    r_cell, remainder = divmod(cell, _CUBE_CELLS_PER_AXIS**2)
+    g_cell, b_cell = divmod(remainder, _CUBE_CELLS_PER_AXIS)
+    lows = (r_cell * _CUBE_CELL_SIZE, g_cell * _CUBE_CELL_SIZE, b_cell * _CUBE_CELL_SIZE)
+    highs = tuple(low + _CUBE_CELL_SIZE - 1 for low in lows)
+    min_distances = []
+    bound = float("inf")
+    for entry in _xterm_palette:
+        min_distance = max_distance = 0
+        for channel, low, high in zip(entry[1:], lows, highs):
+            min_distance += max(low - channel, 0, channel - high)
+            max_distance += max(channel - low, high - channel)
+        min_distances.append(min_distance)
+        bound = min(bound, max_distance)
+    candidates = tuple(entry for entry, distance in zip(_xterm_palette, min_distances) if distance <= bound)
+    _xterm_cube[cell] = candidates
+    return candidates
+
+
 def hex_to_xterm(hex_color: str) -> int:
     """Convert RGB Hex colors to their closest XTerm-256 color.
 
     Closeness is determined by the mean absolute difference across the red, green,
-    and blue channels.
+    and blue channels. Ties resolve to the lowest XTerm-256 color code. Results are
+    cached process-wide, and lookups only compare against the few palette colors
+    that can be nearest to the input's region of a coarse RGB cube.
 
     Args:
         hex_color (str): RGB Hex color code, '#' is optional
@@ -284,20 +336,40 @@ def hex_to_xterm(hex_color: str) -> int:
         int: (0-255) XTerm-256 color code
 
     """
+    cached = _xterm_cache.get(hex_color)
+    if cached is not None:
+        return cached
     # Strip '#' if present and convert hex to RGB
     color_string = hex_color.strip("#")
-    input_rgb = tuple(int(color_string[i : i + 2], 16) for i in range(0, 6, 2))
-
-    # Compute the differences between input color and each xterm color
-    min_diff = float("inf")
+    red, green, blue = (int(color_string[i : i + 2], 16) for i in range(0, 6, 2))
 
-    for xterm_color, xterm_rgb in xterm_to_rgb_map.items():
-        diff = sum(abs(input_rgb[i] - xterm_rgb[i]) for i in range(3)) / 3
+    cell = (
+        (red // _CUBE_CELL_SIZE) * _CUBE_CELLS_PER_AXIS + green // _CUBE_CELL_SIZE
+    ) * _CUBE_CELLS_PER_AXIS + blue // _CUBE_CELL_SIZE
+    min_diff = 766
+    closest_color = 0
+    for xterm_color, xterm_red, xterm_green, xterm_blue in _cube_candidates(cell):
+        diff = abs(red - xterm_red) + abs(green - xterm_green) + abs(blue - xterm_blue)
         if diff < min_diff:
             min_diff = diff
             closest_color = xterm_color
 
-    return closest_color  # type: ignore[unbound]
+    if len(_xterm_cache) < _xterm_cache_max_size:
+        _xterm_cache[hex_color] = closest_color
+    return closest_color
+
+
+def hex_colors_to_xterm(hex_colors: Iterable[str]) -> list[int]:
+    """Convert a sequence of RGB Hex colors, such as a gradient spectrum, to their closest XTerm-256 colors.
+
+    Args:
+        hex_colors (Iterable[str]): RGB Hex color codes, '#' is optional
+
+    Returns:
+        list[int]: (0-255) XTerm-256 color codes in input order
+
+    """
+    return [hex_to_xterm(hex_color) for hex_color in hex_colors]
 
 
 def xterm_to_hex(xterm_color: int) -> str:
@@ -2,7 +2,7 @@
 
 import pytest
 
-from terminaltexteffects.engine.animation import CharacterVisual, Frame, Scene
+from terminaltexteffects.engine.animation import CharacterVisual, Frame, Scene, SceneTemplate
 from terminaltexteffects.engine.base_character import EffectCharacter
 from terminaltexteffects.utils import easing
 from terminaltexteffects.utils.exceptions import (
@@ -73,12 +73,46 @@ def test_character_visual_init_default(character_visual_default: CharacterVisual
     assert character_visual_default.formatted_symbol == "a"
 
 
+def test_character_visual_interned_returns_shared_instance() -> None:
+    """Test that equal styles are interned to one shared visual with one style ID."""
+    first = CharacterVisual.interned("a", bold=True, colors=ColorPair(fg="ff0000"), fg_color_code="ff0000")
+    second = CharacterVisual.interned("a", bold=True, colors=ColorPair(fg="ff0000"), fg_color_code="ff0000")
+    assert first is second
+    assert first.style_id == second.style_id
+    assert first.formatted_symbol == "\x1b[1m\x1b[38;2;255;0;0ma\x1b[0m"
+
+
+def test_character_visual_interned_distinguishes_colors_from_color_codes() -> None:
+    """Test that visuals with the same color code but different source colors are not shared."""
+    xterm = CharacterVisual.interned("a", colors=ColorPair(fg=Color(196)), fg_color_code=196)
+    rgb = CharacterVisual.interned("a", colors=ColorPair(fg=Color("ff0000")), fg_color_code=196)
+    no_colors = CharacterVisual.interned("a")
+    empty_colors = CharacterVisual.interned("a", colors=ColorPair())
+    assert xterm is not rgb
+    assert xterm.style_id != rgb.style_id
+    assert no_colors.colors is None
+    assert empty_colors.colors == ColorPair()
+
+
+def test_character_visual_is_immutable(character_visual_default: CharacterVisual) -> None:
+    """Test that CharacterVisual attributes cannot be reassigned."""
+    with pytest.raises(AttributeError):
+        character_visual_default.symbol = "b"  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_scene_add_frame_shares_visuals() -> None:
+    """Test that frames with the same style reference the same visual."""
+    scene = Scene(scene_id="test_scene")
+    scene.add_frame("a", 1, colors=ColorPair(fg="00ff00"))
+    scene.add_frame("a", 2, colors=ColorPair(fg="00ff00"))
+    assert scene.frames[0].character_visual is scene.frames[1].character_visual
+
+
 def test_frame_init(character_visual_default: CharacterVisual) -> None:
     """Test that the Frame instance is correctly initialized."""
     frame = Frame(character_visual=character_visual_default, duration=5)
     assert frame.character_visual == character_visual_default
     assert frame.duration == 5
-    assert frame.ticks_elapsed == 0
 
 
 def test_scene_init() -> None:
@@ -157,7 +191,6 @@ def test_animation_init(character: EffectCharacter) -> None:
     assert character.animation.active_scene is None
     assert character.animation.use_xterm_colors is False
     assert character.animation.no_color is False
-    assert character.animation.xterm_color_map == {}
     assert character.animation.active_scene_current_step == 0
 
 
@@ -188,6 +221,56 @@ def test_animation_new_scene_id_generation_deleted_scene(character: EffectCharac
     character.animation.new_scene()
 
 
+def test_animation_new_scene_from_template_shares_frames() -> None:
+    """Test that scenes created from a template share its frames and keep their own playback state."""
+    template = SceneTemplate("test_scene", is_looping=True)
+    template.add_frame("a", 2, colors=ColorPair(fg="00ff00"))
+    template.add_frame("b", 1)
+    first = EffectCharacter(0, "a", 0, 0).animation.new_scene_from_template(template)
+    second = EffectCharacter(1, "a", 0, 0).animation.new_scene_from_template(template, scene_id="other")
+    assert first.scene_id == "test_scene"
+    assert second.scene_id == "other"
+    assert first.is_looping is True
+    assert first._frames is second._frames is template._frames
+    assert first.get_next_visual().symbol == "a"
+    assert first.get_next_visual().symbol == "a"
+    assert first.get_next_visual().symbol == "b"
+    assert second.get_next_visual().symbol == "a"
+    assert second.ticks_elapsed == 1
+
+
+def test_animation_new_scene_from_template_copies_frames_before_adding() -> None:
+    """Test that adding frames to a scene or its template does not change the other."""
+    template = SceneTemplate()
+    template.add_frame("a", 1)
+    scene = EffectCharacter(0, "a", 0, 0).animation.new_scene_from_template(template)
+    scene.add_frame("b", 1)
+    template.add_frame("c", 1)
+    assert [frame.character_visual.symbol for frame in scene.frames] == ["a", "b"]
+    assert [frame.character_visual.symbol for frame in template.frames] == ["a", "c"]
+    assert scene.easing_total_steps == 2
+
+
+def test_animation_new_scene_from_template_uses_preexisting_colors(character: EffectCharacter) -> None:
+    """Test that scenes created from a template apply the character's preexisting colors through a variant."""
+    character.animation.existing_color_handling = "always"
+    character.uses_input_preexisting_colors = True
+    character.animation.input_fg_color = Color("#ffffff")
+    character.animation.input_bold = True
+    template = SceneTemplate()
+    template.add_frame("a", 1, colors=ColorPair(fg="f0f0f0"))
+    scene = character.animation.new_scene_from_template(template)
+    other = EffectCharacter(1, "a", 0, 0)
+    other.animation.existing_color_handling = "always"
+    other.uses_input_preexisting_colors = True
+    other.animation.input_fg_color = Color("#ffffff")
+    other.animation.input_bold = True
+    assert scene.frames[0].character_visual.colors == ColorPair("#ffffff")
+    assert scene.frames[0].character_visual.bold is True
+    assert template.frames[0].character_visual.colors == ColorPair(fg="f0f0f0")
+    assert other.animation.new_scene_from_template(template)._frames is scene._frames
+
+
 def test_animation_query_scene(character: EffectCharacter) -> None:
     """Test that a scene can be queried from the animation."""
     animation = character.animation
@@ -546,6 +629,25 @@ def test_scene_get_next_visual_looping(character: EffectCharacter) -> None:
     assert visual.symbol == "a"
 
 
+def test_scene_get_next_visual_tracks_played_frames(character: EffectCharacter) -> None:
+    """Verify frames and played_frames reflect playback progress without changing the frames."""
+    new_scene = character.animation.new_scene(scene_id="test_scene", is_looping=True)
+    new_scene.add_frame(symbol="a", duration=2)
+    new_scene.add_frame(symbol="b", duration=1)
+    frame_a, frame_b = new_scene.frames
+    new_scene.get_next_visual()
+    assert new_scene.ticks_elapsed == 1
+    assert new_scene.frames == [frame_a, frame_b]
+    assert not new_scene.played_frames
+    new_scene.get_next_visual()
+    assert new_scene.ticks_elapsed == 0
+    assert new_scene.frames == [frame_b]
+    assert new_scene.played_frames == [frame_a]
+    new_scene.get_next_visual()
+    assert new_scene.frames == [frame_a, frame_b]
+    assert not new_scene.played_frames
+
+
 def test_scene_apply_gradient_to_symbols_empty_gradient(character: EffectCharacter) -> None:
     """Ensure empty gradient spectra trigger an error."""
     new_scene = character.animation.new_scene(scene_id="test_scene")
@@ -673,8 +775,8 @@ def test_scene_reset_scene(character: EffectCharacter) -> None:
     for _ in range(4):
         new_scene.get_next_visual()
     new_scene.reset_scene()
-    for sequence in new_scene.frames:
-        assert sequence.ticks_elapsed == 0
+    assert new_scene.ticks_elapsed == 0
+    assert len(new_scene.frames) == 2
     assert not new_scene.played_frames
 
 
@@ -317,6 +317,51 @@ def test_eventhandler_handle_event_deactivate_scene_with_id_target(eventhandler:
     assert eventhandler.character.animation.active_scene is None
 
 
+def test_eventhandler_handle_event_runs_actions_in_order(eventhandler: EventHandler) -> None:
+    """Test that all actions registered for an event are run in registration order."""
+    caller = eventhandler.character.motion.new_path(path_id="caller")
+    calls: list[str] = []
+    for name in ("first", "second"):
+        eventhandler.register_event(
+            EventHandler.Event.PATH_COMPLETE,
+            caller,
+            EventHandler.Action.CALLBACK,
+            EventHandler.Callback(lambda _, name: calls.append(name), name),
+        )
+    eventhandler.register_event(EventHandler.Event.PATH_COMPLETE, caller, EventHandler.Action.SET_LAYER, 3)
+    eventhandler._handle_event(EventHandler.Event.PATH_COMPLETE, caller)
+    assert calls == ["first", "second"]
+    assert eventhandler.character.layer == 3
+
+
+def test_eventhandler_handle_event_unregistered_is_noop(eventhandler: EventHandler) -> None:
+    """Test that handling an event without registered actions does nothing."""
+    caller = eventhandler.character.motion.new_path(path_id="caller")
+    eventhandler._handle_event(EventHandler.Event.PATH_COMPLETE, caller)
+    eventhandler.register_event(EventHandler.Event.PATH_ACTIVATED, caller, EventHandler.Action.SET_LAYER, 2)
+    eventhandler._handle_event(EventHandler.Event.PATH_COMPLETE, caller)
+    assert eventhandler.character.layer == 0
+
+
+def test_eventhandler_register_event_for_characters() -> None:
+    """Test registering the same event for many characters resolves IDs per character."""
+    characters = [EffectCharacter(i, "a", i + 1, 1) for i in range(3)]
+    for character in characters:
+        character.motion.new_path(path_id="caller")
+        character.animation.new_scene(scene_id="scene").add_frame("b", duration=1)
+    EventHandler.register_event_for_characters(
+        characters,
+        EventHandler.Event.PATH_COMPLETE,
+        "caller",
+        EventHandler.Action.ACTIVATE_SCENE,
+        "scene",
+    )
+    for character in characters:
+        caller = character.motion.query_path("caller")
+        character.event_handler._handle_event(EventHandler.Event.PATH_COMPLETE, caller)
+        assert character.animation.active_scene is character.animation.query_scene("scene")
+
+
 def test_effectcharacter_init(effectcharacter: EffectCharacter) -> None:
     """Test the initialization of EffectCharacter."""
     assert effectcharacter.character_id == 0
@@ -376,7 +421,7 @@ def test_effectcharacter_tick_scene_and_path(effectcharacter: EffectCharacter) -
     s.add_frame("a", duration=2)
     effectcharacter.animation.activate_scene(s)
     effectcharacter.tick()
-    assert effectcharacter.animation.active_scene.frames[0].ticks_elapsed == 1  # type: ignore[union-attr]
+    assert effectcharacter.animation.active_scene.ticks_elapsed == 1  # type: ignore[union-attr]
     assert effectcharacter.motion.active_path.current_step == 1  # type: ignore[union-attr]
 
 
@@ -272,6 +272,38 @@ def test_path_step_hopped_segments_trigger_enter_and_exit(character: EffectChara
     assert triggered_events == ["enter_1", "exit_1", "enter_2", "exit_2", "enter_3"]
 
 
+def test_path_step_long_path_triggers_events_in_order(character: EffectCharacter) -> None:
+    """Test that every segment of a long path is entered and exited once, in order, when steps skip segments."""
+    p = Path("p", speed=7)
+    for index in range(21):
+        p.new_waypoint(Coord(index * 3, 0))
+    triggered_events: list[str] = []
+    for waypoint in p.waypoints[1:]:
+        for event, label in (
+            (EventHandler.Event.SEGMENT_ENTERED, "enter"),
+            (EventHandler.Event.SEGMENT_EXITED, "exit"),
+        ):
+            character.event_handler.register_event(
+                event,
+                waypoint,
+                EventHandler.Action.CALLBACK,
+                EventHandler.Callback(
+                    lambda _character, label, waypoint_id: triggered_events.append(f"{label}_{waypoint_id}"),
+                    label,
+                    waypoint.waypoint_id,
+                ),
+            )
+    coords = [p.step(character.event_handler) for _ in range(p.max_steps)]
+
+    expected_events = []
+    for waypoint in p.waypoints[1:-1]:
+        expected_events.extend((f"enter_{waypoint.waypoint_id}", f"exit_{waypoint.waypoint_id}"))
+    expected_events.append(f"enter_{p.waypoints[-1].waypoint_id}")
+    assert triggered_events == expected_events
+    assert coords == sorted(coords, key=lambda coord: coord.column)
+    assert coords[-1] == Coord(60, 0)
+
+
 def test_path_step_boundary_segment_does_not_trigger_exit(character: EffectCharacter) -> None:
     """Test that landing exactly on a segment boundary enters but does not exit that segment."""
     p = Path("p", speed=10)
@@ -304,6 +336,63 @@ def test_path_step_boundary_segment_does_not_trigger_exit(character: EffectChara
     assert triggered_events == ["enter_1"]
 
 
+def test_path_trajectory_shared_between_identical_paths() -> None:
+    """Test that characters activating identical paths from the same coordinate share a trajectory."""
+    characters = [EffectCharacter(index, "a", 1, 1) for index in range(2)]
+    paths = []
+    for character in characters:
+        path = character.motion.new_path(speed=0.5, ease=easing.in_out_sine)
+        path.new_waypoint(Coord(10, 5))
+        path.new_waypoint(Coord(20, 5), bezier_control=Coord(15, 10))
+        character.motion.activate_path(path)
+        paths.append(path)
+    coords = [[], []]
+    while any(character.motion.active_path for character in characters):
+        for character, character_coords in zip(characters, coords):
+            character.motion.move()
+            character_coords.append(character.motion.current_coord)
+    assert coords[0] == coords[1]
+    assert paths[0].trajectory is paths[1].trajectory
+
+
+def test_path_trajectory_recompiled_when_geometry_changes(character: EffectCharacter) -> None:
+    """Test that adding waypoints or changing the easing function replaces the compiled trajectory."""
+    p = Path("p", speed=2)
+    p.new_waypoint(Coord(0, 0))
+    p.new_waypoint(Coord(10, 0))
+    p.step(character.event_handler)
+    first_trajectory = p.trajectory
+    assert first_trajectory is not None
+    p.new_waypoint(Coord(20, 0))
+    assert p.trajectory is None
+    p.step(character.event_handler)
+    assert p.trajectory is not first_trajectory
+    p.ease = easing.in_sine
+    p.step(character.event_handler)
+    assert p.trajectory is not None
+    assert p.trajectory.ease is easing.in_sine
+
+
+def test_path_step_events_fire_again_after_reactivation(character: EffectCharacter) -> None:
+    """Test that reactivating a path resets segment events."""
+    p = character.motion.new_path(speed=5)
+    p.new_waypoint(Coord(10, 0))
+    p.new_waypoint(Coord(20, 0))
+    triggered_events: list[str] = []
+    character.event_handler.register_event(
+        EventHandler.Event.SEGMENT_EXITED,
+        p.waypoints[0],
+        EventHandler.Action.CALLBACK,
+        EventHandler.Callback(lambda _character: triggered_events.append("exit_0")),
+    )
+    for _ in range(2):
+        character.motion.set_coordinate(Coord(0, 0))
+        character.motion.activate_path(p)
+        while character.motion.active_path:
+            character.motion.move()
+    assert triggered_events == ["exit_0", "exit_0"]
+
+
 def test_path_step_multiple_segments_eased(character: EffectCharacter) -> None:
     """Test stepping through a path with multiple segments and easing."""
     p = Path("p", ease=easing.in_out_elastic)
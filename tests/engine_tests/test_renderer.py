@@ -0,0 +1,363 @@
+"""Tests for incremental terminal output."""
+
+from __future__ import annotations
+
+import io
+import re
+
+import pytest
+
+from terminaltexteffects.effects import effect_slide, effect_wipe
+from terminaltexteffects.engine.animation import CharacterVisual
+from terminaltexteffects.engine.renderer import (
+    DEFAULT_SGR_STATE,
+    Cell,
+    FrameBuffer,
+    FrameWriter,
+    IncrementalRenderer,
+    OutputStats,
+    _apply_sgr_parameters,
+    _sgr_transition,
+    byte_length,
+    cell_width,
+    encode_cells,
+    encode_visual_row,
+    parse_row_cells,
+)
+from terminaltexteffects.engine.terminal import Terminal, TerminalConfig
+from terminaltexteffects.utils.geometry import Coord
+from terminaltexteffects.utils.graphics import Color, ColorPair
+
+pytestmark = [pytest.mark.engine, pytest.mark.terminal, pytest.mark.smoke]
+
+_OUTPUT_TOKEN_PATTERN = re.compile(r"\x1b([78])|\x1b\[([0-9;]*)([ABGm])|(\n)|(.)", re.DOTALL)
+
+
+class _ScreenEmulator:
+    """Minimal terminal emulator supporting the sequences written by `Terminal.print()`."""
+
+    def __init__(self, rows: int, columns: int) -> None:
+        self.cells: list[list[Cell]] = [[(DEFAULT_SGR_STATE, " ")] * columns for _ in range(rows + 1)]
+        self.columns = columns
+        self.row = rows
+        self.column = 0
+        self.saved = (rows, 0)
+        self.state = DEFAULT_SGR_STATE
+
+    def feed(self, output: str) -> None:
+        for dec, parameters, command, newline, symbol in _OUTPUT_TOKEN_PATTERN.findall(output):
+            if dec == "7":
+                self.saved = (self.row, self.column)
+            elif dec == "8":
+                self.row, self.column = self.saved
+            elif command == "A":
+                self.row -= int(parameters)
+            elif command == "B":
+                self.row += int(parameters)
+            elif command == "G":
+                self.column = int(parameters) - 1
+            elif command == "m":
+                self.state = _apply_sgr_parameters(self.state, parameters)
+            elif newline:
+                self.row += 1
+                self.column = 0
+            elif symbol:
+                self.cells[self.row][self.column] = (self.state, symbol)
+                self.column += 1
+
+    def screen(self) -> list[list[Cell]]:
+        return self.cells[:-1]
+
+
+def _make_config(*, incremental_output: bool) -> TerminalConfig:
+    config = TerminalConfig._build_config()
+    config.frame_rate = 0
+    config.incremental_output = incremental_output
+    return config
+
+
+def test_frame_buffer_only_rebuilds_dirty_rows() -> None:
+    terminal = Terminal(input_data="abc\ndef", config=_make_config(incremental_output=False))
+    for character in terminal.get_characters():
+        terminal.set_character_visibility(character, is_visible=True)
+    assert terminal.get_formatted_output_string() == "abc\ndef"
+    assert terminal._frame_buffer.refresh() is False
+
+    character = terminal.get_character_by_input_coord(Coord(1, 1))
+    assert character is not None
+    character.animation.set_appearance("X")
+    assert terminal._frame_buffer._dirty_rows == {0}
+    assert terminal.get_formatted_output_string() == "abc\nXef"
+
+
+def test_frame_buffer_tracks_motion_layer_and_visibility() -> None:
+    terminal = Terminal(input_data="ab", config=_make_config(incremental_output=False))
+    first = terminal.get_character_by_input_coord(Coord(1, 1))
+    second = terminal.get_character_by_input_coord(Coord(2, 1))
+    assert first is not None
+    assert second is not None
+    terminal.set_character_visibility(first, is_visible=True)
+    terminal.set_character_visibility(second, is_visible=True)
+
+    first.motion.set_coordinate(Coord(2, 1))
+    assert terminal.get_formatted_output_string() == " b"
+    first.layer = 1
+    assert terminal.get_formatted_output_string() == " a"
+    first.motion.set_coordinate(Coord(5, 5))
+    assert terminal.get_formatted_output_string() == " b"
+    first.motion.set_coordinate(Coord(1, 1))
+    terminal.set_character_visibility(second, is_visible=False)
+    assert terminal.get_formatted_output_string() == "a "
+    second.motion.set_coordinate(Coord(1, 1))
+    assert terminal.get_formatted_output_string() == "a "
+    assert second._frame_buffer is None
+
+
+def test_frame_buffer_same_layer_ties_render_highest_character_id() -> None:
+    terminal = Terminal(input_data="ab", config=_make_config(incremental_output=False))
+    first = terminal.get_character_by_input_coord(Coord(1, 1))
+    second = terminal.get_character_by_input_coord(Coord(2, 1))
+    assert first is not None
+    assert second is not None
+    terminal.set_character_visibility(second, is_visible=True)
+    terminal.set_character_visibility(first, is_visible=True)
+    second.motion.set_coordinate(Coord(1, 1))
+    assert terminal.get_formatted_output_string() == "b "
+
+
+def test_frame_buffer_rows_standalone() -> None:
+    frame_buffer = FrameBuffer(2, 3, 0, 0)
+    assert frame_buffer.rows == ["   ", "   "]
+    assert frame_buffer.output == "   \n   "
+
+
+def test_parse_row_cells_tracks_sgr_state() -> None:
+    cells = parse_row_cells("a\x1b[1m\x1b[38;5;196mb\x1b[0mc\x1b[48;2;1;2;3md")
+    assert cells == [
+        (DEFAULT_SGR_STATE, "a"),
+        ((("1",), "38;5;196", None), "b"),
+        (DEFAULT_SGR_STATE, "c"),
+        (((), None, "48;2;1;2;3"), "d"),
+    ]
+
+
+def test_parse_row_cells_self_contained_and_shared_formatting_are_equal() -> None:
+    self_contained = "\x1b[38;5;1ma\x1b[0m\x1b[38;5;1mb\x1b[0m"
+    shared = "\x1b[38;5;1mab\x1b[0m"
+    assert parse_row_cells(self_contained) == parse_row_cells(shared)
+
+
+def test_apply_sgr_parameters_mode_and_color_resets() -> None:
+    state = _apply_sgr_parameters(DEFAULT_SGR_STATE, "1;4;38;5;3;48;5;4")
+    assert state == (("1", "4"), "38;5;3", "48;5;4")
+    assert _apply_sgr_parameters(state, "22;39") == (("4",), None, "48;5;4")
+    assert _apply_sgr_parameters(state, "") == DEFAULT_SGR_STATE
+
+
+def test_encode_cells_round_trip() -> None:
+    row = "a\x1b[1m\x1b[38;5;196mb\x1b[0m\x1b[1m\x1b[38;5;196mc\x1b[0m\x1b[38;5;2md\x1b[0me"
+    encoded = encode_cells(parse_row_cells(row))
+    assert encoded == "a\x1b[1;38;5;196mbc\x1b[0;38;5;2md\x1b[0me"
+    assert parse_row_cells(encoded) == parse_row_cells(row)
+
+
+@pytest.mark.parametrize(
+    ("current_state", "state", "expected"),
+    [
+        (DEFAULT_SGR_STATE, (("1",), "38;5;1", None), "\x1b[1;38;5;1m"),
+        (((), "38;5;1", None), ((), "38;5;2", None), "\x1b[38;5;2m"),
+        (((), "38;5;1", "48;5;3"), ((), None, "48;5;3"), "\x1b[39m"),
+        (((), "38;5;1", "48;5;3"), ((), "38;5;1", None), "\x1b[49m"),
+        ((("1",), "38;5;1", None), (("1", "4"), "38;5;1", None), "\x1b[4m"),
+        ((("1", "4"), "38;5;1", None), (("4",), "38;5;1", None), "\x1b[0;4;38;5;1m"),
+        ((("1",), "38;5;1", None), DEFAULT_SGR_STATE, "\x1b[0m"),
+    ],
+)
+def test_sgr_transition(current_state, state, expected) -> None:
+    assert _sgr_transition(current_state, state) == expected
+    assert _apply_sgr_parameters(current_state, expected[2:-1]) == state
+
+
+def test_encode_visual_row_shares_sgr_between_cells() -> None:
+    red = CharacterVisual("a", colors=ColorPair(fg=Color("ff0000")), _fg_color_code="ff0000")
+    red_bold = CharacterVisual("b", bold=True, colors=ColorPair(fg=Color("ff0000")), _fg_color_code="ff0000")
+    plain = CharacterVisual("c")
+    row = encode_visual_row([red, red, None, red, red_bold, plain])
+    assert row == "\x1b[38;2;255;0;0maa\x1b[0m \x1b[38;2;255;0;0ma\x1b[1mb\x1b[0mc"
+    legacy_row = "".join(
+        visual.formatted_symbol if visual is not None else " " for visual in [red, red, None, red, red_bold, plain]
+    )
+    assert parse_row_cells(row) == parse_row_cells(legacy_row)
+
+
+def test_encode_visual_row_blank_after_plain_visual_does_not_reset() -> None:
+    red = CharacterVisual("a", colors=ColorPair(fg=Color("ff0000")), _fg_color_code="ff0000")
+    plain = CharacterVisual("c")
+    assert encode_visual_row([red, plain, None, plain]) == "\x1b[38;2;255;0;0ma\x1b[0mc c"
+
+
+def test_encode_visual_row_resets_once_at_end_of_row() -> None:
+    visual = CharacterVisual("x", colors=ColorPair(fg=Color(3)), _fg_color_code=3)
+    row = encode_visual_row([visual] * 80)
+    assert row == "\x1b[38;5;3m" + "x" * 80 + "\x1b[0m"
+
+
+def test_incremental_renderer_first_frame_is_full() -> None:
+    renderer = IncrementalRenderer(canvas_rows=2)
+    assert renderer.render("ab\ncd") == "\x1b8\x1b7\x1b[2Aab\ncd"
+
+
+def test_incremental_renderer_unchanged_frame_writes_nothing() -> None:
+    renderer = IncrementalRenderer(canvas_rows=2)
+    renderer.render("ab\ncd")
+    assert renderer.render("ab\ncd") == ""
+
+
+def test_incremental_renderer_writes_only_changed_cells() -> None:
+    renderer = IncrementalRenderer(canvas_rows=3)
+    renderer.render("abcdefghij\nabcdefghij\nabcdefghij")
+    output = renderer.render("abcdefghij\nabcdXfghij\nabcdefghij")
+    assert output == "\x1b8\x1b[2A\x1b[5GX\x1b[1B\x1b[11G"
+
+
+def test_incremental_renderer_merges_nearby_changes() -> None:
+    renderer = IncrementalRenderer(canvas_rows=1, merge_gap=2)
+    renderer.render("abcdefghij")
+    assert renderer.render("XbcXefghiX") == "\x1b8\x1b[1AXbcX\x1b[10GX"
+
+
+def test_incremental_renderer_positions_runs_by_display_width() -> None:
+    renderer = IncrementalRenderer(canvas_rows=1)
+    renderer.render("漢字ab")
+    assert renderer.render("漢字ax") == "\x1b8\x1b[1A\x1b[6Gx"
+
+
+def test_incremental_renderer_width_change_rewrites_row() -> None:
+    renderer = IncrementalRenderer(canvas_rows=2)
+    renderer.render("abc\nxyz")
+    assert renderer.render("漢bc\nxyz") == "\x1b8\x1b[2A漢bc\x1b[1B\x1b[4G"
+
+
+def test_incremental_renderer_combining_mark_rewrites_base_cell() -> None:
+    renderer = IncrementalRenderer(canvas_rows=1)
+    renderer.render("ae\u0301b")
+    assert renderer.render("ae\u0300b") == "\x1b8\x1b[1A\x1b[2Ge\u0300\x1b[4G"
+
+
+@pytest.mark.parametrize(("symbol", "width"), [("a", 1), ("é", 1), ("漢", 2), ("\u0301", 0)])
+def test_cell_width(symbol: str, width: int) -> None:
+    assert cell_width(symbol) == width
+
+
+def test_byte_length() -> None:
+    assert byte_length("abc") == 3
+    assert byte_length("漢a") == len("漢a".encode())
+
+
+def test_incremental_renderer_dimension_change_writes_full_frame() -> None:
+    renderer = IncrementalRenderer(canvas_rows=1)
+    renderer.render("ab")
+    assert renderer.render("abc") == "\x1b8\x1b7\x1b[1Aabc"
+
+
+def test_output_stats_record() -> None:
+    stats = OutputStats()
+    stats.record(10, 40)
+    stats.record(30, 40)
+    assert stats.frames == 2
+    assert stats.last_frame_bytes == 30
+    assert stats.last_full_frame_bytes == 40
+    assert stats.total_bytes == 40
+    assert stats.total_full_frame_bytes == 80
+    assert stats.savings_ratio == pytest.approx(0.5)
+
+
+class _ChunkedBinaryStream(io.RawIOBase):
+    """Binary stream that accepts at most `chunk_size` bytes per write and blocks once."""
+
+    def __init__(self, chunk_size: int) -> None:
+        self.chunk_size = chunk_size
+        self.data = bytearray()
+        self.write_calls = 0
+        self._blocked = False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:  # noqa: ANN001
+        self.write_calls += 1
+        if not self._blocked:
+            self._blocked = True
+            raise BlockingIOError(0, "blocked", 0)
+        chunk = bytes(data[: self.chunk_size])
+        self.data += chunk
+        return len(chunk)
+
+
+class _TextStream(io.StringIO):
+    def __init__(self, binary: _ChunkedBinaryStream) -> None:
+        super().__init__()
+        self.buffer = binary
+
+
+def test_frame_writer_continues_partial_writes(monkeypatch: pytest.MonkeyPatch) -> None:
+    binary = _ChunkedBinaryStream(chunk_size=3)
+    monkeypatch.setattr("sys.stdout", _TextStream(binary))
+    writer = FrameWriter(use_binary=True)
+    writer.write("\x1b8", "漢字", "ab\n")
+    assert binary.data.decode() == "\x1b8漢字ab\n"
+    assert binary.write_calls > 1
+    writer.write("xyz")
+    assert binary.data.decode() == "\x1b8漢字ab\nxyz"
+
+
+def test_frame_writer_text_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    stream = io.StringIO()
+    monkeypatch.setattr("sys.stdout", stream)
+    FrameWriter(use_binary=True).write("\x1b8", "abc")
+    assert stream.getvalue() == "\x1b8abc"
+
+
+def test_frame_writer_text_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    binary = _ChunkedBinaryStream(chunk_size=3)
+    stream = _TextStream(binary)
+    monkeypatch.setattr("sys.stdout", stream)
+    FrameWriter(use_binary=False).write("a", "b")
+    assert stream.getvalue() == "ab"
+    assert not binary.data
+
+
+def test_terminal_print_records_output_stats(capsys) -> None:
+    terminal = Terminal(input_data="abcd\nefgh\nijkl", config=_make_config(incremental_output=False))
+    terminal.print("abcd\nefgh\nijkl")
+    captured = capsys.readouterr()
+    assert terminal.output_stats.last_frame_bytes == len(captured.out.encode())
+    assert terminal.output_stats.last_full_frame_bytes == terminal.output_stats.last_frame_bytes
+
+
+def test_terminal_print_incremental_output(capsys) -> None:
+    terminal = Terminal(input_data="abcd\nefgh\nijkl", config=_make_config(incremental_output=True))
+    terminal.print("abcd\nefgh\nijkl")
+    assert capsys.readouterr().out == "\x1b8\x1b7\x1b[3Aabcd\nefgh\nijkl"
+    terminal.print("abcd\nefXh\nijkl")
+    assert capsys.readouterr().out == "\x1b8\x1b[2A\x1b[3GX\x1b[1B\x1b[5G"
+    assert terminal.output_stats.last_frame_bytes < terminal.output_stats.last_full_frame_bytes
+
+
+@pytest.mark.parametrize("effect_class", [effect_wipe.Wipe, effect_slide.Slide])
+@pytest.mark.parametrize("input_data", ["medium", "color_sequences"], indirect=True)
+def test_incremental_output_matches_full_frame_screen(effect_class: type, input_data: str) -> None:
+    """Replaying incremental output on an emulated screen must produce the same screen as full-frame output."""
+    effect = effect_class(input_data)
+    effect.terminal_config = _make_config(incremental_output=True)
+    iterator = iter(effect)
+    rows = iterator.terminal.visible_top
+    columns = iterator.terminal.visible_right
+    renderer = IncrementalRenderer(rows)
+    incremental_screen = _ScreenEmulator(rows, columns)
+    for frame in iterator:
+        full_screen = _ScreenEmulator(rows, columns)
+        full_screen.feed(renderer.full_frame(frame))
+        incremental_screen.feed(renderer.render(frame))
+        assert incremental_screen.screen() == full_screen.screen()
+        assert (incremental_screen.row, incremental_screen.column) == (full_screen.row, full_screen.column)
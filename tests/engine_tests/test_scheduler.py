@@ -0,0 +1,298 @@
+"""Tests for character tick scheduling, wall-clock frame scheduling and background output."""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from terminaltexteffects.effects import effect_wipe
+from terminaltexteffects.engine import scheduler
+from terminaltexteffects.engine.base_character import EffectCharacter, EventHandler
+from terminaltexteffects.engine.scheduler import BackgroundPrinter, CharacterScheduler, FrameScheduler
+from terminaltexteffects.utils.geometry import Coord
+
+pytestmark = [pytest.mark.engine, pytest.mark.smoke]
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class _FakeEffectIterator:
+    """Effect iterator producing numbered frames, where each formatted frame costs `frame_cost` seconds."""
+
+    def __init__(self, clock: _FakeClock, frames: int, frame_cost: float) -> None:
+        self.clock = clock
+        self.frame_cost = frame_cost
+        self.ticks = 0
+        self.frames = frames
+        self.terminal = SimpleNamespace(
+            config=SimpleNamespace(frame_rate=4),
+            _frame_rate=4,
+            get_formatted_output_string=lambda: f"frame{self.ticks}",
+        )
+
+    def __next__(self) -> str:
+        if self.ticks == self.frames:
+            raise StopIteration
+        self.ticks += 1
+        self.clock.now += self.frame_cost
+        return f"frame{self.ticks}"
+
+    def advance(self) -> bool:
+        if self.ticks == self.frames:
+            return False
+        self.ticks += 1
+        return True
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    fake_clock = _FakeClock()
+    monkeypatch.setattr(scheduler, "time", fake_clock)
+    return fake_clock
+
+
+def test_frame_scheduler_waits_for_deadline(clock: _FakeClock) -> None:
+    effect_iterator = _FakeEffectIterator(clock, frames=3, frame_cost=0.125)
+    frame_scheduler = FrameScheduler(effect_iterator)  # pyright: ignore[reportArgumentType]
+    assert list(frame_scheduler) == ["frame1", "frame2", "frame3"]
+    assert frame_scheduler.dropped_frames == 0
+    assert clock.sleeps == [pytest.approx(0.125)]
+    assert clock.now == pytest.approx(0.5)
+    assert effect_iterator.terminal._frame_rate == 0
+
+
+def test_frame_scheduler_drops_frames_when_behind(clock: _FakeClock) -> None:
+    effect_iterator = _FakeEffectIterator(clock, frames=10, frame_cost=0.5)
+    frame_scheduler = FrameScheduler(effect_iterator)  # pyright: ignore[reportArgumentType]
+    frames = list(frame_scheduler)
+    assert frames == ["frame1", "frame3", "frame5", "frame7", "frame9", "frame10"]
+    assert frame_scheduler.dropped_frames == 4
+    assert not clock.sleeps
+
+
+def test_frame_scheduler_limits_dropped_frames(clock: _FakeClock) -> None:
+    effect_iterator = _FakeEffectIterator(clock, frames=20, frame_cost=0.0)
+    frame_scheduler = FrameScheduler(effect_iterator, max_dropped_frames=2)  # pyright: ignore[reportArgumentType]
+    assert next(frame_scheduler) == "frame1"
+    clock.now += 10
+    assert next(frame_scheduler) == "frame4"
+    assert frame_scheduler.dropped_frames == 2
+
+
+def test_frame_scheduler_without_frame_rate(clock: _FakeClock) -> None:
+    effect_iterator = _FakeEffectIterator(clock, frames=3, frame_cost=1.0)
+    frame_scheduler = FrameScheduler(effect_iterator, frame_rate=0)  # pyright: ignore[reportArgumentType]
+    assert list(frame_scheduler) == ["frame1", "frame2", "frame3"]
+    assert frame_scheduler.dropped_frames == 0
+
+
+def test_advance_does_not_format_frames(monkeypatch: pytest.MonkeyPatch) -> None:
+    iterator = iter(effect_wipe.Wipe("abc\ndef"))
+    formatted = []
+    get_output = iterator.terminal.get_formatted_output_string
+
+    def tracking_get_output() -> str:
+        formatted.append(True)
+        return get_output()
+
+    monkeypatch.setattr(iterator.terminal, "get_formatted_output_string", tracking_get_output)
+    while iterator.advance():
+        pass
+    assert not formatted
+    assert iterator.frame
+    assert formatted
+
+
+class _FakeTerminal:
+    """Terminal recording printed frames, which can block the writer until released."""
+
+    def __init__(self, *, blocked: bool = False) -> None:
+        self.printed: list[str] = []
+        self.release = threading.Event()
+        self.started = threading.Event()
+        if not blocked:
+            self.release.set()
+
+    def print(self, frame: str) -> None:
+        self.started.set()
+        self.release.wait(timeout=5)
+        if frame == "fail":
+            msg = "write failed"
+            raise OSError(msg)
+        self.printed.append(frame)
+
+
+def test_background_printer_prints_all_frames() -> None:
+    terminal = _FakeTerminal()
+    with BackgroundPrinter(terminal) as printer:  # pyright: ignore[reportArgumentType]
+        for index in range(20):
+            printer.print(f"frame{index}")
+    assert terminal.printed[-1] == "frame19"
+    assert len(terminal.printed) + printer.coalesced_frames == 20
+
+
+def test_background_printer_coalesces_to_newest_frames() -> None:
+    terminal = _FakeTerminal(blocked=True)
+    with BackgroundPrinter(terminal, max_pending_frames=2) as printer:  # pyright: ignore[reportArgumentType]
+        printer.print("frame1")
+        assert terminal.started.wait(timeout=5)
+        for index in range(2, 7):
+            printer.print(f"frame{index}")
+        terminal.release.set()
+    assert terminal.printed == ["frame1", "frame5", "frame6"]
+    assert printer.coalesced_frames == 3
+
+
+def test_background_printer_discards_pending_frames_on_error() -> None:
+    terminal = _FakeTerminal(blocked=True)
+    printer = BackgroundPrinter(terminal)  # pyright: ignore[reportArgumentType]
+    with pytest.raises(KeyboardInterrupt), printer:
+        printer.print("frame1")
+        assert terminal.started.wait(timeout=5)
+        printer.print("frame2")
+        # release the writer only once the pending frame has been discarded by the exiting context
+        threading.Timer(0.05, terminal.release.set).start()
+        raise KeyboardInterrupt
+    assert terminal.printed == ["frame1"]
+
+
+def test_background_printer_reraises_writer_errors() -> None:
+    terminal = _FakeTerminal()
+    printer = BackgroundPrinter(terminal)  # pyright: ignore[reportArgumentType]
+    printer.start()
+    printer.print("fail")
+    with pytest.raises(OSError, match="write failed"):
+        printer.close()
+
+
+def _make_waiting_character(character_id: int, events: list[str]) -> EffectCharacter:
+    """Create a character that holds at the end of a path while showing frames with long durations."""
+    character = EffectCharacter(character_id, "a", 1, 1)
+    scene = character.animation.new_scene(scene_id="wait")
+    for symbol, duration in (("a", 1), ("b", 6), ("c", 3), ("d", 9)):
+        scene.add_frame(symbol, duration)
+    other_scene = character.animation.new_scene(scene_id="other")
+    other_scene.add_frame("x", 4)
+    path = character.motion.new_path(path_id="hold", speed=1, hold_time=12)
+    path.new_waypoint(Coord(3, 1))
+    for event, caller in (
+        (EventHandler.Event.SCENE_COMPLETE, scene),
+        (EventHandler.Event.PATH_HOLDING, path),
+        (EventHandler.Event.PATH_COMPLETE, path),
+    ):
+        character.event_handler.register_event(
+            event,
+            caller,
+            EventHandler.Action.CALLBACK,
+            EventHandler.Callback(lambda _, name: events.append(name), event.name),
+        )
+    character.motion.activate_path(path)
+    character.animation.activate_scene(scene)
+    return character
+
+
+def _observe(character: EffectCharacter) -> tuple[object, ...]:
+    return (
+        character.animation.current_character_visual.symbol,
+        character.motion.current_coord,
+        character.animation.active_scene,
+        character.motion.active_path,
+    )
+
+
+def test_character_scheduler_parks_idle_characters_without_changing_behavior() -> None:
+    scheduled_events: list[str] = []
+    ticked_events: list[str] = []
+    scheduled = _make_waiting_character(0, scheduled_events)
+    ticked = _make_waiting_character(0, ticked_events)
+    character_scheduler = CharacterScheduler()
+    active_characters = {scheduled}
+    parked_updates = 0
+    while ticked.is_active:
+        ticked.tick()
+        character_scheduler.update(active_characters)
+        parked_updates += scheduled._scheduler is character_scheduler
+        assert _observe(scheduled) == _observe(ticked)
+        assert scheduled_events == ticked_events
+    assert not active_characters
+    assert ticked_events == ["PATH_HOLDING", "PATH_COMPLETE", "SCENE_COMPLETE"]
+    assert parked_updates > 0
+
+
+def test_character_scheduler_applies_skipped_ticks_before_changes() -> None:
+    scheduled = _make_waiting_character(0, [])
+    ticked = _make_waiting_character(0, [])
+    character_scheduler = CharacterScheduler()
+    active_characters = {scheduled}
+    for _ in range(6):
+        ticked.tick()
+        character_scheduler.update(active_characters)
+    assert scheduled._scheduler is character_scheduler
+    for character in (scheduled, ticked):
+        character.animation.activate_scene("other")
+    assert scheduled._scheduler is None
+    assert ticked.motion.active_path is not None
+    assert scheduled.motion.active_path is not None
+    assert scheduled.motion.active_path.hold_time_remaining == ticked.motion.active_path.hold_time_remaining
+    while ticked.is_active:
+        ticked.tick()
+        character_scheduler.update(active_characters)
+        assert _observe(scheduled) == _observe(ticked)
+
+
+def test_character_scheduler_stops_counting_ticks_for_removed_characters() -> None:
+    scheduled = _make_waiting_character(0, [])
+    ticked = _make_waiting_character(0, [])
+    character_scheduler = CharacterScheduler()
+    active_characters = {scheduled}
+    for _ in range(6):
+        ticked.tick()
+        character_scheduler.update(active_characters)
+    assert scheduled._scheduler is character_scheduler
+    active_characters.clear()
+    for _ in range(3):
+        character_scheduler.update(active_characters)
+    assert scheduled._scheduler is None
+    assert scheduled.motion.active_path is not None
+    assert ticked.motion.active_path is not None
+    assert scheduled.motion.active_path.hold_time_remaining == ticked.motion.active_path.hold_time_remaining
+    assert scheduled.animation.active_scene is not None
+    assert ticked.animation.active_scene is not None
+    assert scheduled.animation.active_scene.frames[0] == ticked.animation.active_scene.frames[0]
+    assert scheduled.animation.active_scene.ticks_elapsed == ticked.animation.active_scene.ticks_elapsed
+
+
+def test_character_scheduler_ticks_in_active_set_order() -> None:
+    order: list[int] = []
+    characters = [EffectCharacter(character_id, "a", 1, 1) for character_id in (5, 1, 3)]
+    for character in characters:
+        scene = character.animation.new_scene()
+        scene.add_frame("a", 1)
+        scene.add_frame("b", 1)
+        character.event_handler.register_event(
+            EventHandler.Event.SCENE_COMPLETE,
+            scene,
+            EventHandler.Action.CALLBACK,
+            EventHandler.Callback(lambda completed: order.append(completed.character_id)),
+        )
+        character.animation.activate_scene(scene)
+    active_characters = set(characters)
+    expected_order = [character.character_id for character in active_characters]
+    character_scheduler = CharacterScheduler()
+    character_scheduler.update(active_characters)
+    character_scheduler.update(active_characters)
+    assert order == expected_order
+    assert not active_characters
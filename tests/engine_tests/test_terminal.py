@@ -301,6 +301,55 @@ def test_terminal_make_outer_fill_characters() -> None:
     assert len(terminal._outer_fill_characters) == 2
 
 
+def test_terminal_fill_characters_are_created_on_demand() -> None:
+    config = TerminalConfig._build_config()
+    config.canvas_width = 6
+    config.canvas_height = 2
+    terminal = Terminal(input_data="abcd\nef gh", config=config)
+    assert not terminal._character_by_input_coord.keys() - {char.input_coord for char in terminal._input_characters}
+    fill_char = terminal.get_character_by_input_coord(Coord(6, 1))
+    assert fill_char is not None
+    assert fill_char.is_fill_character
+    assert terminal.get_character_by_input_coord(Coord(6, 1)) is fill_char
+    assert terminal.get_character_by_input_coord(Coord(7, 1)) is None
+    added_char = terminal.add_character("x", Coord(0, 0))
+    all_fill_chars = terminal.get_characters(input_chars=False, inner_fill_chars=True, outer_fill_chars=True)
+    assert fill_char in all_fill_chars
+    assert len(all_fill_chars) == 4
+    assert len(terminal.character_by_input_coord) == 12
+    assert added_char.character_id > max(char.character_id for char in all_fill_chars)
+
+
+def test_terminal_fill_character_ids_do_not_depend_on_creation_order() -> None:
+    config = TerminalConfig._build_config()
+    config.canvas_width = 6
+    config.canvas_height = 3
+    terminal = Terminal(input_data="ab\n c", config=config)
+    lazy_ids = {
+        coord: terminal.get_character_by_input_coord(coord).character_id  # type: ignore[union-attr]
+        for coord in (Coord(5, 3), Coord(1, 1), Coord(6, 2))
+    }
+    terminal = Terminal(input_data="ab\n c", config=config)
+    eager_ids = {coord: char.character_id for coord, char in terminal.character_by_input_coord.items()}
+    assert all(eager_ids[coord] == character_id for coord, character_id in lazy_ids.items())
+    assert len(set(eager_ids.values())) == 18
+
+
+def test_terminal_character_neighbors() -> None:
+    config = TerminalConfig._build_config()
+    config.canvas_width = 3
+    config.canvas_height = 1
+    terminal = Terminal(input_data="a", config=config)
+    char = terminal.get_character_by_input_coord(Coord(1, 1))
+    assert char is not None
+    assert char.neighbors["north"] is None
+    assert char.neighbors["west"] is None
+    east = char.neighbors["east"]
+    assert east is terminal.get_character_by_input_coord(Coord(2, 1))
+    assert east is not None
+    assert east.neighbors["west"] is char
+
+
 def test_terminal_add_character() -> None:
     config = TerminalConfig._build_config()
     terminal = Terminal(input_data="test", config=config)
@@ -47,6 +47,10 @@ def test_MOVE_CURSOR_UP():
     assert ansitools.move_cursor_up(5) == "\033[5A"
 
 
+def test_MOVE_CURSOR_DOWN():
+    assert ansitools.move_cursor_down(5) == "\033[5B"
+
+
 def test_MOVE_CURSOR_TO_COLUMN():
     assert ansitools.move_cursor_to_column(5) == "\033[5G"
 
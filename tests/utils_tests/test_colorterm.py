@@ -89,3 +89,43 @@ def test_bg_invalid_type() -> None:
         match=r"Color must be either hex string #000000 -> #FFFFFF or int xterm color code 0 <= n <= 255",
     ):
         colorterm.bg(3.14)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("color_code", "expected_parameters"),
+    [
+        pytest.param("#ff0080", "2;255;0;128", id="hex"),
+        pytest.param(196, "5;196", id="xterm"),
+    ],
+)
+def test_color_parameters_match_sequences(color_code: str | int, expected_parameters: str) -> None:
+    """Returns the SGR parameters used by the matching foreground and background sequences."""
+    assert colorterm.fg_parameters(color_code) == f"38;{expected_parameters}"
+    assert colorterm.bg_parameters(color_code) == f"48;{expected_parameters}"
+    assert colorterm.fg(color_code) == f"\x1b[{colorterm.fg_parameters(color_code)}m"
+    assert colorterm.bg(color_code) == f"\x1b[{colorterm.bg_parameters(color_code)}m"
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected_sequence"),
+    [
+        pytest.param({}, "", id="empty"),
+        pytest.param({"modes": (1, 4)}, "\x1b[1;4m", id="modes"),
+        pytest.param({"fg_color_code": 196}, "\x1b[38;5;196m", id="fg"),
+        pytest.param({"bg_color_code": "#00ff00"}, "\x1b[48;2;0;255;0m", id="bg"),
+        pytest.param(
+            {"fg_color_code": "ff0000", "bg_color_code": 16, "modes": (1,)},
+            "\x1b[1;38;2;255;0;0;48;5;16m",
+            id="combined",
+        ),
+    ],
+)
+def test_sgr(kwargs: dict, expected_sequence: str) -> None:
+    """Combines modes and colors into a single SGR sequence."""
+    assert colorterm.sgr(**kwargs) == expected_sequence
+
+
+def test_sgr_invalid_color() -> None:
+    """Rejects out of range xterm color codes."""
+    with pytest.raises(ValueError, match=r"xterm color codes must be an integer: 0 <= n <= 255"):
+        colorterm.sgr(fg_color_code=256)
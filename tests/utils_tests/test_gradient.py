@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 
 from terminaltexteffects.engine.motion import Coord
@@ -22,6 +25,18 @@ def test_color_pair_init_single_color() -> None:
     assert cp.bg_color is None
 
 
+def test_color_interned() -> None:
+    assert Color("ff0000") is Color("#ff0000")
+    assert Color(9) is Color(9)
+
+
+def test_color_copy_and_pickle_preserve_identity() -> None:
+    color = Color("#12ab34")
+    assert copy.copy(color) is color
+    assert copy.deepcopy(color) is color
+    assert pickle.loads(pickle.dumps(color)) is color
+
+
 def test_gradient_zero_stops() -> None:
     with pytest.raises(ValueError):
         Gradient()
@@ -112,6 +127,21 @@ def test_gradient_loop() -> None:
     assert g.spectrum[-1] == Color("#ffffff")
 
 
+def test_gradient_spectrum_shared_between_instances() -> None:
+    g1 = Gradient(Color("#ffffff"), Color("#000000"), steps=8)
+    g2 = Gradient(Color("#ffffff"), Color("#000000"), steps=8)
+    assert g1.spectrum == g2.spectrum
+    assert all(a is b for a, b in zip(g1.spectrum, g2.spectrum))
+    assert g1.spectrum is not g2.spectrum
+
+
+def test_gradient_loop_spectrum_cached() -> None:
+    g1 = Gradient(Color("#ffffff"), Color("#000000"), steps=4, loop=True)
+    g2 = Gradient(Color("#ffffff"), Color("#000000"), steps=4, loop=True)
+    assert g1.spectrum == g2.spectrum
+    assert g1._stops == g2._stops == (Color("#ffffff"), Color("#000000"), Color("#ffffff"))
+
+
 def test_gradient_get_color_at_fraction() -> None:
     g = Gradient(Color("#ffffff"), Color("#000000"), steps=4)
     assert g.get_color_at_fraction(0) == Color("#ffffff")
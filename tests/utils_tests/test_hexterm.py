@@ -5,6 +5,10 @@ This module tests the following functions:
     - hexterm.hex_to_xterm:
         * Validates the conversion from hexadecimal color codes to xterm color indices.
         * Ensures that invalid hexadecimal strings raise a ValueError.
+        * Checks the cube-accelerated lookup against an exhaustive palette scan.
+
+    - hexterm.hex_colors_to_xterm:
+        * Validates batch conversion preserves input order.
 
     - hexterm.xterm_to_hex:
         * Validates the conversion from xterm color indices to hexadecimal color codes.
@@ -35,6 +39,32 @@ def test_hex_to_xterm_invalid_hex_chars() -> None:
         hexterm.hex_to_xterm("zzzzzz")
 
 
+def _scan_nearest_xterm(red: int, green: int, blue: int) -> int:
+    """Return the nearest XTerm-256 color by scanning the full palette."""
+    return min(
+        hexterm.xterm_to_rgb_map,
+        key=lambda code: sum(abs(a - b) for a, b in zip((red, green, blue), hexterm.xterm_to_rgb_map[code])),
+    )
+
+
+@pytest.mark.parametrize("channel_values", [(0, 15, 16, 47, 48, 95, 96, 135, 175, 215, 254, 255)])
+def test_hex_to_xterm_matches_palette_scan(channel_values: tuple[int, ...]) -> None:
+    """Test that cube-accelerated lookups match an exhaustive palette scan, including cell boundaries."""
+    for red in channel_values:
+        for green in channel_values:
+            for blue in channel_values:
+                assert hexterm.hex_to_xterm(f"#{red:02x}{green:02x}{blue:02x}") == _scan_nearest_xterm(
+                    red,
+                    green,
+                    blue,
+                )
+
+
+def test_hex_colors_to_xterm() -> None:
+    """Test batch conversion from hex to xterm colors."""
+    assert hexterm.hex_colors_to_xterm(["#ffffff", "800000", "#000000"]) == [15, 1, 0]
+
+
 def test_xterm_to_hex() -> None:
     """Test conversion from xterm to hex colors."""
     assert hexterm.xterm_to_hex(1) == "800000"